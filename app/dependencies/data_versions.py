@@ -0,0 +1,35 @@
+from fastapi import Depends, Header, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.read_sessions import define_postgres_read_session
+from app.dependencies.user import identify_user
+from app.schemas.user import UserIdentityData
+from app.utilities.entity_tags import (
+    ENTITY_TAG_HEADER,
+    IF_NONE_MATCH_HEADER,
+    check_entity_tag_is_matched,
+    make_weak_entity_tag,
+)
+from app.utilities.exceptions.entity_tags import DataNotModified
+from core.databases.repositories import UserRepository
+
+
+# The version is read along with the data it tags, so a lagging replica tags its own state
+async def check_data_version(
+    response: Response,
+    if_none_match: str | None = Header(default=None, alias=IF_NONE_MATCH_HEADER),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> None:
+    user_repository: UserRepository = UserRepository(session=session)
+    data_version: int | None = await user_repository.get_data_version(current_user.id)
+
+    if data_version is None:
+        return
+
+    entity_tag: str = make_weak_entity_tag(current_user.id, data_version)
+
+    if if_none_match is not None and check_entity_tag_is_matched(if_none_match, entity_tag):
+        raise DataNotModified(entity_tag)
+
+    response.headers[ENTITY_TAG_HEADER] = entity_tag
@@ -0,0 +1,28 @@
+from fastapi import Depends, Header
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.sessions import (
+    define_postgres_replica_session,
+    define_postgres_session,
+)
+from app.dependencies.user import identify_user
+from app.schemas.user import UserIdentityData
+from app.utilities.security.recent_writes import (
+    RECENT_WRITE_HEADER,
+    check_recent_write,
+)
+
+
+async def define_postgres_read_session(
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_session),
+    replica_session: AsyncSession | None = Depends(define_postgres_replica_session),
+    recent_write: str | None = Header(default=None, alias=RECENT_WRITE_HEADER),
+) -> AsyncSession:
+    if replica_session is None:
+        return session
+
+    if recent_write is not None and check_recent_write(recent_write, user_id=current_user.id):
+        return session
+
+    return replica_session
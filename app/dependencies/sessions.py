@@ -1,10 +1,72 @@
 from typing import AsyncIterator
 
+from fastapi import Request
+from sqlalchemy import select, update
+from sqlalchemy.event import listens_for
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
 
-from core.databases.sessions import PostgresSession
+from app.utilities.routing import COMMITTED_WRITER_ID_KEY, join_unit_of_work
+from core.databases.models import User
+from core.databases.sessions import PostgresReplicaSession, PostgresSession
 
 
-async def define_postgres_session() -> AsyncIterator[AsyncSession]:
+_SESSION_USER_ID_KEY: str = 'user_id'
+_SESSION_WRITTEN_KEY: str = 'written'
+
+
+async def define_postgres_session(request: Request) -> AsyncIterator[AsyncSession]:
     async with PostgresSession() as postgres_session:
-        yield postgres_session
+        yield join_unit_of_work(request, postgres_session)
+
+async def define_postgres_replica_session() -> AsyncIterator[AsyncSession | None]:
+    if PostgresReplicaSession is None:
+        yield None
+        return
+
+    async with PostgresReplicaSession() as postgres_replica_session:
+        yield postgres_replica_session
+
+def attribute_session_to_user(session: AsyncSession, user_id: int) -> None:
+    session.info[_SESSION_USER_ID_KEY] = user_id
+
+
+@listens_for(Session, 'after_flush')
+def _mark_flushed_session(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[_SESSION_WRITTEN_KEY] = True
+
+@listens_for(Session, 'do_orm_execute')
+def _mark_executed_session(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_SESSION_WRITTEN_KEY] = True
+
+# Budgets are shared within a family, so the data of the whole family is versioned at once
+@listens_for(Session, 'before_commit')
+def _bump_writer_data_version(session: Session) -> None:
+    session.flush()
+
+    if not session.info.get(_SESSION_WRITTEN_KEY) or _SESSION_USER_ID_KEY not in session.info:
+        return
+
+    user_id: int = session.info[_SESSION_USER_ID_KEY]
+
+    session.execute(
+        update(User).where(
+            (User.id == user_id)
+            | (User.family_id == select(User.family_id).where(User.id == user_id).scalar_subquery()),
+        ).values(
+            data_version=User.data_version + 1,
+        ).execution_options(
+            synchronize_session=False,
+        ),
+    )
+
+# Writers are handed over to the unit of work, which marks their responses as recent writes
+@listens_for(Session, 'after_commit')
+def _remember_committed_writer(session: Session) -> None:
+    if session.info.pop(_SESSION_WRITTEN_KEY, False) and _SESSION_USER_ID_KEY in session.info:
+        session.info[COMMITTED_WRITER_ID_KEY] = session.info[_SESSION_USER_ID_KEY]
+
+@listens_for(Session, 'after_rollback')
+def _unmark_written_session(session: Session) -> None:
+    session.info.pop(_SESSION_WRITTEN_KEY, None)
@@ -1,27 +1,86 @@
+from itertools import chain
+
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.event import listens_for
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.sessions import (
+    attribute_session_to_user,
+    define_postgres_session,
+)
+from app.schemas.user import UserIdentityData
+from app.utilities.caching import TimedLruCache, register_cache_metrics
 from app.utilities.exceptions.auth import UserUnauthorised
 from app.utilities.security.jwt import decode_access_token
 from core.databases.models import User
 from core.databases.repositories import UserRepository
 
 
+USER_IDENTITY_CACHE_SIZE: int = 4096
+# Writes forget identities only in the process, which has flushed them, so that the rest
+# of the workers & instances may authorise by a former family for no longer than this
+USER_IDENTITY_CACHE_TIME_TO_LIVE: float = 5
+
+_WRITTEN_USER_IDS_KEY: str = 'written_user_ids'
+
+
+user_identity_cache: TimedLruCache[int, UserIdentityData] = TimedLruCache(
+    max_size=USER_IDENTITY_CACHE_SIZE,
+    time_to_live=USER_IDENTITY_CACHE_TIME_TO_LIVE,
+)
+
+register_cache_metrics(user_identity_cache, 'user_identity_cache', 'Identities of users')
+
+
 async def identify_user(
     credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
     session: AsyncSession = Depends(define_postgres_session),
-) -> User:
+) -> UserIdentityData:
     (user_id, error_message) = decode_access_token(credentials.credentials)
 
     if not user_id:
         raise UserUnauthorised(message=error_message)
 
+    attribute_session_to_user(session, user_id)
+
+    user_identity: UserIdentityData | None = user_identity_cache.get(user_id)
+
+    if user_identity is not None:
+        return user_identity
+
     user_repository: UserRepository = UserRepository(session=session)
     user: User | None = await user_repository.get_by_id(user_id)
 
     if user is None:
         raise UserUnauthorised(message='The user does not seem to exist')
 
-    return user
+    user_identity = UserIdentityData.from_orm(user)
+    user_identity_cache.set(user_id, user_identity)
+
+    return user_identity
+
+
+# Users are forgotten as soon as they are flushed, and once again on the commit,
+# so that no request caches the state that is about to be overwritten.
+@listens_for(Session, 'after_flush')
+def _forget_flushed_users(session: Session, flush_context: UOWTransaction) -> None:
+    written_user_ids: set[int] = session.info.setdefault(_WRITTEN_USER_IDS_KEY, set())
+    written_user_ids.update(
+        record.id
+        for record in chain(session.dirty, session.deleted)
+        if isinstance(record, User)
+    )
+
+    for user_id in written_user_ids:
+        user_identity_cache.forget(user_id)
+
+@listens_for(Session, 'after_commit')
+def _forget_committed_users(session: Session) -> None:
+    for user_id in session.info.pop(_WRITTEN_USER_IDS_KEY, set()):
+        user_identity_cache.forget(user_id)
+
+@listens_for(Session, 'after_rollback')
+def _discard_written_users(session: Session) -> None:
+    session.info.pop(_WRITTEN_USER_IDS_KEY, None)
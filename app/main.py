@@ -1,3 +1,5 @@
+from logging import Logger, getLogger
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -7,15 +9,23 @@ from app.routers import (
     budget_router,
     category_router,
     family_router,
+    metrics_router,
     transaction_router,
     trend_router,
     user_router,
 )
+from app.utilities.metrics import MetricsMiddleware
 from app.utilities.security.cors import (
     ALLOWED_HEADERS,
     ALLOWED_METHODS,
     ALLOWED_ORIGINS,
+    EXPOSED_HEADERS,
 )
+from core.databases.sessions import POSTGRES_ENGINE_OPTIONS
+
+
+# The logger is the one both uvicorn & its gunicorn workers output
+logger: Logger = getLogger('uvicorn.error')
 
 
 api: FastAPI = FastAPI(
@@ -36,8 +46,10 @@ api.add_middleware(
     allow_origins=ALLOWED_ORIGINS,
     allow_methods=ALLOWED_METHODS,
     allow_headers=ALLOWED_HEADERS,
+    expose_headers=EXPOSED_HEADERS,
     allow_credentials=True,
 )
+api.add_middleware(MetricsMiddleware)
 
 api.include_router(authentication_router)
 api.include_router(family_router)
@@ -47,3 +59,10 @@ api.include_router(account_router)
 api.include_router(category_router)
 api.include_router(transaction_router)
 api.include_router(budget_router)
+api.include_router(metrics_router)
+
+
+@api.on_event('startup')
+def log_postgres_engine_options() -> None:
+    for (option_name, option_value) in POSTGRES_ENGINE_OPTIONS.items():
+        logger.info('Postgres engine option %s: %r', option_name, option_value)
@@ -3,6 +3,7 @@ from .authentication import authentication_router
 from .budget import budget_router
 from .category import category_router
 from .family import family_router
+from .metrics import metrics_router
 from .transaction import transaction_router
 from .trend import trend_router
 from .user import user_router
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from pydantic import PositiveInt
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dependencies.data_versions import check_data_version
+from app.dependencies.read_sessions import define_postgres_read_session
 from app.dependencies.sessions import define_postgres_session
 from app.dependencies.user import identify_user
 from app.schemas.account import (
@@ -10,62 +12,78 @@ from app.schemas.account import (
     AccountOutputData,
     AccountUpdateData,
 )
-from app.utilities.callables import sum_transactions_of_given_type
+from app.schemas.pagination import PageData
+from app.schemas.user import UserIdentityData
 from app.utilities.exceptions.records import (
     CouldNotAccessRecord,
     CouldNotFindRecord,
 )
-from core.databases.models import Account, User
-from core.databases.models.utilities.types import TransactionType
+from app.utilities.pagination import get_records_page
+from app.utilities.routing import UnitOfWorkRoute
+from core.databases.models import Account
 from core.databases.repositories import AccountRepository
+from core.databases.repositories.utilities.base import OrderKeys
 
 
-account_router: APIRouter = APIRouter(prefix='/account', tags=['account'])
+ACCOUNT_ORDER_KEYS: OrderKeys = (Account.id,)
 
 
-@account_router.get('/balances', response_model=list[AccountBalanceData])
+account_router: APIRouter = APIRouter(prefix='/account', tags=['account'], route_class=UnitOfWorkRoute)
+
+
+@account_router.get('/balances', response_model=list[AccountBalanceData], dependencies=[Depends(check_data_version)])
 async def get_balances(
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> list[AccountBalanceData]:
+    account_repository: AccountRepository = AccountRepository(session=session)
+    accounts: list[Account] = await account_repository.get_list(
+        Account.user_id == current_user.id,
+    )
+
     return [
         AccountBalanceData(
             account=account.name,
-            balance=sum_transactions_of_given_type(
-                transactions=account.transactions,
-                transaction_type=TransactionType.INCOME,
-                initial_amount=account.opening_balance,
-            ) - sum_transactions_of_given_type(
-                transactions=account.transactions,
-                transaction_type=TransactionType.OUTCOME,
-            ),
+            balance=account.opening_balance + account.transactions_balance,
         )
-        for account in current_user.accounts
+        for account in accounts
     ]
 
-@account_router.get('/list', response_model=list[AccountOutputData])
+@account_router.get('/list', response_model=list[AccountOutputData], dependencies=[Depends(check_data_version)])
 async def get_accounts(
-    current_user: User = Depends(identify_user),
+    response: Response,
+    page: PageData = Depends(),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> list[Account]:
-    return current_user.accounts
+    account_repository: AccountRepository = AccountRepository(session=session)
+
+    return await get_records_page(
+        account_repository,
+        Account.user_id == current_user.id,
+        page=page,
+        response=response,
+        order_keys=ACCOUNT_ORDER_KEYS,
+    )
 
 @account_router.post('/create', response_model=AccountOutputData, status_code=status.HTTP_201_CREATED)
 async def create_account(
     account_data: AccountCreationData,
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Account:
     account_repository: AccountRepository = AccountRepository(session=session)
 
     return await account_repository.create(
         record_data=account_data.dict(),
-        user=current_user,
+        user_id=current_user.id,
     )
 
 @account_router.patch('/update', response_model=AccountOutputData)
 async def update_account(
     account_data: AccountUpdateData,
     account_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Account:
     account_repository: AccountRepository = AccountRepository(session=session)
@@ -74,7 +92,7 @@ async def update_account(
     if account is None:
         raise CouldNotFindRecord(account_id, Account)
 
-    if account.user != current_user:
+    if account.user_id != current_user.id:
         raise CouldNotAccessRecord(account_id, Account)
 
     return await account_repository.update(
@@ -85,7 +103,7 @@ async def update_account(
 @account_router.delete('/delete', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_account(
     account_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> None:
     account_repository: AccountRepository = AccountRepository(session=session)
@@ -94,7 +112,7 @@ async def delete_account(
     if account is None:
         raise CouldNotFindRecord(account_id, Account)
 
-    if account.user != current_user:
+    if account.user_id != current_user.id:
         raise CouldNotAccessRecord(account_id, Account)
 
     await account_repository.delete(account)
@@ -1,23 +1,36 @@
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
 from fastapi import APIRouter, Depends, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.sessions import define_postgres_session
-from app.schemas.authentication import AuthenticationData
+from app.schemas.authentication import (
+    AuthenticationData,
+    RefreshTokenData,
+    TokensData,
+)
 from app.schemas.user import UserCreationData, UserOutputData
 from app.utilities.exceptions.auth import (
     UsernameAlreadyExists,
     WrongPassword,
     WrongUsername,
 )
+from app.utilities.routing import UnitOfWorkRoute
 from app.utilities.security.jwt import create_access_token
+from app.utilities.security.passwords import (
+    check_password_needs_rehash,
+    hash_password,
+    verify_password,
+)
+from app.utilities.security.refresh_tokens import (
+    issue_refresh_token,
+    revoke_refresh_token,
+    rotate_refresh_token,
+)
 from core.databases.models import User
 from core.databases.repositories import UserRepository
 
 
-authentication_router: APIRouter = APIRouter(tags=['authentication'])
+authentication_router: APIRouter = APIRouter(tags=['authentication'], route_class=UnitOfWorkRoute)
 
 
 @authentication_router.post('/sign-up', response_model=AuthenticationData, status_code=status.HTTP_201_CREATED)
@@ -33,12 +46,14 @@ async def sign_up(
 
     user = await user_repository.create(
         record_data=user_data.dict(),
-        password=PasswordHasher().hash(user_data.password),
+        password=await hash_password(user_data.password),
     )
     access_token: str = create_access_token(user_id=user.id)
+    refresh_token: str = await issue_refresh_token(user_id=user.id, session=session)
 
     return AuthenticationData(
         access_token=access_token,
+        refresh_token=refresh_token,
         user=UserOutputData.from_orm(user),
     )
 
@@ -53,14 +68,41 @@ async def sign_in(
     if user is None:
         raise WrongUsername(username=credentials.username)
 
-    try:
-        PasswordHasher().verify(hash=user.password, password=credentials.password)
-    except VerifyMismatchError:
+    if not await verify_password(user.password, credentials.password):
         raise WrongPassword(username=user.username)
 
+    if check_password_needs_rehash(user.password):
+        user = await user_repository.update(
+            record=user,
+            record_data={
+                'password': await hash_password(credentials.password),
+            },
+        )
+
     access_token: str = create_access_token(user_id=user.id)
+    refresh_token: str = await issue_refresh_token(user_id=user.id, session=session)
 
     return AuthenticationData(
         access_token=access_token,
+        refresh_token=refresh_token,
         user=UserOutputData.from_orm(user),
     )
+
+@authentication_router.post('/token/refresh', response_model=TokensData)
+async def refresh_tokens(
+    refresh_token_data: RefreshTokenData,
+    session: AsyncSession = Depends(define_postgres_session),
+) -> TokensData:
+    (user_id, refresh_token) = await rotate_refresh_token(refresh_token_data.refresh_token, session=session)
+
+    return TokensData(
+        access_token=create_access_token(user_id=user_id),
+        refresh_token=refresh_token,
+    )
+
+@authentication_router.post('/token/revoke', status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_tokens(
+    refresh_token_data: RefreshTokenData,
+    session: AsyncSession = Depends(define_postgres_session),
+) -> None:
+    await revoke_refresh_token(refresh_token_data.refresh_token, session=session)
@@ -1,10 +1,13 @@
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from pydantic import PositiveInt
 from sqlalchemy import or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
+from app.dependencies.data_versions import check_data_version
+from app.dependencies.read_sessions import define_postgres_read_session
 from app.dependencies.sessions import define_postgres_session
 from app.dependencies.user import identify_user
 from app.schemas.budget import (
@@ -12,58 +15,86 @@ from app.schemas.budget import (
     BudgetOutputData,
     BudgetUpdateData,
 )
+from app.schemas.pagination import PageData
+from app.schemas.user import UserIdentityData
 from app.utilities.callables import get_validated_user_categories_by_ids
 from app.utilities.exceptions.records import (
     CouldNotAccessRecord,
     CouldNotFindRecord,
 )
+from app.utilities.pagination import get_records_page
+from app.utilities.routing import UnitOfWorkRoute
 from core.databases.models import Budget, Category, User
 from core.databases.models.utilities.types import BudgetType
 from core.databases.repositories import BudgetRepository
+from core.databases.repositories.utilities.base import LoaderProfile, OrderKeys
 
 
-budget_router: APIRouter = APIRouter(prefix='/budget', tags=['budget'])
+BUDGET_ORDER_KEYS: OrderKeys = (Budget.id,)
 
+BUDGET_OUTPUT_PROFILE: LoaderProfile = (
+    selectinload(Budget.categories),
+)
+BUDGET_ACCESS_PROFILE: LoaderProfile = (
+    joinedload(Budget.user),
+    selectinload(Budget.categories),
+)
+
+
+budget_router: APIRouter = APIRouter(prefix='/budget', tags=['budget'], route_class=UnitOfWorkRoute)
 
-@budget_router.get('/list', response_model=list[BudgetOutputData])
+
+@budget_router.get('/list', response_model=list[BudgetOutputData], dependencies=[Depends(check_data_version)])
 async def get_budgets(
+    response: Response,
     budget_type: BudgetType = Query(..., alias='type'),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    page: PageData = Depends(),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> list[Budget]:
     budget_repository: BudgetRepository = BudgetRepository(session=session)
 
     if budget_type is BudgetType.PERSONAL:
-        return await budget_repository.get_list(
+        return await get_records_page(
+            budget_repository,
             Budget.type == budget_type,
-            Budget.user == current_user,
+            Budget.user_id == current_user.id,
+            page=page,
+            response=response,
+            order_keys=BUDGET_ORDER_KEYS,
+            profile=BUDGET_OUTPUT_PROFILE,
         )
 
     if budget_type is BudgetType.JOINT:
-        return await budget_repository.get_list(
+        return await get_records_page(
+            budget_repository,
             Budget.type == budget_type,
             or_(
-                Budget.user == current_user,
-                Budget.user.has(family=current_user.family),
+                Budget.user_id == current_user.id,
+                Budget.user.has(User.family_id == current_user.family_id),
             ),
+            page=page,
+            response=response,
+            order_keys=BUDGET_ORDER_KEYS,
+            profile=BUDGET_OUTPUT_PROFILE,
         )
 
-@budget_router.get('/item', response_model=BudgetOutputData)
+@budget_router.get('/item', response_model=BudgetOutputData, dependencies=[Depends(check_data_version)])
 async def get_budget(
     budget_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> Budget:
     budget_repository: BudgetRepository = BudgetRepository(session=session)
-    budget: Budget | None = await budget_repository.get_by_id(budget_id)
+    budget: Budget | None = await budget_repository.get_by_id(budget_id, profile=BUDGET_ACCESS_PROFILE)
 
     if budget is None:
         raise CouldNotFindRecord(budget_id, Budget)
 
-    if budget.type is BudgetType.PERSONAL and budget.user != current_user:
+    if budget.type is BudgetType.PERSONAL and budget.user_id != current_user.id:
         raise CouldNotAccessRecord(budget_id, Budget)
 
-    if budget.type is BudgetType.JOINT and (current_user.family is None or budget.user.family_id != current_user.family.id):
+    if budget.type is BudgetType.JOINT and (current_user.family_id is None or budget.user.family_id != current_user.family_id):
         raise CouldNotAccessRecord(budget_id, Budget)
 
     return budget
@@ -71,12 +102,12 @@ async def get_budget(
 @budget_router.post('/create', response_model=BudgetOutputData, status_code=status.HTTP_201_CREATED)
 async def create_budget(
     budget_data: BudgetCreationData,
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Budget:
     categories: list[Category] = await get_validated_user_categories_by_ids(
         category_ids=budget_data.category_ids,
-        user=current_user,
+        user_id=current_user.id,
         session=session,
     )
 
@@ -84,7 +115,8 @@ async def create_budget(
 
     return await budget_repository.create(
         record_data=budget_data.dict(),
-        user=current_user,
+        profile=BUDGET_OUTPUT_PROFILE,
+        user_id=current_user.id,
         categories=categories,
     )
 
@@ -92,16 +124,16 @@ async def create_budget(
 async def update_budget(
     budget_data: BudgetUpdateData,
     budget_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Budget:
     budget_repository: BudgetRepository = BudgetRepository(session=session)
-    budget: Budget | None = await budget_repository.get_by_id(budget_id)
+    budget: Budget | None = await budget_repository.get_by_id(budget_id, profile=BUDGET_OUTPUT_PROFILE)
 
     if budget is None:
         raise CouldNotFindRecord(budget_id, Budget)
 
-    if budget.user != current_user:
+    if budget.user_id != current_user.id:
         raise CouldNotAccessRecord(budget_id, Budget)
 
     relationship_attributes: dict[str, Any] = {}
@@ -109,29 +141,30 @@ async def update_budget(
     if budget_data.category_ids is not None:
         relationship_attributes['categories'] = get_validated_user_categories_by_ids(
             category_ids=budget_data.category_ids,
-            user=current_user,
+            user_id=current_user.id,
             session=session,
         )
 
     return await budget_repository.update(
         record=budget,
         record_data=budget_data.dict(),
+        profile=BUDGET_OUTPUT_PROFILE,
         **relationship_attributes,
     )
 
 @budget_router.delete('/delete', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_budget(
     budget_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> None:
     budget_repository: BudgetRepository = BudgetRepository(session=session)
-    budget: Budget | None = await budget_repository.get_by_id(budget_id)
+    budget: Budget | None = await budget_repository.get_by_id(budget_id, profile=BUDGET_OUTPUT_PROFILE)
 
     if budget is None:
         raise CouldNotFindRecord(budget_id, Budget)
 
-    if budget.user != current_user:
+    if budget.user_id != current_user.id:
         raise CouldNotAccessRecord(budget_id, Budget)
 
     await budget_repository.delete(budget)
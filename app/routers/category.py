@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from pydantic import PositiveInt
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dependencies.data_versions import check_data_version
+from app.dependencies.read_sessions import define_postgres_read_session
 from app.dependencies.sessions import define_postgres_session
 from app.dependencies.user import identify_user
 from app.schemas.category import (
@@ -9,28 +11,47 @@ from app.schemas.category import (
     CategoryOutputData,
     CategoryUpdateData,
 )
+from app.schemas.pagination import PageData
+from app.schemas.user import UserIdentityData
 from app.utilities.exceptions.records import (
     CouldNotAccessRecord,
     CouldNotFindRecord,
 )
-from core.databases.models import Category, User
+from app.utilities.pagination import get_records_page
+from app.utilities.routing import UnitOfWorkRoute
+from core.databases.models import Category
 from core.databases.repositories import CategoryRepository
+from core.databases.repositories.utilities.base import OrderKeys
 
 
-category_router: APIRouter = APIRouter(prefix='/category', tags=['category'])
+CATEGORY_ORDER_KEYS: OrderKeys = (Category.id,)
 
 
-@category_router.get('/list', response_model=list[CategoryOutputData])
+category_router: APIRouter = APIRouter(prefix='/category', tags=['category'], route_class=UnitOfWorkRoute)
+
+
+@category_router.get('/list', response_model=list[CategoryOutputData], dependencies=[Depends(check_data_version)])
 async def get_categories(
-    current_user: User = Depends(identify_user),
+    response: Response,
+    page: PageData = Depends(),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> list[Category]:
-    return current_user.categories
+    category_repository: CategoryRepository = CategoryRepository(session=session)
 
-@category_router.get('/item', response_model=CategoryOutputData)
+    return await get_records_page(
+        category_repository,
+        Category.user_id == current_user.id,
+        page=page,
+        response=response,
+        order_keys=CATEGORY_ORDER_KEYS,
+    )
+
+@category_router.get('/item', response_model=CategoryOutputData, dependencies=[Depends(check_data_version)])
 async def get_category(
     category_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> Category:
     category_repository: CategoryRepository = CategoryRepository(session=session)
     category: Category | None = await category_repository.get_by_id(category_id)
@@ -38,7 +59,7 @@ async def get_category(
     if category is None:
         raise CouldNotFindRecord(category_id, Category)
 
-    if category.user != current_user:
+    if category.user_id != current_user.id:
         raise CouldNotAccessRecord(category_id, Category)
 
     return category
@@ -46,21 +67,21 @@ async def get_category(
 @category_router.post('/create', response_model=CategoryOutputData, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_data: CategoryCreationData,
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Category:
     category_repository: CategoryRepository = CategoryRepository(session=session)
 
     return await category_repository.create(
         record_data=category_data.dict(),
-        user=current_user,
+        user_id=current_user.id,
     )
 
 @category_router.patch('/update', response_model=CategoryOutputData)
 async def update_category(
     category_data: CategoryUpdateData,
     category_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Category:
     category_repository: CategoryRepository = CategoryRepository(session=session)
@@ -69,7 +90,7 @@ async def update_category(
     if category is None:
         raise CouldNotFindRecord(category_id, Category)
 
-    if category.user != current_user:
+    if category.user_id != current_user.id:
         raise CouldNotAccessRecord(category_id, Category)
 
     return await category_repository.update(
@@ -80,7 +101,7 @@ async def update_category(
 @category_router.delete('/delete', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_category(
     category_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> None:
     category_repository: CategoryRepository = CategoryRepository(session=session)
@@ -89,7 +110,7 @@ async def delete_category(
     if category is None:
         raise CouldNotFindRecord(category_id, Category)
 
-    if category.user != current_user:
+    if category.user_id != current_user.id:
         raise CouldNotAccessRecord(category_id, Category)
 
     await category_repository.delete(category)
@@ -1,27 +1,41 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.read_sessions import define_postgres_read_session
 from app.dependencies.user import identify_user
 from app.schemas.family import FamilyOutputData
+from app.schemas.user import UserIdentityData
 from app.utilities.exceptions.users import NotFamilyMember
-from core.databases.models import Family, User
+from app.utilities.routing import UnitOfWorkRoute
+from core.databases.models import Family
+from core.databases.repositories import FamilyRepository
+from core.databases.repositories.utilities.base import LoaderProfile
 
 
-family_router: APIRouter = APIRouter(prefix='/family', tags=['family'])
+FAMILY_OUTPUT_PROFILE: LoaderProfile = (
+    selectinload(Family.members),
+)
+
+
+family_router: APIRouter = APIRouter(prefix='/family', tags=['family'], route_class=UnitOfWorkRoute)
 
 
 @family_router.get('/current', response_model=FamilyOutputData)
 async def get_family(
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> Family:
-    if current_user.family is None:
+    if current_user.family_id is None:
         raise NotFamilyMember()
 
-    await session.refresh(
-        instance=current_user.family,
-        attribute_names=['members'],
+    family_repository: FamilyRepository = FamilyRepository(session=session)
+    family: Family | None = await family_repository.get_by_id(
+        current_user.family_id,
+        profile=FAMILY_OUTPUT_PROFILE,
     )
 
-    return current_user.family
+    if family is None:
+        raise NotFamilyMember()
+
+    return family
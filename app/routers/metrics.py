@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from core.metrics import PROMETHEUS_MEDIA_TYPE, metrics_registry
+
+
+metrics_router: APIRouter = APIRouter(tags=['metrics'])
+
+
+# Metrics are rendered only once scraped, so that requests merely bump the counters
+@metrics_router.get('/metrics', response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    return PlainTextResponse(content=metrics_registry.render(), media_type=PROMETHEUS_MEDIA_TYPE)
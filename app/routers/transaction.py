@@ -1,64 +1,140 @@
-from fastapi import APIRouter, Depends, Query, status
-from pydantic import PositiveInt
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import PositiveInt, ValidationError
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import func
+from sqlalchemy.orm import InstrumentedAttribute, joinedload
 
+from app.dependencies.data_versions import check_data_version
+from app.dependencies.read_sessions import define_postgres_read_session
 from app.dependencies.sessions import define_postgres_session
 from app.dependencies.user import identify_user
+from app.schemas.pagination import PageData
 from app.schemas.transaction import (
     TransactionCreationData,
+    TransactionImportErrorData,
+    TransactionImportResultData,
     TransactionOutputData,
     TransactionsPeriodData,
     TransactionUpdateData,
 )
+from app.schemas.user import UserIdentityData
 from app.utilities.exceptions.records import (
     CouldNotAccessRecord,
     CouldNotFindRecord,
 )
-from core.databases.models import Account, Category, Transaction, User
-from core.databases.repositories import TransactionRepository
+from app.utilities.imports import IMPORT_MEDIA_TYPES, read_import_rows
+from app.utilities.ndjson import NDJSON_MEDIA_TYPE, encode_ndjson_batches
+from app.utilities.pagination import get_rows_page
+from app.utilities.responses import make_rows_response
+from app.utilities.routing import UnitOfWorkRoute
+from core.calendar import get_period_boundaries
+from core.databases.models import Account, Category, Transaction
+from core.databases.repositories import (
+    AccountRepository,
+    CategoryRepository,
+    TransactionRepository,
+)
+from core.databases.repositories.transaction import (
+    get_due_date_period_conditions,
+)
+from core.databases.repositories.utilities.base import LoaderProfile, OrderKeys
+
+
+TRANSACTION_ORDER_KEYS: OrderKeys = (
+    Transaction.due_date,
+    Transaction.due_time,
+    Transaction.id,
+)
+
+TRANSACTION_OUTPUT_COLUMNS: tuple[InstrumentedAttribute[Any], ...] = tuple(
+    getattr(Transaction, field_name)
+    for field_name in TransactionOutputData.__fields__
+)
+
+TRANSACTION_EXPORT_BATCH_SIZE: int = 1000
+TRANSACTION_IMPORT_BATCH_SIZE: int = 1000
+
+TRANSACTION_ACCESS_PROFILE: LoaderProfile = (
+    joinedload(Transaction.account),
+)
 
 
-transaction_router: APIRouter = APIRouter(prefix='/transaction', tags=['transaction'])
+transaction_router: APIRouter = APIRouter(prefix='/transaction', tags=['transaction'], route_class=UnitOfWorkRoute)
 
 
-@transaction_router.get('/periods', response_model=list[TransactionsPeriodData])
+@transaction_router.get('/periods', response_model=list[TransactionsPeriodData], dependencies=[Depends(check_data_version)])
 async def get_periods(
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> list[TransactionsPeriodData]:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
-    periods_entities: list[tuple[int, int]] = await transaction_repository.get_user_transaction_periods(current_user)
+    periods_entities: list[tuple[int, int]] = await transaction_repository.get_user_transaction_periods(current_user.id)
 
     return [TransactionsPeriodData(year=year, month=month) for (year, month) in periods_entities]
 
-@transaction_router.get('/list', response_model=list[TransactionOutputData])
+@transaction_router.get('/list', response_model=list[TransactionOutputData], dependencies=[Depends(check_data_version)])
 async def get_transactions(
+    response: Response,
     transactions_period: TransactionsPeriodData = Depends(),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
-) -> list[Transaction]:
+    page: PageData = Depends(),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> ORJSONResponse:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
+    transaction_rows: list[Row[Any]] = await get_rows_page(
+        transaction_repository,
+        Transaction.user_id == current_user.id,
+        *get_due_date_period_conditions(get_period_boundaries(
+            year=transactions_period.year,
+            month=transactions_period.month,
+        )),
+        columns=TRANSACTION_OUTPUT_COLUMNS,
+        page=page,
+        response=response,
+        order_keys=TRANSACTION_ORDER_KEYS,
+    )
 
-    return await transaction_repository.get_list(
-        Transaction.account.has(user=current_user),
-        func.DATE_PART('YEAR', Transaction.due_date) == transactions_period.year,
-        func.DATE_PART('MONTH', Transaction.due_date) == transactions_period.month,
+    return make_rows_response(transaction_rows, TransactionOutputData, response)
+
+@transaction_router.get('/export', response_class=StreamingResponse, responses={
+    status.HTTP_200_OK: {
+        'content': {
+            NDJSON_MEDIA_TYPE: {},
+        },
+        'description': 'Every transaction of the user as a JSON line of `TransactionOutputData`',
+    },
+})
+async def export_transactions(
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> StreamingResponse:
+    transaction_repository: TransactionRepository = TransactionRepository(session=session)
+
+    return StreamingResponse(
+        content=encode_ndjson_batches(transaction_repository.stream_user_transactions(
+            user_id=current_user.id,
+            columns=TRANSACTION_OUTPUT_COLUMNS,
+            batch_size=TRANSACTION_EXPORT_BATCH_SIZE,
+        )),
+        media_type=NDJSON_MEDIA_TYPE,
     )
 
-@transaction_router.get('/item', response_model=TransactionOutputData)
+@transaction_router.get('/item', response_model=TransactionOutputData, dependencies=[Depends(check_data_version)])
 async def get_transaction(
     transaction_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> Transaction:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
-    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id)
+    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id, profile=TRANSACTION_ACCESS_PROFILE)
 
     if transaction is None:
         raise CouldNotFindRecord(transaction_id, Transaction)
 
-    if transaction.account.user != current_user:
+    if transaction.account.user_id != current_user.id:
         raise CouldNotAccessRecord(transaction_id, Transaction)
 
     return transaction
@@ -66,13 +142,25 @@ async def get_transaction(
 @transaction_router.post('/create', response_model=TransactionOutputData, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     transaction_data: TransactionCreationData,
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Transaction:
-    if not any(transaction_data.account_id == account.id for account in current_user.accounts):
+    account_repository: AccountRepository = AccountRepository(session=session)
+    account: Account | None = await account_repository.get(
+        Account.id == transaction_data.account_id,
+        Account.user_id == current_user.id,
+    )
+
+    if account is None:
         raise CouldNotFindRecord(transaction_data.account_id, Account)
 
-    if not any(transaction_data.category_id == category.id for category in current_user.categories):
+    category_repository: CategoryRepository = CategoryRepository(session=session)
+    category: Category | None = await category_repository.get(
+        Category.id == transaction_data.category_id,
+        Category.user_id == current_user.id,
+    )
+
+    if category is None:
         raise CouldNotFindRecord(transaction_data.category_id, Category)
 
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
@@ -81,20 +169,92 @@ async def create_transaction(
         record_data=transaction_data.dict(),
     )
 
+@transaction_router.post('/import', response_model=TransactionImportResultData, status_code=status.HTTP_201_CREATED, openapi_extra={
+    'requestBody': {
+        'content': {
+            media_type: {}
+            for media_type in IMPORT_MEDIA_TYPES
+        },
+        'description': 'A CSV table or a JSON list of records of `TransactionCreationData`',
+        'required': True,
+    },
+})
+async def import_transactions(
+    request: Request,
+    current_user: UserIdentityData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_session),
+) -> TransactionImportResultData:
+    import_rows: list[dict[str, Any]] = read_import_rows(await request.body(), request.headers.get('content-type', ''))
+
+    account_repository: AccountRepository = AccountRepository(session=session)
+    category_repository: CategoryRepository = CategoryRepository(session=session)
+
+    transactions_data: list[dict[str, Any]] = []
+    import_errors: list[TransactionImportErrorData] = []
+
+    for batch_offset in range(0, len(import_rows), TRANSACTION_IMPORT_BATCH_SIZE):
+        batch_transactions_data: dict[int, TransactionCreationData] = {}
+
+        for (row_number, import_row) in enumerate(import_rows[batch_offset:batch_offset + TRANSACTION_IMPORT_BATCH_SIZE], start=batch_offset + 1):
+            try:
+                batch_transactions_data[row_number] = TransactionCreationData.parse_obj(import_row)
+            except ValidationError as validation_error:
+                import_errors.append(TransactionImportErrorData(
+                    row=row_number,
+                    message='Provided row is not valid for the transaction',
+                    error_data={
+                        'errors': validation_error.errors(),
+                    },
+                ))
+
+        user_account_ids: set[int] = {
+            account.id
+            for account in await account_repository.get_list(
+                Account.id.in_({transaction_data.account_id for transaction_data in batch_transactions_data.values()}),
+                Account.user_id == current_user.id,
+            )
+        }
+        user_category_ids: set[int] = {
+            category.id
+            for category in await category_repository.get_list(
+                Category.id.in_({transaction_data.category_id for transaction_data in batch_transactions_data.values()}),
+                Category.user_id == current_user.id,
+            )
+        }
+
+        for (row_number, transaction_data) in batch_transactions_data.items():
+            if transaction_data.account_id not in user_account_ids:
+                import_errors.append(TransactionImportErrorData(row=row_number, **CouldNotFindRecord(transaction_data.account_id, Account).detail))
+            elif transaction_data.category_id not in user_category_ids:
+                import_errors.append(TransactionImportErrorData(row=row_number, **CouldNotFindRecord(transaction_data.category_id, Category).detail))
+            else:
+                transactions_data.append(transaction_data.dict())
+
+    transaction_repository: TransactionRepository = TransactionRepository(session=session)
+    await transaction_repository.create_many(
+        records_data=transactions_data,
+        batch_size=TRANSACTION_IMPORT_BATCH_SIZE,
+    )
+
+    return TransactionImportResultData(
+        imported_count=len(transactions_data),
+        errors=sorted(import_errors, key=lambda import_error: import_error.row),
+    )
+
 @transaction_router.patch('/update', response_model=TransactionOutputData)
 async def update_transaction(
     transaction_data: TransactionUpdateData,
     transaction_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Transaction:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
-    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id)
+    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id, profile=TRANSACTION_ACCESS_PROFILE)
 
     if transaction is None:
         raise CouldNotFindRecord(transaction_id, Transaction)
 
-    if transaction.account.user != current_user:
+    if transaction.account.user_id != current_user.id:
         raise CouldNotAccessRecord(transaction_id, Transaction)
 
     return await transaction_repository.update(
@@ -105,16 +265,16 @@ async def update_transaction(
 @transaction_router.delete('/delete', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_transaction(
     transaction_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: UserIdentityData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> None:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
-    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id)
+    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id, profile=TRANSACTION_ACCESS_PROFILE)
 
     if transaction is None:
         raise CouldNotFindRecord(transaction_id, Transaction)
 
-    if transaction.account.user != current_user:
+    if transaction.account.user_id != current_user.id:
         raise CouldNotAccessRecord(transaction_id, Transaction)
 
     await transaction_repository.delete(transaction)
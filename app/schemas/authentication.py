@@ -2,6 +2,12 @@ from .user import UserOutputData
 from .utilities.base import BaseData
 
 
-class AuthenticationData(BaseData):
+class TokensData(BaseData):
     access_token: str
+    refresh_token: str
+
+class AuthenticationData(TokensData):
     user: UserOutputData
+
+class RefreshTokenData(BaseData):
+    refresh_token: str
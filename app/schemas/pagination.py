@@ -0,0 +1,7 @@
+from .utilities.base import BaseData
+from .utilities.types import PageLimit
+
+
+class PageData(BaseData):
+    limit: PageLimit | None
+    cursor: str | None
@@ -1,7 +1,8 @@
 from datetime import date, time
 
-from pydantic import PositiveFloat, PositiveInt
+from pydantic import NonNegativeInt, PositiveFloat, PositiveInt
 
+from app.utilities.exceptions.response import ErrorData
 from core.databases.models.utilities.types import TransactionType
 
 from .utilities.base import BaseData, BaseUpdateData
@@ -36,6 +37,15 @@ class TransactionUpdateData(BaseUpdateData, anystr_strip_whitespace=True):
     amount: PositiveFloat | None
     note: str | None
 
+class TransactionImportErrorData(BaseData):
+    row: PositiveInt
+    message: str
+    error_data: ErrorData | None
+
+class TransactionImportResultData(BaseData):
+    imported_count: NonNegativeInt
+    errors: list[TransactionImportErrorData]
+
 
 class TransactionsPeriodData(BaseData):
     year: Year
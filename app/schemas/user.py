@@ -11,6 +11,11 @@ class UserOutputData(BaseData, orm_mode=True):
     family_id: PositiveInt | None
     username: str
 
+class UserIdentityData(BaseData, orm_mode=True, frozen=True):
+    id: PositiveInt
+    family_id: PositiveInt | None
+    username: str
+
 class UserCreationData(BaseData, anystr_strip_whitespace=True):
     family_id: PositiveInt | None
     username: str = Field(..., min_length=1)
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 from pydantic import BaseModel
 
@@ -6,6 +6,13 @@ from pydantic import BaseModel
 class BaseData(BaseModel):
     """Base class for data of input & output."""
 
+    @classmethod
+    def dump_rows(cls, rows: Iterable[Sequence[Any]]) -> list[dict[str, Any]]:
+        # Rows are trusted to be selected in the order of the fields & are not validated
+        field_names: tuple[str, ...] = tuple(cls.__fields__)
+
+        return [dict(zip(field_names, row)) for row in rows]
+
 
 class BaseUpdateData(BaseData):
     def dict(self, **keyword_arguments: Any) -> dict[str, Any]:
@@ -1,18 +1,26 @@
+from datetime import date
 from typing import Annotated
 
-from pydantic import Field
+from pydantic import Field, conint
 
 
 MIN_TRANSACTION_YEAR: int = 2000
+# Periods end at the first date of the next one, which has to exist as well
+MAX_TRANSACTION_YEAR: int = date.max.year - 1
 MIN_TRANSACTION_MONTH: int = 1
 MAX_TRANSACTION_MONTH: int = 12
 
+MIN_PAGE_LIMIT: int = 1
+MAX_PAGE_LIMIT: int = 1000
+
 
 Year = Annotated[
     int,
-    Field(..., ge=MIN_TRANSACTION_YEAR),
+    Field(..., ge=MIN_TRANSACTION_YEAR, le=MAX_TRANSACTION_YEAR),
 ]
 Month = Annotated[
     int,
     Field(..., ge=MIN_TRANSACTION_MONTH, le=MAX_TRANSACTION_MONTH),
 ]
+# Constraints of `Annotated` types are lost within `Optional` ones, while the limit is optional
+PageLimit = conint(ge=MIN_PAGE_LIMIT, le=MAX_PAGE_LIMIT)
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Generic, Hashable, TypeVar
+
+from core.metrics import CallbackCounter, metrics_registry
+
+
+Key = TypeVar('Key', bound=Hashable)
+Cached = TypeVar('Cached')
+
+
+class TimedLruCache(Generic[Key, Cached]):
+    def __init__(self, max_size: int, time_to_live: float) -> None:
+        self.max_size = max_size
+        self.time_to_live = time_to_live
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._entries: OrderedDict[Key, tuple[float, Cached]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Key) -> Cached | None:
+        entry: tuple[float, Cached] | None = self._entries.get(key)
+
+        if entry is None or entry[0] <= monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[1]
+
+    def set(self, key: Key, cached: Cached, time_to_live: float | None = None) -> None:
+        expiration_time: float = monotonic() + min(self.time_to_live, time_to_live if time_to_live is not None else self.time_to_live)
+
+        self._entries[key] = (expiration_time, cached)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def forget(self, key: Key) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Lookups are counted by the cache itself & read only once scraped, as the ones of compiled caches
+def register_cache_metrics(cache: TimedLruCache[Any, Any], cache_name: str, entry_description: str) -> None:
+    metrics_registry.register(CallbackCounter(
+        name='{0}_hits_total'.format(cache_name),
+        documentation='{0} found in the cache'.format(entry_description),
+        callback=lambda: cache.hits,
+    ))
+    metrics_registry.register(CallbackCounter(
+        name='{0}_misses_total'.format(cache_name),
+        documentation='{0} missing in the cache'.format(entry_description),
+        callback=lambda: cache.misses,
+    ))
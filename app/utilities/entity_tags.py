@@ -0,0 +1,18 @@
+ENTITY_TAG_HEADER: str = 'ETag'
+IF_NONE_MATCH_HEADER: str = 'If-None-Match'
+
+_WEAK_ENTITY_TAG_PREFIX: str = 'W/'
+_ANY_ENTITY_TAG: str = '*'
+
+
+def make_weak_entity_tag(user_id: int, data_version: int) -> str:
+    return '{0}"{1}-{2}"'.format(_WEAK_ENTITY_TAG_PREFIX, user_id, data_version)
+
+def check_entity_tag_is_matched(if_none_match: str, entity_tag: str) -> bool:
+    given_entity_tags: set[str] = {
+        given_entity_tag.strip().removeprefix(_WEAK_ENTITY_TAG_PREFIX)
+        for given_entity_tag in if_none_match.split(',')
+    }
+
+    # If-None-Match is compared weakly, so that the prefix of weak tags does not matter
+    return bool(given_entity_tags & {_ANY_ENTITY_TAG, entity_tag.removeprefix(_WEAK_ENTITY_TAG_PREFIX)})
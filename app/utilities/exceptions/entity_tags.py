@@ -0,0 +1,16 @@
+from fastapi import status
+
+from app.utilities.entity_tags import ENTITY_TAG_HEADER
+
+from .response import BaseApiException
+
+
+class DataNotModified(BaseApiException):
+    def __init__(self, entity_tag: str):
+        super().__init__(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            message='Data has not been modified since {0}'.format(entity_tag),
+            headers={
+                ENTITY_TAG_HEADER: entity_tag,
+            },
+        )
@@ -0,0 +1,22 @@
+from fastapi import status
+
+from .response import BaseApiException
+
+
+class UnsupportedImportFormat(BaseApiException):
+    def __init__(self, content_type: str, supported_content_types: tuple[str, ...]):
+        super().__init__(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            message='Provided content type is not supported for the import',
+            error_data={
+                'content_type': content_type,
+                'supported_content_types': list(supported_content_types),
+            },
+        )
+
+class CouldNotReadImportFile(BaseApiException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message='Provided file could not be read as a list of records',
+        )
@@ -0,0 +1,14 @@
+from fastapi import status
+
+from .response import BaseApiException
+
+
+class InvalidCursor(BaseApiException):
+    def __init__(self, cursor: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message='Provided `cursor` is not valid for the list',
+            error_data={
+                'cursor': cursor,
+            },
+        )
@@ -12,7 +12,13 @@ class ErrorResponseData(BaseModel):
 
 
 class BaseApiException(HTTPException):
-    def __init__(self, status_code: int, message: str, error_data: ErrorData | None = None) -> None:
+    def __init__(
+        self,
+        status_code: int,
+        message: str,
+        error_data: ErrorData | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         super().__init__(
             status_code=status_code,
             detail=ErrorResponseData(
@@ -21,4 +27,5 @@ class BaseApiException(HTTPException):
             ).dict(
                 exclude_none=True,
             ),
+            headers=headers,
         )
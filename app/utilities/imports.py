@@ -0,0 +1,41 @@
+from csv import DictReader
+from csv import Error as CsvError
+from io import StringIO
+from json import loads as load_from_json
+from typing import Any
+
+from app.utilities.exceptions.imports import (
+    CouldNotReadImportFile,
+    UnsupportedImportFormat,
+)
+
+
+CSV_MEDIA_TYPE: str = 'text/csv'
+JSON_MEDIA_TYPE: str = 'application/json'
+
+IMPORT_MEDIA_TYPES: tuple[str, ...] = (
+    CSV_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+)
+
+
+def read_import_rows(content: bytes, content_type: str) -> list[dict[str, Any]]:
+    media_type: str = content_type.split(';')[0].strip().lower()
+
+    if media_type not in IMPORT_MEDIA_TYPES:
+        raise UnsupportedImportFormat(content_type, IMPORT_MEDIA_TYPES)
+
+    try:
+        decoded_content: str = content.decode('utf-8-sig')
+
+        if media_type == CSV_MEDIA_TYPE:
+            return list(DictReader(StringIO(decoded_content)))
+
+        import_rows: Any = load_from_json(decoded_content)
+    except (UnicodeDecodeError, ValueError, CsvError):
+        raise CouldNotReadImportFile()
+
+    if not isinstance(import_rows, list) or not all(isinstance(import_row, dict) for import_row in import_rows):
+        raise CouldNotReadImportFile()
+
+    return import_rows
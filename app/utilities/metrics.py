@@ -0,0 +1,106 @@
+from time import perf_counter
+from typing import Any
+
+from fastapi import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.databases.metrics import QueryStatistics, request_query_statistics
+from core.metrics import (
+    COUNT_BUCKETS,
+    Counter,
+    Gauge,
+    Histogram,
+    metrics_registry,
+)
+
+
+# Requests are labelled by the path template of their route, so that IDs do not multiply the series
+UNMATCHED_ROUTE_LABEL: str = 'unmatched'
+
+REQUEST_LABEL_NAMES: tuple[str, ...] = ('method', 'route')
+
+
+request_duration_histogram: Histogram = Histogram(
+    name='http_request_duration_seconds',
+    documentation='Time of handling a request, including sending its response',
+    label_names=REQUEST_LABEL_NAMES,
+)
+requests_in_flight_gauge: Gauge = Gauge(
+    name='http_requests_in_flight',
+    documentation='Requests being handled',
+)
+responses_counter: Counter = Counter(
+    name='http_responses_total',
+    documentation='Responses sent',
+    label_names=(*REQUEST_LABEL_NAMES, 'status'),
+)
+request_queries_histogram: Histogram = Histogram(
+    name='http_request_db_queries',
+    documentation='Database queries executed per request',
+    label_names=REQUEST_LABEL_NAMES,
+    buckets=COUNT_BUCKETS,
+)
+request_query_time_histogram: Histogram = Histogram(
+    name='http_request_db_query_seconds',
+    documentation='Time of executing database queries per request',
+    label_names=REQUEST_LABEL_NAMES,
+)
+request_pool_wait_histogram: Histogram = Histogram(
+    name='http_request_db_pool_wait_seconds',
+    documentation='Time of waiting for database connections per request',
+    label_names=REQUEST_LABEL_NAMES,
+)
+
+for request_metric in (
+    request_duration_histogram,
+    requests_in_flight_gauge,
+    responses_counter,
+    request_queries_histogram,
+    request_query_time_histogram,
+    request_pool_wait_histogram,
+):
+    metrics_registry.register(request_metric)
+
+
+# Status is kept by the wrapper of `send`, since the middleware sees no response but its messages
+class StatusObservingSend:
+    def __init__(self, send: Send) -> None:
+        self.send = send
+        self.status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    async def __call__(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            self.status_code = message['status']
+
+        await self.send(message)
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status_observing_send: StatusObservingSend = StatusObservingSend(send)
+        query_statistics: QueryStatistics = QueryStatistics()
+        query_statistics_token: Any = request_query_statistics.set(query_statistics)
+        requests_in_flight_gauge.inc()
+        started_time: float = perf_counter()
+
+        try:
+            await self.app(scope, receive, status_observing_send)
+        finally:
+            request_time: float = perf_counter() - started_time
+            requests_in_flight_gauge.dec()
+            request_query_statistics.reset(query_statistics_token)
+
+            # The route is put into the scope by the router, which shares the scope with the middleware
+            request_labels: tuple[str, str] = (scope['method'], getattr(scope.get('route'), 'path', UNMATCHED_ROUTE_LABEL))
+
+            request_duration_histogram.observe(request_time, *request_labels)
+            responses_counter.inc(*request_labels, str(status_observing_send.status_code))
+            request_queries_histogram.observe(query_statistics.queries_number, *request_labels)
+            request_query_time_histogram.observe(query_statistics.query_time, *request_labels)
+            request_pool_wait_histogram.observe(query_statistics.pool_wait_time, *request_labels)
@@ -0,0 +1,13 @@
+from json import dumps as dump_to_json
+from typing import Any, AsyncIterator, Mapping, Sequence
+
+
+NDJSON_MEDIA_TYPE: str = 'application/x-ndjson'
+
+
+async def encode_ndjson_batches(records_batches: AsyncIterator[Sequence[Mapping[str, Any]]]) -> AsyncIterator[str]:
+    async for records_batch in records_batches:
+        yield ''.join(
+            '{0}\n'.format(dump_to_json(dict(record), default=lambda record_value: record_value.isoformat()))
+            for record in records_batch
+        )
@@ -0,0 +1,109 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64DecodingError
+from datetime import date, datetime, time
+from json import dumps as dump_to_json
+from json import loads as load_from_json
+from typing import Any, Sequence
+
+from fastapi import Response
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import ColumnElement
+
+from app.schemas.pagination import PageData
+from app.utilities.exceptions.pagination import InvalidCursor
+from core.databases.repositories.utilities.base import (
+    BaseRepository,
+    LoaderProfile,
+    Model,
+    OrderKeys,
+)
+
+
+NEXT_CURSOR_HEADER: str = 'X-Next-Cursor'
+
+# Integer keys are BIGINT columns
+MAX_CURSOR_INTEGER: int = 9223372036854775807
+MIN_CURSOR_INTEGER: int = -MAX_CURSOR_INTEGER - 1
+
+
+def encode_cursor(record: Model | Row[Any], order_keys: OrderKeys) -> str:
+    cursor_values: list[Any] = [
+        getattr(record, order_key.key)
+        for order_key in order_keys
+    ]
+    cursor_json: str = dump_to_json(cursor_values, default=lambda cursor_value: cursor_value.isoformat())
+
+    return urlsafe_b64encode(cursor_json.encode()).decode()
+
+def decode_cursor(cursor: str, order_keys: OrderKeys) -> tuple[Any, ...]:
+    try:
+        cursor_values: list[Any] = load_from_json(urlsafe_b64decode(cursor.encode()))
+
+        if not isinstance(cursor_values, list) or len(cursor_values) != len(order_keys):
+            raise InvalidCursor(cursor=cursor)
+
+        return tuple(
+            _parse_cursor_value(cursor_value, order_key.type.python_type)
+            for (cursor_value, order_key) in zip(cursor_values, order_keys)
+        )
+    except (Base64DecodingError, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidCursor(cursor=cursor)
+
+async def get_records_page(
+    repository: BaseRepository[Model],
+    *conditions: ColumnElement[bool],
+    page: PageData,
+    response: Response,
+    order_keys: OrderKeys,
+    profile: LoaderProfile = (),
+) -> list[Model]:
+    records: list[Model] = await repository.get_page(
+        *conditions,
+        order_keys=order_keys,
+        after=decode_cursor(page.cursor, order_keys) if page.cursor else None,
+        limit=page.limit + 1 if page.limit else None,
+        profile=profile,
+    )
+
+    if page.limit and len(records) > page.limit:
+        records = records[:page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(records[-1], order_keys)
+
+    return records
+
+async def get_rows_page(
+    repository: BaseRepository[Model],
+    *conditions: ColumnElement[bool],
+    columns: Sequence[InstrumentedAttribute[Any]],
+    page: PageData,
+    response: Response,
+    order_keys: OrderKeys,
+) -> list[Row[Any]]:
+    rows: list[Row[Any]] = await repository.get_rows_page(
+        *conditions,
+        columns=columns,
+        order_keys=order_keys,
+        after=decode_cursor(page.cursor, order_keys) if page.cursor else None,
+        limit=page.limit + 1 if page.limit else None,
+    )
+
+    if page.limit and len(rows) > page.limit:
+        rows = rows[:page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1], order_keys)
+
+    return rows
+
+
+def _parse_cursor_value(cursor_value: Any, value_type: type) -> Any:
+    if value_type in {date, datetime, time}:
+        return value_type.fromisoformat(cursor_value)  # type: ignore[attr-defined]
+
+    # Booleans are integers as well, while no key is a boolean one
+    if isinstance(cursor_value, bool) or not isinstance(cursor_value, value_type):
+        raise TypeError('Cursor value {0!r} is not of {1}'.format(cursor_value, value_type.__name__))
+
+    if isinstance(cursor_value, int) and (cursor_value < MIN_CURSOR_INTEGER or cursor_value > MAX_CURSOR_INTEGER):
+        raise ValueError('Cursor value {0!r} is out of range'.format(cursor_value))
+
+    return cursor_value
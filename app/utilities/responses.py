@@ -0,0 +1,17 @@
+from typing import Any, Iterable, Sequence, Type
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+from app.schemas.utilities.base import BaseData
+
+
+# Returned responses skip both of the `response_model` validation & `jsonable_encoder`,
+# while the documented schema is still the one of the `response_model`.
+def make_rows_response(rows: Iterable[Sequence[Any]], schema: Type[BaseData], response: Response) -> ORJSONResponse:
+    rows_response: ORJSONResponse = ORJSONResponse(content=schema.dump_rows(rows))
+
+    # Headers of the injected response are only merged by FastAPI into responses it makes itself
+    rows_response.headers.raw.extend(response.headers.raw)
+
+    return rows_response
@@ -0,0 +1,47 @@
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utilities.security.recent_writes import remember_recent_write
+
+
+UNIT_OF_WORK_STATE_KEY: str = 'unit_of_work_sessions'
+COMMITTED_WRITER_ID_KEY: str = 'committed_writer_id'
+
+
+def join_unit_of_work(request: Request, session: AsyncSession) -> AsyncSession:
+    if not hasattr(request.state, UNIT_OF_WORK_STATE_KEY):
+        setattr(request.state, UNIT_OF_WORK_STATE_KEY, [])
+
+    getattr(request.state, UNIT_OF_WORK_STATE_KEY).append(session)
+
+    return session
+
+async def commit_unit_of_work(request: Request, response: Response) -> None:
+    session: AsyncSession
+
+    for session in getattr(request.state, UNIT_OF_WORK_STATE_KEY, []):
+        await session.commit()
+
+        committed_writer_id: int | None = session.info.pop(COMMITTED_WRITER_ID_KEY, None)
+
+        if committed_writer_id is not None:
+            remember_recent_write(response, user_id=committed_writer_id)
+
+
+class UnitOfWorkRoute(APIRoute):
+    # Yield dependencies are closed only after the response is sent,
+    # so the sessions are committed here, once the endpoint has succeeded.
+    # Sessions of a failed endpoint are closed without a commit & roll back.
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler: Callable[[Request], Coroutine[Any, Any, Response]] = super().get_route_handler()
+
+        async def wrapper(request: Request) -> Response:
+            response: Response = await route_handler(request)
+            await commit_unit_of_work(request, response)
+
+            return response
+
+        return wrapper
@@ -1,3 +1,4 @@
 ALLOWED_ORIGINS: tuple[str, ...] = ('*',)
 ALLOWED_METHODS: tuple[str, ...] = ('GET', 'POST', 'PUT', 'DELETE')
 ALLOWED_HEADERS: tuple[str, ...] = ('*',)
+EXPOSED_HEADERS: tuple[str, ...] = ('X-Next-Cursor', 'ETag', 'X-Recent-Write')
@@ -1,32 +1,63 @@
 from datetime import datetime, timedelta
+from hashlib import sha256
+from time import time
+from typing import Any
 
-from jwt import InvalidTokenError, decode, encode
+from jwt import InvalidTokenError, PyJWT, encode
 
+from app.utilities.caching import TimedLruCache, register_cache_metrics
 from core.settings import settings
 
 
+ACCESS_TOKEN_LIFETIME: timedelta = timedelta(minutes=10)
+ACCESS_TOKEN_CACHE_SIZE: int = 4096
+
+_ACCESS_KEY: bytes = settings.JWT_ACCESS_SECRET_KEY.encode()
+_ACCESS_ALGORITHMS: list[str] = [
+    settings.JWT_ALGORITHM,
+]
+
+_jwt: PyJWT = PyJWT()
+
+
+# Verified tokens by their digests, each living no longer than the token itself
+access_token_cache: TimedLruCache[bytes, int] = TimedLruCache(
+    max_size=ACCESS_TOKEN_CACHE_SIZE,
+    time_to_live=ACCESS_TOKEN_LIFETIME.total_seconds(),
+)
+
+register_cache_metrics(access_token_cache, 'access_token_cache', 'Verified access tokens')
+
+
 def create_access_token(*, user_id: int) -> str:
-    payload: dict[str, int | datetime] = {
-        'sub': user_id,
-        'exp': datetime.utcnow() + timedelta(minutes=10),
+    payload: dict[str, str | datetime] = {
+        'sub': str(user_id),
+        'exp': datetime.utcnow() + ACCESS_TOKEN_LIFETIME,
     }
 
     return encode(
         payload=payload,
-        key=settings.JWT_ACCESS_SECRET_KEY,
+        key=_ACCESS_KEY,
         algorithm=settings.JWT_ALGORITHM,
     )
 
 def decode_access_token(token: str) -> tuple[int | None, str | None]:
+    token_digest: bytes = sha256(token.encode()).digest()
+    user_id: int | None = access_token_cache.get(token_digest)
+
+    if user_id is not None:
+        return (user_id, None)
+
     try:
-        payload: dict[str, int] = decode(
+        payload: dict[str, Any] = _jwt.decode(
             jwt=token,
-            key=settings.JWT_ACCESS_SECRET_KEY,
-            algorithms=[
-                settings.JWT_ALGORITHM,
-            ],
+            key=_ACCESS_KEY,
+            algorithms=_ACCESS_ALGORITHMS,
         )
     except InvalidTokenError:
         return (None, 'Token is invalid')
 
-    return (payload['sub'], None)
+    user_id = int(payload['sub'])
+    access_token_cache.set(token_digest, user_id, time_to_live=payload['exp'] - time())
+
+    return (user_id, None)
@@ -0,0 +1,42 @@
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+
+from core.settings import settings
+
+
+password_hasher: PasswordHasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# Argon2 releases the GIL, so the hashing runs in parallel with the event loop
+_password_hashing_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASHING_CONCURRENCY,
+    thread_name_prefix='password-hashing',
+)
+
+
+async def hash_password(password: str) -> str:
+    return await get_running_loop().run_in_executor(
+        _password_hashing_executor,
+        password_hasher.hash,
+        password,
+    )
+
+async def verify_password(password_hash: str, password: str) -> bool:
+    try:
+        return await get_running_loop().run_in_executor(
+            _password_hashing_executor,
+            password_hasher.verify,
+            password_hash,
+            password,
+        )
+    except VerifyMismatchError:
+        return False
+
+def check_password_needs_rehash(password_hash: str) -> bool:
+    return password_hasher.check_needs_rehash(password_hash)
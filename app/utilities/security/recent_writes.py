@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi import Response
+from jwt import InvalidTokenError, PyJWT, encode
+
+from core.settings import settings
+
+
+RECENT_WRITE_HEADER: str = 'X-Recent-Write'
+RECENT_WRITE_LIFETIME: timedelta = timedelta(seconds=settings.POSTGRES_READ_YOUR_WRITES_WINDOW)
+
+# The audience keeps markers & access tokens, which share the key, from passing for each other
+_RECENT_WRITE_AUDIENCE: str = 'recent-write'
+_RECENT_WRITE_KEY: bytes = settings.JWT_ACCESS_SECRET_KEY.encode()
+_RECENT_WRITE_ALGORITHMS: list[str] = [
+    settings.JWT_ALGORITHM,
+]
+
+_jwt: PyJWT = PyJWT()
+
+
+# Clients echo the marker of their last write back in the same header, so that any worker routes their reads
+# to the primary; a header, unlike a cookie, is sent by bearer token, mobile & cross-site clients alike
+def remember_recent_write(response: Response, *, user_id: int) -> None:
+    payload: dict[str, str | datetime] = {
+        'sub': str(user_id),
+        'aud': _RECENT_WRITE_AUDIENCE,
+        'exp': datetime.utcnow() + RECENT_WRITE_LIFETIME,
+    }
+
+    response.headers[RECENT_WRITE_HEADER] = encode(
+        payload=payload,
+        key=_RECENT_WRITE_KEY,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+
+def check_recent_write(token: str, *, user_id: int) -> bool:
+    try:
+        payload: dict[str, Any] = _jwt.decode(
+            jwt=token,
+            key=_RECENT_WRITE_KEY,
+            algorithms=_RECENT_WRITE_ALGORITHMS,
+            audience=_RECENT_WRITE_AUDIENCE,
+        )
+    except InvalidTokenError:
+        return False
+
+    return payload['sub'] == str(user_id)
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+from hashlib import sha256
+from secrets import token_urlsafe
+
+from sqlalchemy.event import listens_for
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.utilities.caching import TimedLruCache
+from app.utilities.exceptions.auth import UserUnauthorised
+from core.databases.repositories import RefreshTokenRepository
+
+
+REFRESH_TOKEN_LIFETIME: timedelta = timedelta(days=30)
+REFRESH_TOKEN_BYTES_NUMBER: int = 32
+REVOKED_REFRESH_TOKEN_CACHE_SIZE: int = 65536
+
+_REVOKED_TOKENS_KEY: str = 'revoked_refresh_tokens'
+
+
+# Owners of rotated & revoked tokens by their digests, to turn the tokens away without a query.
+# Tokens are put here only once their rotation or revocation is committed.
+revoked_refresh_tokens: TimedLruCache[bytes, int] = TimedLruCache(
+    max_size=REVOKED_REFRESH_TOKEN_CACHE_SIZE,
+    time_to_live=REFRESH_TOKEN_LIFETIME.total_seconds(),
+)
+
+
+def digest_refresh_token(refresh_token: str) -> bytes:
+    return sha256(refresh_token.encode()).digest()
+
+async def issue_refresh_token(user_id: int, session: AsyncSession) -> str:
+    refresh_token: str = token_urlsafe(REFRESH_TOKEN_BYTES_NUMBER)
+    current_time: datetime = datetime.utcnow()
+
+    refresh_token_repository: RefreshTokenRepository = RefreshTokenRepository(session=session)
+    await refresh_token_repository.delete_user_tokens(user_id, expired_before=current_time)
+    await refresh_token_repository.create(
+        record_data={
+            'user_id': user_id,
+            'token_digest': digest_refresh_token(refresh_token),
+            'expiration_time': current_time + REFRESH_TOKEN_LIFETIME,
+        },
+    )
+
+    return refresh_token
+
+async def rotate_refresh_token(refresh_token: str, session: AsyncSession) -> tuple[int, str]:
+    token_digest: bytes = digest_refresh_token(refresh_token)
+    revoked_token_user_id: int | None = revoked_refresh_tokens.get(token_digest)
+
+    if revoked_token_user_id is not None:
+        await _reject_reused_refresh_token(revoked_token_user_id, session)
+
+    current_time: datetime = datetime.utcnow()
+    token_entity: tuple[int, datetime, datetime] | None = await RefreshTokenRepository(session=session).rotate_by_digest(
+        token_digest,
+        rotation_time=current_time,
+    )
+
+    if token_entity is None or token_entity[1] <= current_time:
+        raise UserUnauthorised(message='Refresh token is invalid')
+
+    user_id: int = token_entity[0]
+
+    # Only the token, which has just been rotated, keeps the time of this request
+    if token_entity[2] != current_time:
+        await _reject_reused_refresh_token(user_id, session)
+
+    session.info.setdefault(_REVOKED_TOKENS_KEY, {})[token_digest] = user_id
+
+    return (user_id, await issue_refresh_token(user_id, session))
+
+async def revoke_refresh_token(refresh_token: str, session: AsyncSession) -> None:
+    token_digest: bytes = digest_refresh_token(refresh_token)
+
+    refresh_token_repository: RefreshTokenRepository = RefreshTokenRepository(session=session)
+    token_entity: tuple[int, datetime] | None = await refresh_token_repository.pop_by_digest(token_digest)
+
+    if token_entity is not None:
+        session.info.setdefault(_REVOKED_TOKENS_KEY, {})[token_digest] = token_entity[0]
+
+
+# A rotated token is never sent again by its client, so it must have leaked
+async def _reject_reused_refresh_token(user_id: int, session: AsyncSession) -> None:
+    refresh_token_repository: RefreshTokenRepository = RefreshTokenRepository(session=session)
+    await refresh_token_repository.delete_user_tokens(user_id)
+    await session.commit()
+
+    raise UserUnauthorised(message='Refresh token is revoked')
+
+@listens_for(Session, 'after_commit')
+def _remember_revoked_refresh_tokens(session: Session) -> None:
+    for (token_digest, user_id) in session.info.pop(_REVOKED_TOKENS_KEY, {}).items():
+        revoked_refresh_tokens.set(token_digest, user_id)
+
+@listens_for(Session, 'after_rollback')
+def _discard_revoked_refresh_tokens(session: Session) -> None:
+    session.info.pop(_REVOKED_TOKENS_KEY, None)
@@ -0,0 +1,45 @@
+from argparse import ArgumentParser, Namespace
+from json import dumps as dump_to_json
+from logging import INFO, Logger, basicConfig, getLogger
+from timeit import timeit
+from typing import Any
+
+from app.utilities.security.jwt import (
+    access_token_cache,
+    create_access_token,
+    decode_access_token,
+)
+
+
+logger: Logger = getLogger(__name__)
+
+
+def decode_without_cache(token: str) -> None:
+    access_token_cache.clear()
+    decode_access_token(token)
+
+def benchmark(repetitions_number: int) -> dict[str, Any]:
+    token: str = create_access_token(user_id=1)
+    decode_access_token(token)
+
+    uncached_time: float = timeit(lambda: decode_without_cache(token), number=repetitions_number)
+    cached_time: float = timeit(lambda: decode_access_token(token), number=repetitions_number)
+
+    return {
+        'repetitions_number': repetitions_number,
+        'uncached_us_per_decoding': round(uncached_time / repetitions_number * 1e6, 3),
+        'cached_us_per_decoding': round(cached_time / repetitions_number * 1e6, 3),
+    }
+
+
+if __name__ == '__main__':
+    basicConfig(level=INFO, format='%(message)s')
+
+    argument_parser: ArgumentParser = ArgumentParser(
+        description='Measure the overhead of decoding an access token with & without the cache',
+    )
+    argument_parser.add_argument('--repetitions-number', type=int, default=100000)
+
+    arguments: Namespace = argument_parser.parse_args()
+
+    logger.info(dump_to_json(benchmark(arguments.repetitions_number), indent=4))
@@ -0,0 +1,95 @@
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from datetime import date, time, timedelta
+from json import dumps as dump_to_json
+from logging import INFO, Logger, basicConfig, getLogger
+from time import perf_counter
+from typing import Any
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic.fields import ModelField
+
+from app.schemas.transaction import TransactionOutputData
+from core.databases.models import Transaction
+from core.databases.models.utilities.types import TransactionType
+
+
+logger: Logger = getLogger(__name__)
+
+
+def make_month_rows(rows_number: int) -> list[tuple[Any, ...]]:
+    return [
+        (
+            row_index + 1,
+            row_index % 5 + 1,
+            row_index % 20 + 1,
+            TransactionType.OUTCOME if row_index % 3 else TransactionType.INCOME,
+            date(year=2022, month=12, day=1) + timedelta(days=row_index % 31),
+            time(hour=row_index % 24, minute=row_index % 60),
+            row_index % 1000 + 0.5,
+            'Note {0}'.format(row_index),
+        )
+        for row_index in range(rows_number)
+    ]
+
+async def render_response_model(response_field: ModelField, transactions: list[Transaction]) -> bytes:
+    response_content: Any = await serialize_response(
+        field=response_field,
+        response_content=transactions,
+        is_coroutine=True,
+    )
+
+    return JSONResponse(content=response_content).body
+
+def render_rows(rows: list[tuple[Any, ...]]) -> bytes:
+    return ORJSONResponse(content=TransactionOutputData.dump_rows(rows)).body
+
+async def benchmark(rows_number: int, repetitions_number: int) -> dict[str, Any]:
+    rows: list[tuple[Any, ...]] = make_month_rows(rows_number)
+    transactions: list[Transaction] = [
+        Transaction(**dict(zip(TransactionOutputData.__fields__, row)))
+        for row in rows
+    ]
+    response_field: ModelField = create_response_field(name='transactions', type_=list[TransactionOutputData])
+
+    response_model_body: bytes = await render_response_model(response_field, transactions)
+
+    if response_model_body != render_rows(rows):
+        raise AssertionError('Both of the paths are expected to render the same body')
+
+    started_time: float = perf_counter()
+
+    for _ in range(repetitions_number):
+        await render_response_model(response_field, transactions)
+
+    response_model_time: float = (perf_counter() - started_time) / repetitions_number
+    started_time = perf_counter()
+
+    for _ in range(repetitions_number):
+        render_rows(rows)
+
+    rows_time: float = (perf_counter() - started_time) / repetitions_number
+
+    return {
+        'rows_number': rows_number,
+        'body_bytes_number': len(response_model_body),
+        'response_model_ms_per_response': round(response_model_time * 1e3, 2),
+        'rows_ms_per_response': round(rows_time * 1e3, 2),
+        'speedup': round(response_model_time / rows_time, 1),
+    }
+
+
+if __name__ == '__main__':
+    basicConfig(level=INFO, format='%(message)s')
+
+    argument_parser: ArgumentParser = ArgumentParser(
+        description='Compare rendering a month of transactions through the response model & from rows',
+    )
+    argument_parser.add_argument('--rows-number', type=int, default=10000)
+    argument_parser.add_argument('--repetitions-number', type=int, default=20)
+
+    arguments: Namespace = argument_parser.parse_args()
+
+    logger.info(dump_to_json(run(benchmark(arguments.rows_number, arguments.repetitions_number)), indent=4))
@@ -0,0 +1,245 @@
+from argparse import ArgumentParser, Namespace
+from asyncio import gather, run
+from collections import defaultdict
+from datetime import date, timedelta
+from json import dumps as dump_to_json
+from logging import INFO, WARNING, Logger, basicConfig, getLogger
+from random import Random
+from statistics import quantiles
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+from fastapi import status
+from httpx import ASGITransport, AsyncClient, Response
+
+from app import api
+
+
+BENCHMARK_PASSWORD: str = 'benchmark-password'
+SEEDED_TRANSACTIONS_NUMBER: int = 300
+SEEDED_DAYS_NUMBER: int = 90
+
+
+logger: Logger = getLogger(__name__)
+
+
+class SyntheticUser:
+    def __init__(self, client: AsyncClient, random: Random) -> None:
+        self.client = client
+        self.random = random
+
+        self.headers: dict[str, str] = {}
+        self.account_id: int = 0
+        self.category_ids: dict[str, int] = {}
+        self.transaction_ids: list[int] = []
+
+        # Entity tags are kept per URL, as clients with an HTTP cache do
+        self.entity_tags: dict[str, str] = {}
+
+    async def sign_up(self) -> None:
+        response: Response = await self.client.post('/sign-up', json={
+            'username': 'load-{0}'.format(uuid4().hex[:16]),
+            'password': BENCHMARK_PASSWORD,
+        })
+        response.raise_for_status()
+
+        self.headers['Authorization'] = 'Bearer {0}'.format(response.json()['access_token'])
+
+        response = await self.client.post('/account/create', headers=self.headers, json={
+            'name': 'Load account',
+            'currency': 'USD',
+        })
+        response.raise_for_status()
+
+        self.account_id = response.json()['id']
+
+        for category_type in ('Income', 'Outcome'):
+            response = await self.client.post('/category/create', headers=self.headers, json={
+                'base_category_id': None,
+                'name': '{0} category'.format(category_type),
+                'type': category_type,
+            })
+            response.raise_for_status()
+
+            self.category_ids[category_type] = response.json()['id']
+
+        response = await self.client.post('/transaction/import', headers=self.headers, json=[
+            self.make_transaction_data(date.today() - timedelta(days=self.random.randrange(SEEDED_DAYS_NUMBER)))
+            for _ in range(SEEDED_TRANSACTIONS_NUMBER)
+        ])
+        response.raise_for_status()
+
+    def make_transaction_data(self, due_date: date) -> dict[str, Any]:
+        transaction_type: str = self.random.choices(('Income', 'Outcome'), weights=(1, 4))[0]
+
+        return {
+            'account_id': self.account_id,
+            'category_id': self.category_ids[transaction_type],
+            'type': transaction_type,
+            'due_date': due_date.isoformat(),
+            'due_time': '{0:02}:{1:02}'.format(self.random.randrange(24), self.random.randrange(60)),
+            'amount': round(self.random.uniform(1, 500), 2),
+            'note': '',
+        }
+
+    async def get(self, url: str, **query_parameters: Any) -> Response:
+        cache_key: str = '{0}?{1}'.format(url, sorted(query_parameters.items()))
+        headers: dict[str, str] = dict(self.headers)
+
+        if cache_key in self.entity_tags:
+            headers['If-None-Match'] = self.entity_tags[cache_key]
+
+        response: Response = await self.client.get(url, params=query_parameters, headers=headers)
+
+        if 'ETag' in response.headers:
+            self.entity_tags[cache_key] = response.headers['ETag']
+
+        return response
+
+    async def get_transactions(self) -> Response:
+        today_date: date = date.today()
+
+        return await self.get('/transaction/list', year=today_date.year, month=today_date.month)
+
+    async def get_periods(self) -> Response:
+        return await self.get('/transaction/periods')
+
+    async def get_summary(self) -> Response:
+        return await self.get('/trend/summary')
+
+    async def get_last_n_days(self) -> Response:
+        return await self.get('/trend/last-n-days')
+
+    async def get_current_month(self) -> Response:
+        return await self.get('/trend/current-month')
+
+    async def get_balances(self) -> Response:
+        return await self.get('/account/balances')
+
+    async def get_categories(self) -> Response:
+        return await self.get('/category/list')
+
+    async def create_transaction(self) -> Response:
+        response: Response = await self.client.post(
+            '/transaction/create',
+            headers=self.headers,
+            json=self.make_transaction_data(date.today()),
+        )
+
+        if response.status_code == status.HTTP_201_CREATED:
+            self.transaction_ids.append(response.json()['id'])
+
+        return response
+
+    async def update_transaction(self) -> Response:
+        if not self.transaction_ids:
+            return await self.create_transaction()
+
+        return await self.client.patch(
+            '/transaction/update',
+            headers=self.headers,
+            params={'id': self.random.choice(self.transaction_ids)},
+            json={'amount': round(self.random.uniform(1, 500), 2)},
+        )
+
+    async def delete_transaction(self) -> Response:
+        if not self.transaction_ids:
+            return await self.create_transaction()
+
+        return await self.client.delete(
+            '/transaction/delete',
+            headers=self.headers,
+            params={'id': self.transaction_ids.pop(self.random.randrange(len(self.transaction_ids)))},
+        )
+
+
+# Screens are opened far more often than transactions are entered
+OPERATION_WEIGHTS: dict[Callable[[SyntheticUser], Awaitable[Response]], int] = {
+    SyntheticUser.get_transactions: 20,
+    SyntheticUser.get_periods: 10,
+    SyntheticUser.get_summary: 10,
+    SyntheticUser.get_last_n_days: 10,
+    SyntheticUser.get_current_month: 10,
+    SyntheticUser.get_balances: 10,
+    SyntheticUser.get_categories: 10,
+    SyntheticUser.create_transaction: 10,
+    SyntheticUser.update_transaction: 5,
+    SyntheticUser.delete_transaction: 5,
+}
+
+
+async def run_user(user: SyntheticUser, deadline: float, latencies: defaultdict[str, list[float]], statuses: defaultdict[str, defaultdict[int, int]]) -> None:
+    operations: list[Callable[[SyntheticUser], Awaitable[Response]]] = list(OPERATION_WEIGHTS)
+    weights: list[int] = list(OPERATION_WEIGHTS.values())
+
+    while perf_counter() < deadline:
+        operation: Callable[[SyntheticUser], Awaitable[Response]] = user.random.choices(operations, weights=weights)[0]
+
+        started_time: float = perf_counter()
+        response: Response = await operation(user)
+        latency: float = perf_counter() - started_time
+
+        route: str = '{0} {1}'.format(response.request.method, response.request.url.path)
+        latencies[route].append(latency)
+        statuses[route][response.status_code] += 1
+
+def summarise_latencies(latencies: list[float], duration: float) -> dict[str, Any]:
+    percentiles: list[float] = quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+
+    return {
+        'requests_number': len(latencies),
+        'requests_per_second': round(len(latencies) / duration, 2),
+        'p50_ms': round(percentiles[49] * 1000, 3),
+        'p95_ms': round(percentiles[94] * 1000, 3),
+        'p99_ms': round(percentiles[98] * 1000, 3),
+    }
+
+async def benchmark(base_url: str | None, users_number: int, duration: float, seed: int) -> dict[str, Any]:
+    client: AsyncClient = AsyncClient(base_url=base_url, timeout=None) if base_url else AsyncClient(
+        transport=ASGITransport(app=api),
+        base_url='http://benchmark',
+        timeout=None,
+    )
+
+    async with client:
+        users: list[SyntheticUser] = [SyntheticUser(client, Random(seed + user_index)) for user_index in range(users_number)]
+
+        for user in users:
+            await user.sign_up()
+
+        latencies: defaultdict[str, list[float]] = defaultdict(list)
+        statuses: defaultdict[str, defaultdict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+        started_time: float = perf_counter()
+        await gather(*(run_user(user, started_time + duration, latencies, statuses) for user in users))
+        elapsed_time: float = perf_counter() - started_time
+
+    return {
+        'target': base_url or 'in-process',
+        'users_number': users_number,
+        'duration_s': round(elapsed_time, 3),
+        'seed': seed,
+        'total': summarise_latencies([latency for route_latencies in latencies.values() for latency in route_latencies], elapsed_time),
+        'routes': {
+            route: summarise_latencies(route_latencies, elapsed_time) | {'statuses': dict(sorted(statuses[route].items()))}
+            for (route, route_latencies) in sorted(latencies.items())
+        },
+    }
+
+
+if __name__ == '__main__':
+    basicConfig(level=INFO, format='%(message)s')
+    getLogger('httpx').setLevel(WARNING)
+
+    argument_parser: ArgumentParser = ArgumentParser(
+        description='Drive the API with a mix of reads & writes of synthetic users and report throughput & latencies per route',
+    )
+    argument_parser.add_argument('--base-url', help='URL of a running server, e.g. a local gunicorn; the app is run in-process if omitted')
+    argument_parser.add_argument('--users-number', type=int, default=20)
+    argument_parser.add_argument('--duration', type=float, default=30, help='seconds of the load, excluding the set-up of the users')
+    argument_parser.add_argument('--seed', type=int, default=0)
+
+    arguments: Namespace = argument_parser.parse_args()
+
+    logger.info(dump_to_json(run(benchmark(arguments.base_url, arguments.users_number, arguments.duration, arguments.seed)), indent=4))
@@ -0,0 +1,85 @@
+from argparse import ArgumentParser, Namespace
+from asyncio import gather, run
+from json import dumps as dump_to_json
+from logging import INFO, WARNING, Logger, basicConfig, getLogger
+from statistics import quantiles
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+from httpx import ASGITransport, AsyncClient, BasicAuth, Response
+
+from app import api
+
+
+PROBE_ENDPOINT: str = '/user/current'
+BENCHMARK_PASSWORD: str = 'benchmark-password'
+
+
+logger: Logger = getLogger(__name__)
+
+
+async def probe_latencies(client: AsyncClient, headers: dict[str, str], probes_number: int) -> list[float]:
+    latencies: list[float] = []
+
+    for _ in range(probes_number):
+        started_time: float = perf_counter()
+        response: Response = await client.get(PROBE_ENDPOINT, headers=headers)
+        latencies.append(perf_counter() - started_time)
+
+        response.raise_for_status()
+
+    return latencies
+
+async def sign_in(client: AsyncClient, username: str) -> None:
+    response: Response = await client.get('/sign-in', auth=BasicAuth(username, BENCHMARK_PASSWORD))
+    response.raise_for_status()
+
+def summarise_latencies(latencies: list[float]) -> dict[str, float]:
+    percentiles: list[float] = quantiles(latencies, n=100)
+
+    return {
+        'p50_ms': round(percentiles[49] * 1000, 3),
+        'p99_ms': round(percentiles[98] * 1000, 3),
+    }
+
+async def benchmark(burst_size: int, probes_number: int) -> dict[str, Any]:
+    async with AsyncClient(transport=ASGITransport(app=api), base_url='http://benchmark') as client:
+        username: str = 'benchmark-{0}'.format(uuid4().hex[:16])
+        response: Response = await client.post('/sign-up', json={
+            'username': username,
+            'password': BENCHMARK_PASSWORD,
+        })
+        response.raise_for_status()
+
+        headers: dict[str, str] = {
+            'Authorization': 'Bearer {0}'.format(response.json()['access_token']),
+        }
+
+        idle_latencies: list[float] = await probe_latencies(client, headers, probes_number)
+        (burst_latencies, *_) = await gather(
+            probe_latencies(client, headers, probes_number),
+            *(sign_in(client, username) for _ in range(burst_size)),
+        )
+
+    return {
+        'endpoint': PROBE_ENDPOINT,
+        'burst_size': burst_size,
+        'idle': summarise_latencies(idle_latencies),
+        'during_sign_in_burst': summarise_latencies(burst_latencies),
+    }
+
+
+if __name__ == '__main__':
+    basicConfig(level=INFO, format='%(message)s')
+    getLogger('httpx').setLevel(WARNING)
+
+    argument_parser: ArgumentParser = ArgumentParser(
+        description='Measure latencies of an endpoint while a burst of sign-ins is being handled',
+    )
+    argument_parser.add_argument('--burst-size', type=int, default=50)
+    argument_parser.add_argument('--probes-number', type=int, default=200)
+
+    arguments: Namespace = argument_parser.parse_args()
+
+    logger.info(dump_to_json(run(benchmark(arguments.burst_size, arguments.probes_number)), indent=4))
@@ -0,0 +1,443 @@
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from collections import defaultdict
+from datetime import date, time, timedelta
+from itertools import accumulate
+from json import dumps as dump_to_json
+from logging import INFO, Logger, basicConfig, getLogger
+from random import Random
+from time import perf_counter
+from typing import Any, Iterator
+
+from argon2.low_level import hash_secret
+from sqlalchemy import Result, bindparam, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.utilities.security.passwords import password_hasher
+from core.databases.models import (
+    Account,
+    Budget,
+    Category,
+    DailyTransactionRollup,
+    Family,
+    Transaction,
+    User,
+)
+from core.databases.models.utilities.base import BaseModel
+from core.databases.models.utilities.types import (
+    BudgetType,
+    CategoryType,
+    CurrencyType,
+    TransactionType,
+)
+from core.databases.repositories import DailyTransactionRollupRepository
+from core.databases.sessions import postgres_engine
+
+
+SYNTHETIC_PASSWORD: str = 'synthetic-password'
+
+# Histories end on a fixed date rather than today, so that the same seed produces the same dataset on any day
+DEFAULT_LAST_DATE: date = date(year=2024, month=12, day=31)
+
+FAMILY_USERS_SHARE: float = 0.3
+MAX_FAMILY_MEMBERS_NUMBER: int = 4
+
+# Shape of the Pareto distribution of transactions among users, so that a few of them are far more active
+TRANSACTIONS_PARETO_ALPHA: float = 1.5
+
+OUTCOME_CATEGORY_NAMES: tuple[str, ...] = (
+    'Groceries',
+    'Restaurants',
+    'Transport',
+    'Housing',
+    'Utilities',
+    'Health',
+    'Clothes',
+    'Entertainment',
+    'Education',
+    'Travel',
+    'Gifts',
+)
+INCOME_CATEGORY_NAMES: tuple[str, ...] = ('Salary', 'Freelance', 'Interest', 'Cashback')
+# Categories are either incomes or outcomes, while transactions require one anyway
+TRANSFER_CATEGORY_NAME: str = 'Transfers'
+ACCOUNT_NAMES: tuple[str, ...] = ('Card', 'Cash', 'Savings', 'Credit card')
+
+CURRENCY_WEIGHTS: dict[CurrencyType, float] = {
+    CurrencyType.RUB: 7,
+    CurrencyType.USD: 3,
+}
+TRANSACTION_TYPE_WEIGHTS: dict[TransactionType, float] = {
+    TransactionType.OUTCOME: 85,
+    TransactionType.INCOME: 10,
+    TransactionType.TRANSFER: 5,
+}
+
+# Means & standard deviations of the logarithms of amounts
+AMOUNT_DISTRIBUTIONS: dict[TransactionType, tuple[float, float]] = {
+    TransactionType.OUTCOME: (3, 1.2),
+    TransactionType.INCOME: (7.5, 0.5),
+    TransactionType.TRANSFER: (5.5, 1),
+}
+
+# Transactions happen mostly in the daytime, one weight per hour
+HOUR_WEIGHTS: tuple[float, ...] = (1, 1, 1, 1, 1, 2, 4, 8, 10, 10, 10, 12, 14, 12, 10, 10, 10, 12, 14, 14, 12, 8, 4, 2)
+
+FAMILY_COLUMNS: tuple[str, ...] = ('id', 'access_code')
+USER_COLUMNS: tuple[str, ...] = ('id', 'family_id', 'username', 'password')
+ACCOUNT_COLUMNS: tuple[str, ...] = ('id', 'user_id', 'name', 'currency', 'opening_balance')
+BUDGET_COLUMNS: tuple[str, ...] = ('id', 'user_id', 'name', 'type', 'planned_outcomes')
+CATEGORY_COLUMNS: tuple[str, ...] = ('id', 'user_id', 'base_category_id', 'budget_id', 'name', 'type')
+TRANSACTION_COLUMNS: tuple[str, ...] = (
+    'account_id',
+    'category_id',
+    'user_id',
+    'family_id',
+    'type',
+    'due_date',
+    'due_time',
+    'amount',
+    'note',
+)
+
+
+logger: Logger = getLogger(__name__)
+
+
+class SyntheticUser:
+    def __init__(self, user_id: int, family_id: int | None) -> None:
+        self.id = user_id
+        self.family_id = family_id
+
+        self.account_ids: list[int] = []
+        self.account_cumulative_weights: list[float] = []
+        self.category_ids: dict[TransactionType, list[int]] = {}
+        self.category_cumulative_weights: dict[TransactionType, list[float]] = {}
+
+        self.first_day_index: int = 0
+        self.transactions_number: int = 0
+
+
+class SyntheticDataset:
+    def __init__(
+        self,
+        seed: int,
+        users_number: int,
+        transactions_number: int,
+        years_number: int,
+        last_date: date,
+        first_ids: dict[str, int],
+    ) -> None:
+        self.random = Random(seed)
+        self.seed = seed
+        self.next_ids = dict(first_ids)
+
+        self.dates: list[date] = [last_date - timedelta(days=day_index) for day_index in reversed(range(365 * years_number))]
+        self.times: list[time] = [time(hour, minute) for hour in range(24) for minute in range(60)]
+        self.time_cumulative_weights: list[float] = list(accumulate(HOUR_WEIGHTS[time_value.hour] for time_value in self.times))
+
+        self.families: list[tuple[Any, ...]] = []
+        self.users: list[tuple[Any, ...]] = []
+        self.accounts: list[tuple[Any, ...]] = []
+        self.budgets: list[tuple[Any, ...]] = []
+        self.categories: list[tuple[Any, ...]] = []
+        self.synthetic_users: list[SyntheticUser] = []
+
+        # Balances are accumulated while transactions are generated, as accounts have no index to sum them in SQL
+        self.transactions_balances: defaultdict[int, float] = defaultdict(float)
+
+        self._generate_users(users_number)
+        self._distribute_transactions(transactions_number)
+
+    def generate_transactions(self) -> Iterator[tuple[Any, ...]]:
+        transaction_types: list[TransactionType] = list(TRANSACTION_TYPE_WEIGHTS)
+        transaction_type_cumulative_weights: list[float] = list(accumulate(TRANSACTION_TYPE_WEIGHTS.values()))
+
+        for synthetic_user in self.synthetic_users:
+            transactions_number: int = synthetic_user.transactions_number
+
+            day_indices: list[int] = sorted(self.random.choices(range(synthetic_user.first_day_index, len(self.dates)), k=transactions_number))
+            types: list[TransactionType] = self.random.choices(transaction_types, cum_weights=transaction_type_cumulative_weights, k=transactions_number)
+            account_ids: list[int] = self.random.choices(
+                synthetic_user.account_ids,
+                cum_weights=synthetic_user.account_cumulative_weights,
+                k=transactions_number,
+            )
+            times: list[time] = self.random.choices(self.times, cum_weights=self.time_cumulative_weights, k=transactions_number)
+            category_ids: dict[TransactionType, Iterator[int]] = {
+                transaction_type: iter(self.random.choices(
+                    synthetic_user.category_ids[transaction_type],
+                    cum_weights=synthetic_user.category_cumulative_weights[transaction_type],
+                    k=types.count(transaction_type),
+                ))
+                for transaction_type in transaction_types
+            }
+
+            for (day_index, transaction_type, account_id, due_time) in zip(day_indices, types, account_ids, times):
+                due_date: date = self.dates[day_index]
+                amount: float = round(self.random.lognormvariate(*AMOUNT_DISTRIBUTIONS[transaction_type]), 2)
+
+                if transaction_type is TransactionType.INCOME:
+                    self.transactions_balances[account_id] += amount
+                elif transaction_type is TransactionType.OUTCOME:
+                    self.transactions_balances[account_id] -= amount
+
+                yield (
+                    account_id,
+                    next(category_ids[transaction_type]),
+                    synthetic_user.id,
+                    synthetic_user.family_id,
+                    transaction_type,
+                    due_date,
+                    due_time,
+                    amount,
+                    '',
+                )
+
+    def _allocate_id(self, table_name: str) -> int:
+        self.next_ids[table_name] += 1
+
+        return self.next_ids[table_name]
+
+    def _generate_users(self, users_number: int) -> None:
+        # The salt is drawn from the seed as well, so that even password hashes are reproducible
+        password_hash: str = hash_secret(
+            secret=SYNTHETIC_PASSWORD.encode(),
+            salt=self.random.randbytes(password_hasher.salt_len),
+            time_cost=password_hasher.time_cost,
+            memory_cost=password_hasher.memory_cost,
+            parallelism=password_hasher.parallelism,
+            hash_len=password_hasher.hash_len,
+            type=password_hasher.type,
+        ).decode()
+        family_id: int | None = None
+        family_members_number: int = 0
+
+        for user_index in range(users_number):
+            if family_members_number <= 0 and self.random.random() < FAMILY_USERS_SHARE:
+                family_id = self._allocate_id(Family.__tablename__)
+                family_members_number = self.random.randint(2, MAX_FAMILY_MEMBERS_NUMBER)
+
+                self.families.append((family_id, 'synthetic-{0}-{1}'.format(self.seed, family_id)))
+            elif family_members_number <= 0:
+                family_id = None
+
+            family_members_number -= 1
+
+            synthetic_user: SyntheticUser = SyntheticUser(self._allocate_id(User.__tablename__), family_id)
+            self.users.append((synthetic_user.id, family_id, 'synthetic-{0}-{1}'.format(self.seed, user_index), password_hash))
+            self.synthetic_users.append(synthetic_user)
+
+            self._generate_accounts(synthetic_user)
+            self._generate_categories(synthetic_user, self._generate_budgets(synthetic_user))
+
+    def _generate_accounts(self, synthetic_user: SyntheticUser) -> None:
+        currencies: list[CurrencyType] = list(CURRENCY_WEIGHTS)
+
+        for account_name in ACCOUNT_NAMES[:self.random.randint(1, len(ACCOUNT_NAMES))]:
+            account_id: int = self._allocate_id(Account.__tablename__)
+
+            self.accounts.append((
+                account_id,
+                synthetic_user.id,
+                account_name,
+                self.random.choices(currencies, weights=CURRENCY_WEIGHTS.values())[0],
+                round(self.random.uniform(0, 10000), 2),
+            ))
+            synthetic_user.account_ids.append(account_id)
+
+        # The first account is the main one, the rest are used less & less
+        synthetic_user.account_cumulative_weights = list(accumulate(1 / account_rank for account_rank in range(1, len(synthetic_user.account_ids) + 1)))
+
+    def _generate_budgets(self, synthetic_user: SyntheticUser) -> list[int]:
+        budget_types: list[BudgetType] = [BudgetType.PERSONAL, BudgetType.JOINT] if synthetic_user.family_id else [BudgetType.PERSONAL]
+        budget_ids: list[int] = []
+
+        for budget_index in range(self.random.randint(0, 3)):
+            budget_id: int = self._allocate_id(Budget.__tablename__)
+
+            self.budgets.append((
+                budget_id,
+                synthetic_user.id,
+                'Budget #{0}'.format(budget_index + 1),
+                self.random.choice(budget_types),
+                round(self.random.uniform(100, 5000), 2),
+            ))
+            budget_ids.append(budget_id)
+
+        return budget_ids
+
+    def _generate_categories(self, synthetic_user: SyntheticUser, budget_ids: list[int]) -> None:
+        category_names: dict[TransactionType, tuple[str, ...]] = {
+            TransactionType.OUTCOME: OUTCOME_CATEGORY_NAMES,
+            TransactionType.INCOME: INCOME_CATEGORY_NAMES,
+        }
+
+        for (transaction_type, base_category_names) in category_names.items():
+            leaf_category_ids: list[int] = []
+
+            for base_category_name in self.random.sample(base_category_names, self.random.randint(1, len(base_category_names))):
+                base_category_id: int = self._allocate_id(Category.__tablename__)
+                budget_id: int | None = self.random.choice([None, *budget_ids]) if transaction_type is TransactionType.OUTCOME else None
+
+                self.categories.append((base_category_id, synthetic_user.id, None, budget_id, base_category_name, CategoryType(transaction_type)))
+
+                subcategories_number: int = self.random.randint(0, 3) if transaction_type is TransactionType.OUTCOME else 0
+
+                for subcategory_index in range(subcategories_number):
+                    subcategory_id: int = self._allocate_id(Category.__tablename__)
+
+                    self.categories.append((
+                        subcategory_id,
+                        synthetic_user.id,
+                        base_category_id,
+                        budget_id,
+                        '{0} #{1}'.format(base_category_name, subcategory_index + 1),
+                        CategoryType(transaction_type),
+                    ))
+                    leaf_category_ids.append(subcategory_id)
+
+                if not subcategories_number:
+                    leaf_category_ids.append(base_category_id)
+
+            # Popularity of categories follows Zipf's law
+            synthetic_user.category_ids[transaction_type] = leaf_category_ids
+            synthetic_user.category_cumulative_weights[transaction_type] = list(accumulate(
+                1 / category_rank for category_rank in range(1, len(leaf_category_ids) + 1)
+            ))
+
+        transfer_category_id: int = self._allocate_id(Category.__tablename__)
+
+        self.categories.append((transfer_category_id, synthetic_user.id, None, None, TRANSFER_CATEGORY_NAME, CategoryType.OUTCOME))
+        synthetic_user.category_ids[TransactionType.TRANSFER] = [transfer_category_id]
+        synthetic_user.category_cumulative_weights[TransactionType.TRANSFER] = [1]
+
+    def _distribute_transactions(self, transactions_number: int) -> None:
+        weights: list[float] = [self.random.paretovariate(TRANSACTIONS_PARETO_ALPHA) for _ in self.synthetic_users]
+        weights_sum: float = sum(weights)
+
+        for (synthetic_user, weight) in zip(self.synthetic_users, weights):
+            synthetic_user.transactions_number = int(transactions_number * weight / weights_sum)
+
+            # Most users have kept their books from the very beginning, some joined later
+            synthetic_user.first_day_index = int(len(self.dates) * self.random.random() ** 3)
+
+        for synthetic_user_index in range(transactions_number - sum(synthetic_user.transactions_number for synthetic_user in self.synthetic_users)):
+            self.synthetic_users[synthetic_user_index].transactions_number += 1
+
+
+async def generate_dataset(users_number: int, transactions_number: int, years_number: int, last_date: date, seed: int) -> dict[str, Any]:
+    started_time: float = perf_counter()
+    models: tuple[type[BaseModel], ...] = (Family, User, Account, Budget, Category)
+
+    async with postgres_engine.begin() as connection:
+        first_ids: dict[str, int] = {
+            model.__tablename__: await connection.scalar(select(func.COALESCE(func.MAX(model.id), 0)))
+            for model in models
+        }
+
+        dataset: SyntheticDataset = SyntheticDataset(seed, users_number, transactions_number, years_number, last_date, first_ids)
+
+        # Parents are loaded before children, so that foreign keys are satisfied
+        await _copy_records(connection, Family, FAMILY_COLUMNS, dataset.families)
+        await _copy_records(connection, User, USER_COLUMNS, dataset.users)
+        await _copy_records(connection, Account, ACCOUNT_COLUMNS, dataset.accounts)
+        await _copy_records(connection, Budget, BUDGET_COLUMNS, dataset.budgets)
+        await _copy_records(connection, Category, CATEGORY_COLUMNS, dataset.categories)
+
+        # Checking foreign keys row by row dominates the load, so they are validated at once afterwards
+        foreign_keys: dict[str, dict[str, str]] = {
+            model.__tablename__: await _drop_foreign_keys(connection, model)
+            for model in (Transaction, DailyTransactionRollup)
+        }
+
+        await _copy_records(connection, Transaction, TRANSACTION_COLUMNS, dataset.generate_transactions())
+
+        async with AsyncSession(bind=connection) as session:
+            await DailyTransactionRollupRepository(session=session).rebuild(
+                user_ids=[synthetic_user.id for synthetic_user in dataset.synthetic_users],
+            )
+
+        for (table_name, table_foreign_keys) in foreign_keys.items():
+            for (constraint_name, constraint_definition) in table_foreign_keys.items():
+                await connection.execute(text('ALTER TABLE "{0}" ADD CONSTRAINT "{1}" {2}'.format(table_name, constraint_name, constraint_definition)))
+
+        if dataset.transactions_balances:
+            await connection.execute(
+                update(Account).where(
+                    Account.id == bindparam('account_id'),
+                ).values(
+                    transactions_balance=bindparam('transactions_balance'),
+                ),
+                [
+                    {'account_id': account_id, 'transactions_balance': transactions_balance}
+                    for (account_id, transactions_balance) in dataset.transactions_balances.items()
+                ],
+            )
+
+        # Records were copied with explicit IDs, which sequences know nothing about
+        for model in models:
+            if dataset.next_ids[model.__tablename__] > first_ids[model.__tablename__]:
+                await connection.execute(
+                    select(func.setval(func.pg_get_serial_sequence('"{0}"'.format(model.__tablename__), 'id'), dataset.next_ids[model.__tablename__])),
+                )
+
+    return {
+        'seed': seed,
+        'families_number': len(dataset.families),
+        'users_number': len(dataset.users),
+        'accounts_number': len(dataset.accounts),
+        'budgets_number': len(dataset.budgets),
+        'categories_number': len(dataset.categories),
+        'transactions_number': transactions_number,
+        'first_date': dataset.dates[0].isoformat(),
+        'last_date': dataset.dates[-1].isoformat(),
+        'password': SYNTHETIC_PASSWORD,
+        'elapsed_time_s': round(perf_counter() - started_time, 3),
+    }
+
+
+async def _drop_foreign_keys(connection: AsyncConnection, model: type[BaseModel]) -> dict[str, str]:
+    query_result: Result[tuple[str, str]] = await connection.execute(
+        text("SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = CAST(:table_name AS regclass) AND contype = 'f'"),
+        {'table_name': '"{0}"'.format(model.__tablename__)},
+    )
+    foreign_keys: dict[str, str] = dict(query_result.tuples().all())
+
+    for constraint_name in foreign_keys:
+        await connection.execute(text('ALTER TABLE "{0}" DROP CONSTRAINT "{1}"'.format(model.__tablename__, constraint_name)))
+
+    return foreign_keys
+
+async def _copy_records(connection: AsyncConnection, model: type[BaseModel], columns: tuple[str, ...], records: Any) -> None:
+    raw_connection: Any = await connection.get_raw_connection()
+
+    await raw_connection.driver_connection.copy_records_to_table(model.__tablename__, records=records, columns=columns)
+
+
+if __name__ == '__main__':
+    basicConfig(level=INFO, format='%(message)s')
+
+    argument_parser: ArgumentParser = ArgumentParser(
+        description='Load a deterministic synthetic dataset of users, families, accounts, categories, budgets & transactions with COPY',
+    )
+    argument_parser.add_argument('--users-number', type=int, default=1000)
+    argument_parser.add_argument('--transactions-number', type=int, default=1000000)
+    argument_parser.add_argument('--years-number', type=int, default=5, help='length of the history of transactions')
+    argument_parser.add_argument(
+        '--end-date',
+        type=date.fromisoformat,
+        default=DEFAULT_LAST_DATE,
+        help='last date of the history of transactions in the ISO format, {0} by default'.format(DEFAULT_LAST_DATE.isoformat()),
+    )
+    argument_parser.add_argument('--seed', type=int, default=0, help='the same seed produces the same dataset on an empty database')
+
+    arguments: Namespace = argument_parser.parse_args()
+
+    logger.info(dump_to_json(run(generate_dataset(
+        users_number=arguments.users_number,
+        transactions_number=arguments.transactions_number,
+        years_number=arguments.years_number,
+        last_date=arguments.end_date,
+        seed=arguments.seed,
+    )), indent=4))
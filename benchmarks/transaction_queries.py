@@ -0,0 +1,79 @@
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from datetime import date, timedelta
+from json import dumps as dump_to_json
+from logging import INFO, Logger, basicConfig, getLogger
+from time import process_time
+from typing import Any, Awaitable, Callable
+
+from core.databases.metrics import compiled_cache_statistics
+from core.databases.models.utilities.types import TransactionType
+from core.databases.repositories import TransactionRepository
+from core.databases.sessions import PostgresSession
+
+
+logger: Logger = getLogger(__name__)
+
+
+async def measure_python_time(query_call: Callable[[], Awaitable[Any]], repetitions_number: int) -> float:
+    await query_call()
+
+    started_time: float = process_time()
+
+    for _ in range(repetitions_number):
+        await query_call()
+
+    return (process_time() - started_time) / repetitions_number
+
+async def benchmark(user_id: int, repetitions_number: int) -> dict[str, Any]:
+    today_date: date = date.today()
+    query_calls: dict[str, Callable[[TransactionRepository], Awaitable[Any]]] = {
+        'periods': lambda repository: repository.get_user_transaction_periods(user_id),
+        'summary': lambda repository: repository.get_user_transaction_sums_for_summary_periods(
+            user_id=user_id,
+            transaction_types=(TransactionType.INCOME, TransactionType.OUTCOME),
+        ),
+        'last_n_days': lambda repository: repository.get_user_transaction_sums_by_dates(
+            user_id=user_id,
+            transaction_type=TransactionType.OUTCOME,
+            first_date=today_date - timedelta(days=6),
+            last_date=today_date,
+        ),
+        'current_month': lambda repository: repository.get_current_month_user_transaction_trend(
+            user_id=user_id,
+            transaction_type=TransactionType.OUTCOME,
+        ),
+    }
+    python_times: dict[str, float] = {}
+
+    async with PostgresSession() as session:
+        transaction_repository: TransactionRepository = TransactionRepository(session=session)
+
+        for (query_name, query_call) in query_calls.items():
+            python_times[query_name] = await measure_python_time(
+                lambda: query_call(transaction_repository),  # noqa: B023
+                repetitions_number,
+            )
+
+    return {
+        'repetitions_number': repetitions_number,
+        'python_us_per_call': {
+            query_name: round(python_time * 1e6, 1)
+            for (query_name, python_time) in python_times.items()
+        },
+        'compiled_cache_hit_rate': round(compiled_cache_statistics.hit_rate, 4),
+    }
+
+
+if __name__ == '__main__':
+    basicConfig(level=INFO, format='%(message)s')
+
+    argument_parser: ArgumentParser = ArgumentParser(
+        description='Measure the process time spent per call of the hot transaction queries',
+    )
+    argument_parser.add_argument('--user-id', type=int, default=1)
+    argument_parser.add_argument('--repetitions-number', type=int, default=2000)
+
+    arguments: Namespace = argument_parser.parse_args()
+
+    logger.info(dump_to_json(run(benchmark(arguments.user_id, arguments.repetitions_number)), indent=4))
@@ -0,0 +1,104 @@
+from argparse import ArgumentParser, Namespace
+from datetime import date, timedelta
+from itertools import accumulate
+from json import dumps as dump_to_json
+from json import loads as load_from_json
+from logging import INFO, Logger, basicConfig, getLogger
+from pathlib import Path
+from timeit import Timer
+from typing import Any, Callable
+
+from fastapi.responses import ORJSONResponse
+
+from app.schemas.account import TrendPointData
+from core.calendar import fill_missing_dates_with_default_value
+
+
+# From two weeks of the dashboard highlights up to ten years of the longest histories
+SPAN_DAYS_NUMBERS: tuple[int, ...] = (14, 31, 365, 3650)
+REPEATS_NUMBER: int = 5
+
+BASELINE_PATH: Path = Path(__file__).parent / 'baselines' / 'trend_post_processing.json'
+
+
+logger: Logger = getLogger(__name__)
+
+
+def make_statistics(days_number: int) -> tuple[list[tuple[date, float, float]], date, date]:
+    last_date: date = date(year=2022, month=12, day=31)
+    first_date: date = last_date - timedelta(days=days_number - 1)
+
+    # Only every other day has transactions, so that half of the dates are filled in
+    statistics: list[tuple[date, float, float]] = [
+        (first_date + timedelta(days=day_offset), day_offset % 100 + 0.5, day_offset % 70 + 0.25)
+        for day_offset in range(0, days_number, 2)
+    ]
+
+    return (statistics, first_date, last_date)
+
+def make_trend_rows(statistics: list[tuple[date, float, float]], first_date: date, last_date: date) -> list[tuple[date, float, float]]:
+    (dates, current_amounts, average_amounts) = zip(*fill_missing_dates_with_default_value(statistics, (0.0, 0.0), first_date, last_date))
+
+    return list(zip(dates, accumulate(current_amounts), accumulate(average_amounts)))
+
+# Running totals come from the database, so only rendering of the rows is left to the route
+def render_trend(trend_rows: list[tuple[date, float, float]]) -> bytes:
+    return ORJSONResponse(content=TrendPointData.dump_rows(trend_rows)).body
+
+def measure_call_time(call: Callable[[], Any]) -> float:
+    timer: Timer = Timer(call)
+    (calls_number, _) = timer.autorange()
+
+    return min(timer.repeat(repeat=REPEATS_NUMBER, number=calls_number)) / calls_number
+
+def benchmark(baseline: dict[str, float] | None) -> dict[str, Any]:
+    call_times: dict[str, float] = {}
+
+    for days_number in SPAN_DAYS_NUMBERS:
+        (statistics, first_date, last_date) = make_statistics(days_number)
+        sums: list[tuple[date, float]] = [(current_date, current_amount) for (current_date, current_amount, _) in statistics]
+        trend_rows: list[tuple[date, float, float]] = make_trend_rows(statistics, first_date, last_date)
+
+        case_calls: dict[str, Callable[[], Any]] = {
+            'fill_sums': lambda: fill_missing_dates_with_default_value(sums, 0.0, first_date, last_date),
+            'fill_statistics': lambda: fill_missing_dates_with_default_value(statistics, (0.0, 0.0), first_date, last_date),
+            'current_month_render': lambda: render_trend(trend_rows),
+        }
+
+        for (case_name, case_call) in case_calls.items():
+            call_times['{0}[{1}d]'.format(case_name, days_number)] = round(measure_call_time(case_call) * 1e6, 3)
+
+    if baseline is None:
+        return {'us_per_call': call_times}
+
+    return {
+        'us_per_call': call_times,
+        'baseline_us_per_call': baseline,
+        # Ratios above 1 are slowdowns against the baseline
+        'ratios': {
+            case_key: round(call_time / baseline[case_key], 2)
+            for (case_key, call_time) in call_times.items()
+            if case_key in baseline
+        },
+    }
+
+
+if __name__ == '__main__':
+    basicConfig(level=INFO, format='%(message)s')
+
+    argument_parser: ArgumentParser = ArgumentParser(
+        description='Time filling in missing dates & rendering the current month trend over spans of 14 days up to 10 years',
+    )
+    argument_parser.add_argument('--save-baseline', action='store_true', help='store the timings as the baseline instead of comparing with it')
+
+    arguments: Namespace = argument_parser.parse_args()
+
+    if arguments.save_baseline:
+        benchmark_report: dict[str, Any] = benchmark(baseline=None)
+
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text('{0}\n'.format(dump_to_json(benchmark_report['us_per_call'], indent=4)))
+    else:
+        benchmark_report = benchmark(baseline=load_from_json(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else None)
+
+    logger.info(dump_to_json(benchmark_report, indent=4))
@@ -12,6 +12,21 @@ def get_current_month_boundaries() -> tuple[date, date]:
 
     return (current_month_first_date, current_month_last_date)
 
+def get_period_boundaries(year: int | None = None, month: int | None = None) -> tuple[date, date] | None:
+    if year is None:
+        if month is not None:
+            raise ValueError('Month of the period is given without its year')
+
+        return None
+
+    if month is None:
+        return (date(year=year, month=1, day=1), date(year=year + 1, month=1, day=1))
+
+    next_month_year: int = year + month // 12
+    next_month: int = month % 12 + 1
+
+    return (date(year=year, month=month, day=1), date(year=next_month_year, month=next_month, day=1))
+
 def fill_missing_dates_with_default_value(
     date_related_list: list[tuple[Any, ...]],
     default_value: Any,
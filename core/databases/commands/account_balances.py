@@ -0,0 +1,38 @@
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from logging import INFO, Logger, basicConfig, getLogger
+
+from core.databases.repositories import AccountRepository
+from core.databases.sessions import PostgresSession
+
+
+logger: Logger = getLogger(__name__)
+
+
+async def rebuild_account_balances(only_check: bool = False) -> list[tuple[int, float, float]]:
+    async with PostgresSession() as session:
+        account_repository: AccountRepository = AccountRepository(session=session)
+        drifts: list[tuple[int, float, float]] = await account_repository.get_transactions_balance_drifts()
+
+        for (account_id, stored_balance, actual_balance) in drifts:
+            logger.warning('Account %s has drifted: stored %s, actual %s', account_id, stored_balance, actual_balance)
+
+        if not only_check:
+            await account_repository.rebuild_transactions_balances()
+            await session.commit()
+
+    logger.info('%s drifted account balance(s) %s', len(drifts), 'found' if only_check else 'rebuilt')
+
+    return drifts
+
+
+if __name__ == '__main__':
+    basicConfig(level=INFO, format='%(message)s')
+
+    argument_parser: ArgumentParser = ArgumentParser(description='Recompute transactions balances of all accounts from scratch')
+    argument_parser.add_argument('--check', action='store_true', help='only report drifted balances, exit with 1 if any')
+
+    arguments: Namespace = argument_parser.parse_args()
+    found_drifts: list[tuple[int, float, float]] = run(rebuild_account_balances(only_check=arguments.check))
+
+    raise SystemExit(1 if arguments.check and found_drifts else 0)
@@ -0,0 +1,47 @@
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from datetime import date
+from logging import INFO, Logger, basicConfig, getLogger
+
+from core.databases.models.utilities.types import TransactionType
+from core.databases.repositories import DailyTransactionRollupRepository
+from core.databases.sessions import PostgresSession
+
+
+logger: Logger = getLogger(__name__)
+
+
+async def rebuild_transaction_rollups(only_check: bool = False) -> list[tuple[int, TransactionType, date, float, float]]:
+    async with PostgresSession() as session:
+        rollup_repository: DailyTransactionRollupRepository = DailyTransactionRollupRepository(session=session)
+        drifts: list[tuple[int, TransactionType, date, float, float]] = await rollup_repository.get_drifts()
+
+        for (user_id, transaction_type, due_date, stored_amount, actual_amount) in drifts:
+            logger.warning(
+                'Rollup of user %s for %s of %s has drifted: stored %s, actual %s',
+                user_id,
+                transaction_type,
+                due_date,
+                stored_amount,
+                actual_amount,
+            )
+
+        if not only_check:
+            await rollup_repository.rebuild()
+            await session.commit()
+
+    logger.info('%s drifted daily transaction rollup(s) %s', len(drifts), 'found' if only_check else 'rebuilt')
+
+    return drifts
+
+
+if __name__ == '__main__':
+    basicConfig(level=INFO, format='%(message)s')
+
+    argument_parser: ArgumentParser = ArgumentParser(description='Recompute daily transaction rollups of all users from scratch')
+    argument_parser.add_argument('--check', action='store_true', help='only report drifted rollups, exit with 1 if any')
+
+    arguments: Namespace = argument_parser.parse_args()
+    found_drifts: list[tuple[int, TransactionType, date, float, float]] = run(rebuild_transaction_rollups(only_check=arguments.check))
+
+    raise SystemExit(1 if arguments.check and found_drifts else 0)
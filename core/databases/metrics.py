@@ -0,0 +1,128 @@
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy.engine import Connection, ExceptionContext, ExecutionContext
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.event import listen
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from core.metrics import (
+    CallbackCounter,
+    Histogram,
+    metrics_registry,
+)
+
+
+_QUERY_STARTED_TIMES_KEY: str = 'query_started_times'
+
+
+class CompiledCacheStatistics:
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups_number: int = self.hits + self.misses
+
+        return self.hits / lookups_number if lookups_number else 0
+
+    def observe(self, context: ExecutionContext) -> None:
+        cache_hit: CacheStats = getattr(context, 'cache_hit', CacheStats.NO_CACHE_KEY)
+
+        if cache_hit is CacheStats.CACHE_HIT:
+            self.hits += 1
+        elif cache_hit is CacheStats.CACHE_MISS:
+            self.misses += 1
+
+class QueryStatistics:
+    def __init__(self) -> None:
+        self.queries_number: int = 0
+        self.query_time: float = 0
+        self.pool_wait_time: float = 0
+
+
+# Lookups of statements in the compiled caches of every engine of the process
+compiled_cache_statistics: CompiledCacheStatistics = CompiledCacheStatistics()
+
+# Statistics of the request being handled, which are set by the HTTP metrics middleware
+request_query_statistics: ContextVar[QueryStatistics | None] = ContextVar('request_query_statistics', default=None)
+
+query_duration_histogram: Histogram = Histogram(
+    name='db_query_duration_seconds',
+    documentation='Time of executing a single database query',
+)
+pool_wait_histogram: Histogram = Histogram(
+    name='db_pool_wait_seconds',
+    documentation='Time of waiting for a connection to be checked out of the pool',
+)
+
+metrics_registry.register(query_duration_histogram)
+metrics_registry.register(pool_wait_histogram)
+metrics_registry.register(CallbackCounter(
+    name='db_compiled_cache_hits_total',
+    documentation='Statements found in the compiled cache',
+    callback=lambda: compiled_cache_statistics.hits,
+))
+metrics_registry.register(CallbackCounter(
+    name='db_compiled_cache_misses_total',
+    documentation='Statements compiled because of missing in the compiled cache',
+    callback=lambda: compiled_cache_statistics.misses,
+))
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    def connect(self) -> PoolProxiedConnection:
+        started_time: float = perf_counter()
+
+        try:
+            return super().connect()
+        finally:
+            pool_wait_time: float = perf_counter() - started_time
+            pool_wait_histogram.observe(pool_wait_time)
+
+            query_statistics: QueryStatistics | None = request_query_statistics.get()
+
+            if query_statistics is not None:
+                query_statistics.pool_wait_time += pool_wait_time
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    listen(engine.sync_engine, 'before_cursor_execute', _start_query_timing)
+    listen(engine.sync_engine, 'after_cursor_execute', _observe_query)
+    listen(engine.sync_engine, 'handle_error', _discard_query_timing)
+
+
+def _start_query_timing(
+    connection: Connection,
+    cursor: Any,
+    statement: str,
+    statement_parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    connection.info.setdefault(_QUERY_STARTED_TIMES_KEY, []).append(perf_counter())
+
+def _observe_query(
+    connection: Connection,
+    cursor: Any,
+    statement: str,
+    statement_parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    query_time: float = perf_counter() - connection.info[_QUERY_STARTED_TIMES_KEY].pop()
+    query_duration_histogram.observe(query_time)
+    compiled_cache_statistics.observe(context)
+
+    query_statistics: QueryStatistics | None = request_query_statistics.get()
+
+    if query_statistics is not None:
+        query_statistics.queries_number += 1
+        query_statistics.query_time += query_time
+
+def _discard_query_timing(exception_context: ExceptionContext) -> None:
+    if exception_context.connection is not None and exception_context.connection.info.get(_QUERY_STARTED_TIMES_KEY):
+        exception_context.connection.info[_QUERY_STARTED_TIMES_KEY].pop()
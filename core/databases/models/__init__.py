@@ -1,6 +1,8 @@
 from .account import Account
 from .budget import Budget
 from .category import Category
+from .daily_transaction_rollup import DailyTransactionRollup
 from .family import Family
+from .refresh_token import RefreshToken
 from .transaction import Transaction
 from .user import User
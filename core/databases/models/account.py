@@ -15,9 +15,10 @@ if TYPE_CHECKING:
 class Account(BaseModel):
     user_id: Mapped[int] = mapped_column(ForeignKey('user.id'))
 
-    user: Mapped['User'] = relationship(back_populates='accounts', lazy='selectin')
-    transactions: Mapped[list['Transaction']] = relationship(back_populates='account', cascade='all, delete', lazy='selectin')
+    user: Mapped['User'] = relationship(back_populates='accounts', lazy='raise_on_sql')
+    transactions: Mapped[list['Transaction']] = relationship(back_populates='account', cascade='all, delete', lazy='raise_on_sql')
 
     name: Mapped[str] = mapped_column(index=True)
     currency: Mapped[CurrencyType]
     opening_balance: Mapped[float] = mapped_column(default=0)
+    transactions_balance: Mapped[float] = mapped_column(default=0, server_default='0')
@@ -15,8 +15,8 @@ if TYPE_CHECKING:
 class Budget(BaseModel):
     user_id: Mapped[int] = mapped_column(ForeignKey('user.id'))
 
-    user: Mapped['User'] = relationship(back_populates='budgets', lazy='selectin')
-    categories: Mapped[list['Category']] = relationship(back_populates='budget', lazy='selectin')
+    user: Mapped['User'] = relationship(back_populates='budgets', lazy='raise_on_sql')
+    categories: Mapped[list['Category']] = relationship(back_populates='budget', lazy='raise_on_sql')
 
     name: Mapped[str] = mapped_column(index=True)
     type: Mapped[BudgetType]
@@ -18,11 +18,11 @@ class Category(BaseModel):
     base_category_id: Mapped[int | None] = mapped_column(ForeignKey('category.id'))
     budget_id: Mapped[int | None] = mapped_column(ForeignKey('budget.id'))
 
-    user: Mapped['User'] = relationship(back_populates='categories', lazy='selectin')
-    base_category: Mapped['Category | None'] = relationship(back_populates='subcategories', lazy='selectin', remote_side=lambda: Category.id)
-    subcategories: Mapped[list['Category']] = relationship(back_populates='base_category', cascade='all, delete', lazy='selectin')
-    budget: Mapped['Budget | None'] = relationship(back_populates='categories', lazy='selectin')
-    transactions: Mapped[list['Transaction']] = relationship(back_populates='category', lazy='selectin')
+    user: Mapped['User'] = relationship(back_populates='categories', lazy='raise_on_sql')
+    base_category: Mapped['Category | None'] = relationship(back_populates='subcategories', lazy='raise_on_sql', remote_side=lambda: Category.id)
+    subcategories: Mapped[list['Category']] = relationship(back_populates='base_category', cascade='all, delete', lazy='raise_on_sql')
+    budget: Mapped['Budget | None'] = relationship(back_populates='categories', lazy='raise_on_sql')
+    transactions: Mapped[list['Transaction']] = relationship(back_populates='category', lazy='raise_on_sql')
 
     name: Mapped[str] = mapped_column(index=True)
     type: Mapped[CategoryType]
@@ -0,0 +1,20 @@
+from datetime import date
+
+from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .utilities.base import BaseModel
+from .utilities.types import TransactionType
+
+
+class DailyTransactionRollup(BaseModel):
+    __table_args__ = (
+        UniqueConstraint('user_id', 'type', 'due_date'),
+    )
+
+    user_id: Mapped[int] = mapped_column(ForeignKey('user.id'))
+
+    type: Mapped[TransactionType]
+    due_date: Mapped[date]
+    amount: Mapped[float] = mapped_column(default=0)
+    count: Mapped[int] = mapped_column(default=0)
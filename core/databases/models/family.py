@@ -10,6 +10,6 @@ if TYPE_CHECKING:
 
 
 class Family(BaseModel):
-    members: Mapped[list['User']] = relationship(back_populates='family', lazy='selectin')
+    members: Mapped[list['User']] = relationship(back_populates='family', lazy='raise_on_sql')
 
     access_code: Mapped[str] = mapped_column(unique=True)
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .utilities.base import BaseModel
+
+
+class RefreshToken(BaseModel):
+    user_id: Mapped[int] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'), index=True)
+
+    # Tokens themselves are never stored, only their SHA-256 digests
+    token_digest: Mapped[bytes] = mapped_column(unique=True)
+    expiration_time: Mapped[datetime]
+    # Rotated tokens are kept till they expire, so that any of the instances recognises them once reused
+    rotation_time: Mapped[datetime | None]
@@ -1,7 +1,7 @@
 from datetime import date, time
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .utilities.base import BaseModel
@@ -14,11 +14,20 @@ if TYPE_CHECKING:
 
 
 class Transaction(BaseModel):
+    __table_args__ = (
+        Index('ix_transaction_user_id_type_due_date', 'user_id', 'type', 'due_date'),
+        Index('ix_transaction_user_id_due_date_due_time_id', 'user_id', 'due_date', 'due_time', 'id'),
+    )
+
     account_id: Mapped[int] = mapped_column(ForeignKey('account.id'))
     category_id: Mapped[int | None] = mapped_column(ForeignKey('category.id'))
 
-    account: Mapped['Account'] = relationship(back_populates='transactions', lazy='selectin')
-    category: Mapped['Category | None'] = relationship(back_populates='transactions', lazy='selectin')
+    # Denormalised owners of the account, kept in sync by `TransactionRepository`
+    user_id: Mapped[int] = mapped_column(ForeignKey('user.id'))
+    family_id: Mapped[int | None] = mapped_column(ForeignKey('family.id'), index=True)
+
+    account: Mapped['Account'] = relationship(back_populates='transactions', lazy='raise_on_sql')
+    category: Mapped['Category | None'] = relationship(back_populates='transactions', lazy='raise_on_sql')
 
     type: Mapped[TransactionType]
     due_date: Mapped[date]
@@ -17,10 +17,11 @@ if TYPE_CHECKING:
 class User(BaseModel):
     family_id: Mapped[int | None] = mapped_column(ForeignKey('family.id'))
 
-    family: Mapped['Family | None'] = relationship(back_populates='members', lazy='selectin')
-    accounts: Mapped[list['Account']] = relationship(back_populates='user', cascade='all, delete', lazy='selectin')
-    categories: Mapped[list['Category']] = relationship(back_populates='user', cascade='all, delete', lazy='selectin')
-    budgets: Mapped[list['Budget']] = relationship(back_populates='user', cascade='all, delete', lazy='selectin')
+    family: Mapped['Family | None'] = relationship(back_populates='members', lazy='raise_on_sql')
+    accounts: Mapped[list['Account']] = relationship(back_populates='user', cascade='all, delete', lazy='raise_on_sql')
+    categories: Mapped[list['Category']] = relationship(back_populates='user', cascade='all, delete', lazy='raise_on_sql')
+    budgets: Mapped[list['Budget']] = relationship(back_populates='user', cascade='all, delete', lazy='raise_on_sql')
 
     username: Mapped[str] = mapped_column(String(MAX_USERNAME_LENGTH), unique=True, index=True)
     password: Mapped[str]
+    data_version: Mapped[int] = mapped_column(default=0, server_default='0')
@@ -13,6 +13,11 @@ from sqlalchemy.orm import (
 
 
 class BaseModel(AsyncAttrs, DeclarativeBase):
+    # Server-generated values come back with RETURNING of the flush itself
+    __mapper_args__: dict[str, Any] = {
+        'eager_defaults': True,
+    }
+
     type_annotation_map: dict[type, Any] = {
         int: BigInteger,
         StrEnum: Enum(StrEnum, values_callable=lambda enum: [enum_field.value for enum_field in enum]),
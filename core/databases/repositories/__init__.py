@@ -1,6 +1,8 @@
 from .account import AccountRepository
 from .budget import BudgetRepository
 from .category import CategoryRepository
+from .daily_transaction_rollup import DailyTransactionRollupRepository
 from .family import FamilyRepository
+from .refresh_token import RefreshTokenRepository
 from .transaction import TransactionRepository
 from .user import UserRepository
@@ -1,13 +1,127 @@
+from datetime import date
+
+from sqlalchemy import Result, case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import ScalarSelect
 
-from core.databases.models import Account
+from core.databases.models import Account, Transaction, User
+from core.databases.models.utilities.types import TransactionType
 
+from .daily_transaction_rollup import DailyTransactionRollupRepository
 from .utilities.base import BaseRepository
 
 
+BALANCE_DRIFT_TOLERANCE: float = 1e-6
+
+
 class AccountRepository(BaseRepository[Account]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(
             model=Account,
             session=session,
         )
+
+    async def get_owner_attributes(self, account_id: int) -> dict[str, int | None]:
+        query_result: Result[tuple[int, int | None]] = await self.session.execute(
+            select(
+                Account.user_id,
+                User.family_id,
+            ).join(
+                User,
+                User.id == Account.user_id,
+            ).where(
+                Account.id == account_id,
+            ),
+        )
+        (user_id, family_id) = query_result.one()
+
+        return {
+            'user_id': user_id,
+            'family_id': family_id,
+        }
+
+    async def change_transactions_balance(self, account_id: int, amount: float) -> None:
+        if not amount:
+            return
+
+        await self.session.execute(
+            update(Account).where(
+                Account.id == account_id,
+            ).values(
+                transactions_balance=Account.transactions_balance + amount,
+            ),
+        )
+
+    async def delete(self, record: Account) -> None:
+        # Transactions of the account are deleted by the cascade, which bypasses their repository
+        query_result: Result[tuple[int, TransactionType, date, float, int]] = await self.session.execute(
+            select(
+                Transaction.user_id,
+                Transaction.type,
+                Transaction.due_date,
+                func.SUM(Transaction.amount),
+                func.COUNT(Transaction.id),
+            ).where(
+                Transaction.account_id == record.id,
+            ).group_by(
+                Transaction.user_id,
+                Transaction.type,
+                Transaction.due_date,
+            ),
+        )
+
+        rollup_repository: DailyTransactionRollupRepository = DailyTransactionRollupRepository(session=self.session)
+        await rollup_repository.change_many([
+            {
+                'user_id': user_id,
+                'type': transaction_type,
+                'due_date': due_date,
+                'amount': -amount,
+                'count': -count,
+            }
+            for (user_id, transaction_type, due_date, amount, count) in query_result.tuples()
+        ])
+
+        await super().delete(record)
+
+    async def get_transactions_balance_drifts(self) -> list[tuple[int, float, float]]:
+        actual_balance: ScalarSelect[float] = self._select_actual_transactions_balance()
+
+        query_result: Result[tuple[int, float, float]] = await self.session.execute(
+            select(
+                Account.id,
+                Account.transactions_balance,
+                actual_balance,
+            ).where(
+                func.ABS(Account.transactions_balance - actual_balance) > BALANCE_DRIFT_TOLERANCE,
+            ).order_by(
+                Account.id,
+            ),
+        )
+
+        return list(query_result.tuples().all())
+
+    async def rebuild_transactions_balances(self) -> None:
+        await self.session.execute(
+            update(Account).values(
+                transactions_balance=self._select_actual_transactions_balance(),
+            ).execution_options(
+                synchronize_session=False,
+            ),
+        )
+
+    def _select_actual_transactions_balance(self) -> ScalarSelect[float]:
+        return select(
+            func.COALESCE(
+                func.SUM(
+                    case(
+                        (Transaction.type == TransactionType.INCOME, Transaction.amount),
+                        (Transaction.type == TransactionType.OUTCOME, -Transaction.amount),
+                        else_=0,
+                    ),
+                ),
+                0,
+            ),
+        ).where(
+            Transaction.account_id == Account.id,
+        ).scalar_subquery()
@@ -0,0 +1,148 @@
+from datetime import date
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    BindParameter,
+    Delete,
+    Result,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import Insert as Upsert
+from sqlalchemy.dialects.postgresql import insert as upsert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Subquery
+
+from core.databases.models import DailyTransactionRollup, Transaction
+from core.databases.models.utilities.types import TransactionType
+
+from .utilities.base import BaseRepository
+
+
+ROLLUP_DRIFT_TOLERANCE: float = 1e-6
+
+
+class DailyTransactionRollupRepository(BaseRepository[DailyTransactionRollup]):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(
+            model=DailyTransactionRollup,
+            session=session,
+        )
+
+    async def change(
+        self,
+        user_id: int,
+        transaction_type: TransactionType,
+        due_date: date,
+        amount: float,
+        count: int,
+    ) -> None:
+        if not amount and not count:
+            return
+
+        await self.change_many([
+            {
+                'user_id': user_id,
+                'type': transaction_type,
+                'due_date': due_date,
+                'amount': amount,
+                'count': count,
+            },
+        ])
+
+    async def change_many(self, changes_data: list[dict[str, Any]]) -> None:
+        if not changes_data:
+            return
+
+        upsert_statement: Upsert = upsert(DailyTransactionRollup).values(changes_data)
+
+        await self.session.execute(
+            upsert_statement.on_conflict_do_update(
+                index_elements=[
+                    DailyTransactionRollup.user_id,
+                    DailyTransactionRollup.type,
+                    DailyTransactionRollup.due_date,
+                ],
+                set_={
+                    'amount': DailyTransactionRollup.amount + upsert_statement.excluded.amount,
+                    'count': DailyTransactionRollup.count + upsert_statement.excluded.count,
+                },
+            ),
+        )
+
+    async def get_drifts(self) -> list[tuple[int, TransactionType, date, float, float]]:
+        actual_query: Subquery = self._select_actual_rollups().subquery()
+        stored_query: Subquery = select(
+            DailyTransactionRollup.user_id,
+            DailyTransactionRollup.type,
+            DailyTransactionRollup.due_date,
+            DailyTransactionRollup.amount,
+            DailyTransactionRollup.count,
+        ).where(
+            DailyTransactionRollup.count != 0,
+        ).subquery()
+
+        query_result: Result[tuple[int, TransactionType, date, float, float]] = await self.session.execute(
+            select(
+                func.COALESCE(stored_query.c.user_id, actual_query.c.user_id),
+                func.COALESCE(stored_query.c.type, actual_query.c.type),
+                func.COALESCE(stored_query.c.due_date, actual_query.c.due_date),
+                func.COALESCE(stored_query.c.amount, 0),
+                func.COALESCE(actual_query.c.amount, 0),
+            ).select_from(
+                stored_query,
+            ).join(
+                actual_query,
+                (stored_query.c.user_id == actual_query.c.user_id)
+                & (stored_query.c.type == actual_query.c.type)
+                & (stored_query.c.due_date == actual_query.c.due_date),
+                full=True,
+            ).where(
+                (func.ABS(func.COALESCE(stored_query.c.amount, 0) - func.COALESCE(actual_query.c.amount, 0)) > ROLLUP_DRIFT_TOLERANCE)
+                | (func.COALESCE(stored_query.c.count, 0) != func.COALESCE(actual_query.c.count, 0)),
+            ).order_by(
+                func.COALESCE(stored_query.c.user_id, actual_query.c.user_id),
+                func.COALESCE(stored_query.c.due_date, actual_query.c.due_date),
+            ),
+        )
+
+        return list(query_result.tuples().all())
+
+    async def rebuild(self, user_ids: list[int] | None = None) -> None:
+        delete_query: Delete = delete(DailyTransactionRollup)
+        actual_query: Select[tuple[int, TransactionType, date, float, int]] = self._select_actual_rollups()
+
+        if user_ids is not None:
+            # IDs are bound as a single array, so that any number of users fits into the parameters of a query
+            user_ids_parameter: BindParameter[list[int]] = bindparam('user_ids', user_ids, type_=ARRAY(BigInteger))
+
+            delete_query = delete_query.where(DailyTransactionRollup.user_id == any_(user_ids_parameter))
+            actual_query = actual_query.where(Transaction.user_id == any_(user_ids_parameter))
+
+        await self.session.execute(delete_query)
+        await self.session.execute(
+            insert(DailyTransactionRollup).from_select(
+                ['user_id', 'type', 'due_date', 'amount', 'count'],
+                actual_query,
+            ),
+        )
+
+    def _select_actual_rollups(self) -> Select[tuple[int, TransactionType, date, float, int]]:
+        return select(
+            Transaction.user_id,
+            Transaction.type,
+            Transaction.due_date,
+            func.SUM(Transaction.amount).label('amount'),
+            func.COUNT(Transaction.id).label('count'),
+        ).group_by(
+            Transaction.user_id,
+            Transaction.type,
+            Transaction.due_date,
+        )
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from sqlalchemy import Delete, Result, delete, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.databases.models import RefreshToken
+
+from .utilities.base import BaseRepository
+
+
+class RefreshTokenRepository(BaseRepository[RefreshToken]):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(
+            model=RefreshToken,
+            session=session,
+        )
+
+    async def pop_by_digest(self, token_digest: bytes) -> tuple[int, datetime] | None:
+        # Deleting & reading in one statement lets only one of concurrent requests use a token
+        query_result: Result[tuple[int, datetime]] = await self.session.execute(
+            delete(RefreshToken).where(
+                RefreshToken.token_digest == token_digest,
+            ).returning(
+                RefreshToken.user_id,
+                RefreshToken.expiration_time,
+            ),
+        )
+
+        return query_result.tuples().one_or_none()
+
+    async def rotate_by_digest(self, token_digest: bytes, rotation_time: datetime) -> tuple[int, datetime, datetime] | None:
+        # Marking & reading in one statement lets only one of concurrent requests rotate a token,
+        # while tokens rotated before keep their time, which tells the reused ones apart
+        query_result: Result[tuple[int, datetime, datetime]] = await self.session.execute(
+            update(RefreshToken).where(
+                RefreshToken.token_digest == token_digest,
+            ).values(
+                rotation_time=func.COALESCE(RefreshToken.rotation_time, rotation_time),
+            ).returning(
+                RefreshToken.user_id,
+                RefreshToken.expiration_time,
+                RefreshToken.rotation_time,
+            ).execution_options(
+                synchronize_session=False,
+            ),
+        )
+
+        return query_result.tuples().one_or_none()
+
+    async def delete_user_tokens(self, user_id: int, expired_before: datetime | None = None) -> None:
+        query: Delete = delete(RefreshToken).where(
+            RefreshToken.user_id == user_id,
+        )
+
+        if expired_before is not None:
+            query = query.where(RefreshToken.expiration_time < expired_before)
+
+        await self.session.execute(query)
@@ -1,20 +1,68 @@
+from collections import defaultdict
 from datetime import date, datetime
+from functools import cache
+from typing import Any, AsyncIterator, Sequence
 
-from sqlalchemy import Result, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    BindParameter,
+    Date,
+    Result,
+    RowMapping,
+    Select,
+    TableValuedAlias,
+    bindparam,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.sql import ColumnElement, Subquery
 
 from core.calendar import (
     fill_missing_dates_with_default_value,
     get_current_month_boundaries,
+    get_period_boundaries,
 )
-from core.databases.models import Transaction, User
+from core.databases.models import DailyTransactionRollup, Transaction
 from core.databases.models.utilities.types import (
     SummaryPeriodType,
     TransactionType,
 )
 
-from .utilities.base import BaseRepository
+from .account import AccountRepository
+from .daily_transaction_rollup import DailyTransactionRollupRepository
+from .utilities.base import BaseRepository, LoaderProfile
+
+
+def get_transactions_balance_change(transaction_type: TransactionType, amount: float) -> float:
+    if transaction_type == TransactionType.INCOME:
+        return amount
+
+    if transaction_type == TransactionType.OUTCOME:
+        return -amount
+
+    return 0
+
+def get_due_date_period_conditions(period_boundaries: tuple[date | BindParameter[date], date | BindParameter[date]] | None) -> list[ColumnElement[bool]]:
+    if period_boundaries is None:
+        return []
+
+    (first_date, next_first_date) = period_boundaries
+
+    return [
+        Transaction.due_date >= first_date,
+        Transaction.due_date < next_first_date,
+    ]
+
+def get_summary_period_boundaries(summary_period_type: SummaryPeriodType, today_date: date) -> tuple[date, date] | None:
+    if summary_period_type is SummaryPeriodType.CURRENT_YEAR:
+        return get_period_boundaries(year=today_date.year)
+
+    if summary_period_type is SummaryPeriodType.CURRENT_MONTH:
+        return get_period_boundaries(year=today_date.year, month=today_date.month)
+
+    return get_period_boundaries()
 
 
 class TransactionRepository(BaseRepository[Transaction]):
@@ -24,117 +72,346 @@ class TransactionRepository(BaseRepository[Transaction]):
             session=session,
         )
 
-    async def get_user_transaction_periods(self, user: User) -> list[tuple[int, int]]:
+    async def create(self, record_data: dict[str, Any], profile: LoaderProfile = (), **additional_attributes: Any) -> Transaction:
+        record_data |= additional_attributes
+
+        account_repository: AccountRepository = AccountRepository(session=self.session)
+        record_data |= await account_repository.get_owner_attributes(record_data['account_id'])
+
+        await account_repository.change_transactions_balance(
+            account_id=record_data['account_id'],
+            amount=get_transactions_balance_change(record_data['type'], record_data['amount']),
+        )
+
+        rollup_repository: DailyTransactionRollupRepository = DailyTransactionRollupRepository(session=self.session)
+        await rollup_repository.change(
+            user_id=record_data['user_id'],
+            transaction_type=record_data['type'],
+            due_date=record_data['due_date'],
+            amount=record_data['amount'],
+            count=1,
+        )
+
+        return await super().create(
+            record_data=record_data,
+            profile=profile,
+        )
+
+    async def create_many(self, records_data: list[dict[str, Any]], batch_size: int, **additional_attributes: Any) -> None:
+        account_repository: AccountRepository = AccountRepository(session=self.session)
+        owner_attributes: dict[int, dict[str, int | None]] = {
+            account_id: await account_repository.get_owner_attributes(account_id)
+            for account_id in {record_data['account_id'] for record_data in records_data}
+        }
+
+        records_data = [
+            record_data | additional_attributes | owner_attributes[record_data['account_id']]
+            for record_data in records_data
+        ]
+
+        for batch_offset in range(0, len(records_data), batch_size):
+            await self.session.execute(
+                insert(Transaction),
+                records_data[batch_offset:batch_offset + batch_size],
+            )
+
+        balance_changes: defaultdict[int, float] = defaultdict(float)
+        rollup_amounts: defaultdict[tuple[int, TransactionType, date], float] = defaultdict(float)
+        rollup_counts: defaultdict[tuple[int, TransactionType, date], int] = defaultdict(int)
+
+        for record_data in records_data:
+            rollup_key: tuple[int, TransactionType, date] = (record_data['user_id'], record_data['type'], record_data['due_date'])
+
+            balance_changes[record_data['account_id']] += get_transactions_balance_change(record_data['type'], record_data['amount'])
+            rollup_amounts[rollup_key] += record_data['amount']
+            rollup_counts[rollup_key] += 1
+
+        for (account_id, balance_change) in balance_changes.items():
+            await account_repository.change_transactions_balance(account_id=account_id, amount=balance_change)
+
+        # Keys are unique within a batch, as Postgres refuses to upsert a row twice in one statement
+        rollup_repository: DailyTransactionRollupRepository = DailyTransactionRollupRepository(session=self.session)
+        rollup_keys: list[tuple[int, TransactionType, date]] = list(rollup_counts)
+
+        for batch_offset in range(0, len(rollup_keys), batch_size):
+            await rollup_repository.change_many([
+                {
+                    'user_id': user_id,
+                    'type': transaction_type,
+                    'due_date': due_date,
+                    'amount': rollup_amounts[(user_id, transaction_type, due_date)],
+                    'count': rollup_counts[(user_id, transaction_type, due_date)],
+                }
+                for (user_id, transaction_type, due_date) in rollup_keys[batch_offset:batch_offset + batch_size]
+            ])
+
+    async def update(self, record: Transaction, record_data: dict[str, Any], profile: LoaderProfile = (), **additional_attributes: Any) -> Transaction:
+        record_data |= additional_attributes
+
+        previous_account_id: int = record.account_id
+        previous_change: float = get_transactions_balance_change(record.type, record.amount)
+
+        account_id: int = record_data.get('account_id', record.account_id)
+        change: float = get_transactions_balance_change(
+            record_data.get('type', record.type),
+            record_data.get('amount', record.amount),
+        )
+
+        account_repository: AccountRepository = AccountRepository(session=self.session)
+
+        if account_id == previous_account_id:
+            await account_repository.change_transactions_balance(account_id=account_id, amount=change - previous_change)
+        else:
+            record_data |= await account_repository.get_owner_attributes(account_id)
+
+            await account_repository.change_transactions_balance(account_id=previous_account_id, amount=-previous_change)
+            await account_repository.change_transactions_balance(account_id=account_id, amount=change)
+
+        previous_rollup_key: tuple[int, TransactionType, date] = (record.user_id, record.type, record.due_date)
+        rollup_key: tuple[int, TransactionType, date] = (
+            record_data.get('user_id', record.user_id),
+            record_data.get('type', record.type),
+            record_data.get('due_date', record.due_date),
+        )
+        amount: float = record_data.get('amount', record.amount)
+
+        rollup_repository: DailyTransactionRollupRepository = DailyTransactionRollupRepository(session=self.session)
+
+        if rollup_key == previous_rollup_key:
+            await rollup_repository.change(*rollup_key, amount=amount - record.amount, count=0)
+        else:
+            await rollup_repository.change(*previous_rollup_key, amount=-record.amount, count=-1)
+            await rollup_repository.change(*rollup_key, amount=amount, count=1)
+
+        return await super().update(
+            record=record,
+            record_data=record_data,
+            profile=profile,
+        )
+
+    async def delete(self, record: Transaction) -> None:
+        account_repository: AccountRepository = AccountRepository(session=self.session)
+        await account_repository.change_transactions_balance(
+            account_id=record.account_id,
+            amount=-get_transactions_balance_change(record.type, record.amount),
+        )
+
+        rollup_repository: DailyTransactionRollupRepository = DailyTransactionRollupRepository(session=self.session)
+        await rollup_repository.change(
+            user_id=record.user_id,
+            transaction_type=record.type,
+            due_date=record.due_date,
+            amount=-record.amount,
+            count=-1,
+        )
+
+        await super().delete(record)
+
+    async def get_user_transaction_periods(self, user_id: int) -> list[tuple[int, int]]:
         query_result: Result[tuple[int, int]] = await self.session.execute(
-            select(
-                func.DATE_PART('YEAR', Transaction.due_date),
-                func.DATE_PART('MONTH', Transaction.due_date),
-            ).where(
-                Transaction.account.has(user=user),
-            ),
+            _USER_TRANSACTION_PERIODS_QUERY,
+            {'user_id': user_id},
         )
 
         return list(query_result.unique().all())
 
-    async def get_user_transactions_sum_for_summary_period(
+    async def stream_user_transactions(
         self,
-        user: User,
-        transactions_type: TransactionType,
-        summary_period_type: SummaryPeriodType,
-    ) -> float:
-        period_conditions: list[ColumnElement[bool]] = []
+        user_id: int,
+        columns: Sequence[InstrumentedAttribute[Any]],
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        query_result: AsyncResult[Any] = await self.session.stream(
+            select(*columns).where(
+                Transaction.user_id == user_id,
+            ).order_by(
+                Transaction.due_date,
+                Transaction.due_time,
+                Transaction.id,
+            ).execution_options(
+                yield_per=batch_size,
+            ),
+        )
+
+        async for rows_batch in query_result.mappings().partitions():
+            yield rows_batch
+
+    async def get_user_transaction_sums_for_summary_periods(
+        self,
+        user_id: int,
+        transaction_types: tuple[TransactionType, ...],
+    ) -> dict[tuple[SummaryPeriodType, TransactionType], float]:
         today_date: date = datetime.today().date()
+        sum_keys: list[tuple[SummaryPeriodType, TransactionType]] = [
+            (summary_period_type, transaction_type)
+            for summary_period_type in SummaryPeriodType
+            for transaction_type in transaction_types
+        ]
+        query_parameters: dict[str, Any] = {'user_id': user_id}
 
-        if summary_period_type in {SummaryPeriodType.CURRENT_YEAR, SummaryPeriodType.CURRENT_MONTH}:
-            period_conditions.append(func.DATE_PART('YEAR', Transaction.due_date) == today_date.year)
+        for summary_period_type in SummaryPeriodType:
+            period_boundaries: tuple[date, date] | None = get_summary_period_boundaries(summary_period_type, today_date)
 
-        if summary_period_type is SummaryPeriodType.CURRENT_MONTH:
-            period_conditions.append(func.DATE_PART('MONTH', Transaction.due_date) == today_date.month)
+            if period_boundaries is not None:
+                (first_date_key, next_first_date_key) = _get_summary_period_parameter_keys(summary_period_type)
+                query_parameters[first_date_key] = period_boundaries[0]
+                query_parameters[next_first_date_key] = period_boundaries[1]
 
-        query_result: Result[tuple[float]] = await self.session.execute(
-            select(
-                func.SUM(Transaction.amount),
-            ).where(
-                Transaction.account.has(user=user),
-                Transaction.type == transactions_type,
-                *period_conditions,
-            ),
+        query_result: Result[tuple[float | None, ...]] = await self.session.execute(
+            _select_user_transaction_sums_for_summary_periods(transaction_types),
+            query_parameters,
         )
 
-        return query_result.scalars().one_or_none() or 0
+        return {
+            sum_key: sum_value or 0.0
+            for (sum_key, sum_value) in zip(sum_keys, query_result.one())
+        }
 
     async def get_user_transaction_sums_by_dates(
         self,
-        user: User,
+        user_id: int,
         transaction_type: TransactionType,
         first_date: date,
         last_date: date,
     ) -> list[tuple[date, float]]:
         query_result: Result[tuple[date, float]] = await self.session.execute(
-            select(
-                Transaction.due_date.label('date'),
-                func.SUM(Transaction.amount).label('sum'),
-            ).where(
-                Transaction.account.has(user=user),
-                Transaction.type == transaction_type,
-                Transaction.due_date.between(first_date, last_date),
-            ).group_by(
-                Transaction.due_date,
-            ).order_by(
-                Transaction.due_date,
-            ),
+            _USER_TRANSACTION_SUMS_BY_DATES_QUERY,
+            {
+                'user_id': user_id,
+                'transaction_type': transaction_type,
+                'first_date': first_date,
+                'last_date': last_date,
+            },
         )
 
         return fill_missing_dates_with_default_value(
-            date_related_list=list(query_result.scalars().all()),
-            default_value=0,
+            date_related_list=list(query_result.tuples().all()),
+            default_value=0.0,
             first_date=first_date,
             last_date=last_date,
         )
 
-    async def get_current_month_user_transaction_statistics(
+    async def get_current_month_user_transaction_trend(
         self,
-        user: User,
+        user_id: int,
         transaction_type: TransactionType,
     ) -> list[tuple[date, float, float]]:
-        current_month_query: Subquery = select(
-            func.DATE_PART('DAY', Transaction.due_date).label('day'),
-            Transaction.due_date.label('date'),
-            func.SUM(Transaction.amount).label('amount'),
-        ).where(
-            Transaction.account.has(user=user),
-            Transaction.type == transaction_type,
-        ).group_by(
-            Transaction.due_date,
-        ).subquery()
-
-        average_month_query: Subquery = select(
-            current_month_query.c.day,
-            func.AVG(current_month_query.c.amount).label('average_amount'),
-        ).group_by(
-            current_month_query.c.day,
-        ).subquery()
-
         (first_date, last_date) = get_current_month_boundaries()
 
         query_result: Result[tuple[date, float, float]] = await self.session.execute(
-            select(
-                current_month_query.c.date,
-                current_month_query.c.amount.label('current_amount'),
-                average_month_query.c.average_amount,
-            ).join(
-                average_month_query,
-                average_month_query.c.day == current_month_query.c.day,
-            ).where(
-                current_month_query.c.date.between(first_date, last_date),
-            ).order_by(
-                current_month_query.c.day,
-            ),
+            _CURRENT_MONTH_USER_TRANSACTION_TREND_QUERY,
+            {
+                'user_id': user_id,
+                'transaction_type': transaction_type,
+                'first_date': first_date,
+                'last_date': last_date,
+            },
         )
 
-        return fill_missing_dates_with_default_value(
-            date_related_list=list(query_result.scalars().all()),
-            default_value=(0, 0),
-            first_date=first_date,
-            last_date=last_date,
+        return list(query_result.tuples().all())
+
+
+# Hot read queries are built once with bound parameters, so neither their construction nor their
+# cache key is repeated per request, and their SQL stays identical for asyncpg prepared statements.
+_USER_TRANSACTION_PERIODS_QUERY: Select[tuple[int, int]] = select(
+    func.DATE_PART('YEAR', Transaction.due_date),
+    func.DATE_PART('MONTH', Transaction.due_date),
+).where(
+    Transaction.user_id == bindparam('user_id'),
+)
+
+_USER_TRANSACTION_SUMS_BY_DATES_QUERY: Select[tuple[date, float]] = select(
+    DailyTransactionRollup.due_date.label('date'),
+    DailyTransactionRollup.amount.label('sum'),
+).where(
+    DailyTransactionRollup.user_id == bindparam('user_id'),
+    DailyTransactionRollup.type == bindparam('transaction_type'),
+    DailyTransactionRollup.due_date.between(bindparam('first_date'), bindparam('last_date')),
+    DailyTransactionRollup.count != 0,
+).order_by(
+    DailyTransactionRollup.due_date,
+)
+
+_ROLLUP_DAY: ColumnElement[float] = func.DATE_PART('DAY', DailyTransactionRollup.due_date)
+_USER_ROLLUP_CONDITIONS: tuple[ColumnElement[bool], ...] = (
+    DailyTransactionRollup.user_id == bindparam('user_id'),
+    DailyTransactionRollup.type == bindparam('transaction_type'),
+    DailyTransactionRollup.count != 0,
+)
+_AVERAGE_MONTH_QUERY: Subquery = select(
+    _ROLLUP_DAY.label('day'),
+    func.AVG(DailyTransactionRollup.amount).label('average_amount'),
+).where(
+    *_USER_ROLLUP_CONDITIONS,
+).group_by(
+    _ROLLUP_DAY,
+).subquery()
+
+_CURRENT_MONTH_STATISTICS_QUERY: Subquery = select(
+    DailyTransactionRollup.due_date.label('date'),
+    DailyTransactionRollup.amount.label('current_amount'),
+    _AVERAGE_MONTH_QUERY.c.average_amount,
+).join(
+    _AVERAGE_MONTH_QUERY,
+    _AVERAGE_MONTH_QUERY.c.day == _ROLLUP_DAY,
+).where(
+    *_USER_ROLLUP_CONDITIONS,
+    DailyTransactionRollup.due_date.between(bindparam('first_date'), bindparam('last_date')),
+).subquery()
+
+# Every day of the month gets a row, which carries the running totals of the days up to it
+_CURRENT_MONTH_DAY_OFFSETS: TableValuedAlias = func.generate_series(
+    0,
+    bindparam('last_date', type_=Date) - bindparam('first_date', type_=Date),
+).table_valued('day_offset').render_derived(name='current_month_day_offsets')
+_CURRENT_MONTH_DATE: ColumnElement[date] = bindparam('first_date', type_=Date) + _CURRENT_MONTH_DAY_OFFSETS.c.day_offset
+
+_CURRENT_MONTH_USER_TRANSACTION_TREND_QUERY: Select[tuple[date, float, float]] = select(
+    _CURRENT_MONTH_DATE.label('date'),
+    func.SUM(func.COALESCE(_CURRENT_MONTH_STATISTICS_QUERY.c.current_amount, 0.0)).over(
+        order_by=_CURRENT_MONTH_DAY_OFFSETS.c.day_offset,
+    ).label('current_amount'),
+    func.SUM(func.COALESCE(_CURRENT_MONTH_STATISTICS_QUERY.c.average_amount, 0.0)).over(
+        order_by=_CURRENT_MONTH_DAY_OFFSETS.c.day_offset,
+    ).label('average_amount'),
+).select_from(
+    _CURRENT_MONTH_DAY_OFFSETS,
+).outerjoin(
+    _CURRENT_MONTH_STATISTICS_QUERY,
+    _CURRENT_MONTH_STATISTICS_QUERY.c.date == _CURRENT_MONTH_DATE,
+).order_by(
+    _CURRENT_MONTH_DAY_OFFSETS.c.day_offset,
+)
+
+
+def _get_summary_period_parameter_keys(summary_period_type: SummaryPeriodType) -> tuple[str, str]:
+    parameter_prefix: str = summary_period_type.name.lower()
+
+    return ('{0}_first_date'.format(parameter_prefix), '{0}_next_first_date'.format(parameter_prefix))
+
+@cache
+def _select_user_transaction_sums_for_summary_periods(transaction_types: tuple[TransactionType, ...]) -> Select[tuple[float | None, ...]]:
+    sum_columns: list[ColumnElement[float | None]] = []
+
+    for summary_period_type in SummaryPeriodType:
+        period_conditions: list[ColumnElement[bool]] = []
+
+        if summary_period_type is not SummaryPeriodType.ALL_TIME:
+            (first_date_key, next_first_date_key) = _get_summary_period_parameter_keys(summary_period_type)
+            period_conditions = get_due_date_period_conditions((
+                bindparam(first_date_key, type_=Date),
+                bindparam(next_first_date_key, type_=Date),
+            ))
+
+        sum_columns.extend(
+            func.SUM(Transaction.amount).filter(
+                Transaction.type == transaction_type,
+                *period_conditions,
+            )
+            for transaction_type in transaction_types
         )
+
+    return select(*sum_columns).where(
+        Transaction.user_id == bindparam('user_id'),
+        Transaction.type.in_(transaction_types),
+    )
@@ -1,8 +1,11 @@
+from typing import Any
+
+from sqlalchemy import Result, Select, bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.databases.models import User
+from core.databases.models import Transaction, User
 
-from .utilities.base import BaseRepository
+from .utilities.base import BaseRepository, LoaderProfile
 
 
 class UserRepository(BaseRepository[User]):
@@ -16,3 +19,38 @@ class UserRepository(BaseRepository[User]):
         return await self.get(
             User.username == username,
         )
+
+    async def get_data_version(self, user_id: int) -> int | None:
+        query_result: Result[tuple[int]] = await self.session.execute(
+            _USER_DATA_VERSION_QUERY,
+            {'user_id': user_id},
+        )
+
+        return query_result.scalar_one_or_none()
+
+    async def update(self, record: User, record_data: dict[str, Any], profile: LoaderProfile = (), **additional_attributes: Any) -> User:
+        record_data |= additional_attributes
+
+        if 'family_id' in record_data and record_data['family_id'] != record.family_id:
+            await self.session.execute(
+                update(Transaction).where(
+                    Transaction.user_id == record.id,
+                ).values(
+                    family_id=record_data['family_id'],
+                ).execution_options(
+                    synchronize_session=False,
+                ),
+            )
+
+        return await super().update(
+            record=record,
+            record_data=record_data,
+            profile=profile,
+        )
+
+
+_USER_DATA_VERSION_QUERY: Select[tuple[int]] = select(
+    User.data_version,
+).where(
+    User.id == bindparam('user_id'),
+)
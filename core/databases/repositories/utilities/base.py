@@ -1,70 +1,113 @@
-from typing import Any, Awaitable, Generic, Type, TypeVar
+from typing import Any, Awaitable, Generic, Sequence, Type, TypeAlias, TypeVar
 
-from sqlalchemy.engine import Result
+from sqlalchemy.engine import Result, Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import ColumnElement, select
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.sql import ColumnElement, Select, select, tuple_
 
 from core.databases.models.utilities.base import BaseModel
 
 
 Model = TypeVar('Model', bound=BaseModel)
 
+# Relationships are declared with `lazy='raise_on_sql'`, so the ones
+# not mentioned in a profile fail loudly once accessed.
+LoaderProfile: TypeAlias = tuple[LoaderOption, ...]
 
-class SingletonRepositoryMeta(type):
-    _instances: dict['SingletonRepositoryMeta', type] = {}
+# Columns of a unique ascending sort order to paginate records by keyset
+OrderKeys: TypeAlias = tuple[InstrumentedAttribute[Any], ...]
 
-    def __call__(cls, *args: Any, **kwargs: Any) -> type:
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
 
-        return cls._instances[cls]
-
-
-class BaseRepository(Generic[Model], metaclass=SingletonRepositoryMeta):
+class BaseRepository(Generic[Model]):
     def __init__(self, model: Type[Model], session: AsyncSession) -> None:
         self.model = model
         self.session = session
 
-    async def get_list(self, *conditions: ColumnElement[bool]) -> list[Model]:
+    async def get_list(self, *conditions: ColumnElement[bool], profile: LoaderProfile = ()) -> list[Model]:
+        query_result: Result[tuple[Model]] = await self.session.execute(
+            select(self.model).options(*profile).where(*conditions),
+        )
+
+        return list(query_result.unique().scalars().all())
+
+    async def get_page(
+        self,
+        *conditions: ColumnElement[bool],
+        order_keys: OrderKeys,
+        after: tuple[Any, ...] | None = None,
+        limit: int | None = None,
+        profile: LoaderProfile = (),
+    ) -> list[Model]:
         query_result: Result[tuple[Model]] = await self.session.execute(
-            select(self.model).where(*conditions),
+            _paginate_query(select(self.model).options(*profile).where(*conditions), order_keys, after, limit),
         )
 
         return list(query_result.unique().scalars().all())
 
-    async def get(self, *conditions: ColumnElement[bool]) -> Model | None:
+    async def get_rows_page(
+        self,
+        *conditions: ColumnElement[bool],
+        columns: Sequence[InstrumentedAttribute[Any]],
+        order_keys: OrderKeys,
+        after: tuple[Any, ...] | None = None,
+        limit: int | None = None,
+    ) -> list[Row[Any]]:
+        query_result: Result[Any] = await self.session.execute(
+            _paginate_query(select(*columns).where(*conditions), order_keys, after, limit),
+        )
+
+        return list(query_result.all())
+
+    async def get(self, *conditions: ColumnElement[bool], profile: LoaderProfile = ()) -> Model | None:
         query_result: Result[tuple[Model]] = await self.session.execute(
-            select(self.model).where(*conditions),
+            select(self.model).options(*profile).where(*conditions),
         )
 
         return query_result.unique().scalars().one_or_none()
 
-    async def get_by_id(self, record_id: int) -> Model | None:
-        return await self.session.get(self.model, record_id)
+    async def get_by_id(self, record_id: int, profile: LoaderProfile = ()) -> Model | None:
+        return await self.session.get(self.model, record_id, options=profile)
 
-    async def create(self, record_data: dict[str, Any], **additional_attributes: Any) -> Model:
+    async def refresh(self, record: Model, profile: LoaderProfile = ()) -> Model:
+        await self.session.execute(
+            select(self.model).options(*profile).where(
+                self.model.id == record.id,
+            ).execution_options(
+                populate_existing=True,
+            ),
+        )
+
+        return record
+
+    async def create(self, record_data: dict[str, Any], profile: LoaderProfile = (), **additional_attributes: Any) -> Model:
         record_data |= additional_attributes
 
         record: Model = self.model(**record_data)
 
         self.session.add(record)
-        await self.session.commit()
-        await self.session.refresh(record)
+        await self.session.flush()
 
-        return record
+        return await self.refresh(record, profile=profile) if profile else record
 
-    async def update(self, record: Model, record_data: dict[str, Any], **additional_attributes: Any) -> Model:
+    async def update(self, record: Model, record_data: dict[str, Any], profile: LoaderProfile = (), **additional_attributes: Any) -> Model:
         record_data |= additional_attributes
 
         for field_key, field_value in record_data.items():
             setattr(record, field_key, await field_value if isinstance(field_value, Awaitable) else field_value)
 
         self.session.add(record)
-        await self.session.commit()
-        await self.session.refresh(record)
+        await self.session.flush()
 
-        return record
+        return await self.refresh(record, profile=profile) if profile else record
 
     async def delete(self, record: Model) -> None:
         await self.session.delete(record)
-        await self.session.commit()
+        await self.session.flush()
+
+
+def _paginate_query(query: Select[Any], order_keys: OrderKeys, after: tuple[Any, ...] | None, limit: int | None) -> Select[Any]:
+    if after is not None:
+        query = query.where(tuple_(*order_keys) > tuple_(*after))
+
+    return query.order_by(*order_keys).limit(limit)
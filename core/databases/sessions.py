@@ -1,3 +1,5 @@
+from typing import Any
+
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -5,14 +7,46 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from core.databases.metrics import TimedAsyncAdaptedQueuePool, instrument_engine
 from core.settings import settings
 
 
+POSTGRES_ENGINE_OPTIONS: dict[str, Any] = {
+    'poolclass': TimedAsyncAdaptedQueuePool,
+    'pool_size': settings.POSTGRES_POOL_SIZE,
+    'max_overflow': settings.POSTGRES_POOL_MAX_OVERFLOW,
+    'pool_timeout': settings.POSTGRES_POOL_TIMEOUT,
+    'pool_recycle': settings.POSTGRES_POOL_RECYCLE,
+    'pool_pre_ping': settings.POSTGRES_POOL_PRE_PING,
+    'connect_args': {
+        'statement_cache_size': settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        'prepared_statement_cache_size': settings.POSTGRES_PREPARED_STATEMENT_CACHE_SIZE,
+        'server_settings': settings.POSTGRES_SERVER_SETTINGS,
+    },
+}
+
+
 postgres_engine: AsyncEngine = create_async_engine(
     url=settings.POSTGRES_URL,
+    **POSTGRES_ENGINE_OPTIONS,
 )
 
+postgres_replica_engine: AsyncEngine | None = create_async_engine(
+    url=settings.POSTGRES_REPLICA_URL,
+    **POSTGRES_ENGINE_OPTIONS,
+) if settings.POSTGRES_REPLICA_URL else None
+
+for engine in (postgres_engine, postgres_replica_engine):
+    if engine is not None:
+        instrument_engine(engine)
+
+
 PostgresSession: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=postgres_engine,
     expire_on_commit=False,
 )
+
+PostgresReplicaSession: async_sessionmaker[AsyncSession] | None = async_sessionmaker(
+    bind=postgres_replica_engine,
+    expire_on_commit=False,
+) if postgres_replica_engine else None
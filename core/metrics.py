@@ -0,0 +1,143 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable
+
+
+PROMETHEUS_MEDIA_TYPE: str = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS: tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Metric(ABC):
+    kind: str = 'untyped'
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+
+    def render(self) -> list[str]:
+        return [
+            '# HELP {0} {1}'.format(self.name, self.documentation),
+            '# TYPE {0} {1}'.format(self.name, self.kind),
+            *self.render_samples(),
+        ]
+
+    @abstractmethod
+    def render_samples(self) -> list[str]:
+        ...
+
+    def format_labels(self, label_values: tuple[str, ...], **extra_labels: str) -> str:
+        labels: list[tuple[str, str]] = [*zip(self.label_names, label_values), *extra_labels.items()]
+
+        if not labels:
+            return ''
+
+        return '{{{0}}}'.format(','.join(
+            '{0}="{1}"'.format(label_name, _escape_label_value(label_value))
+            for (label_name, label_value) in labels
+        ))
+
+
+class Counter(Metric):
+    kind: str = 'counter'
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+
+        self.totals: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self.totals[label_values] = self.totals.get(label_values, 0) + amount
+
+    def render_samples(self) -> list[str]:
+        return [
+            '{0}{1} {2}'.format(self.name, self.format_labels(label_values), _format_number(total))
+            for (label_values, total) in self.totals.items()
+        ]
+
+class Gauge(Counter):
+    kind: str = 'gauge'
+
+    def dec(self, *label_values: str, amount: float = 1) -> None:
+        self.inc(*label_values, amount=-amount)
+
+# Values are read only once scraped, so that hot paths keep their plain counters
+class CallbackCounter(Metric):
+    kind: str = 'counter'
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], float]) -> None:
+        super().__init__(name, documentation)
+
+        self.callback = callback
+
+    def render_samples(self) -> list[str]:
+        return ['{0} {1}'.format(self.name, _format_number(self.callback()))]
+
+class Histogram(Metric):
+    kind: str = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+
+        self.buckets = buckets
+        self.bucket_counts: dict[tuple[str, ...], list[int]] = {}
+        self.sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, observation: float, *label_values: str) -> None:
+        if label_values not in self.bucket_counts:
+            self.bucket_counts[label_values] = [0] * (len(self.buckets) + 1)
+            self.sums[label_values] = 0
+
+        self.bucket_counts[label_values][bisect_left(self.buckets, observation)] += 1
+        self.sums[label_values] += observation
+
+    def render_samples(self) -> list[str]:
+        samples: list[str] = []
+
+        for (label_values, bucket_counts) in self.bucket_counts.items():
+            cumulative_count: int = 0
+
+            for (bucket, bucket_count) in zip((*map(_format_number, self.buckets), '+Inf'), bucket_counts):
+                cumulative_count += bucket_count
+                samples.append('{0}_bucket{1} {2}'.format(self.name, self.format_labels(label_values, le=bucket), cumulative_count))
+
+            samples.append('{0}_sum{1} {2}'.format(self.name, self.format_labels(label_values), _format_number(self.sums[label_values])))
+            samples.append('{0}_count{1} {2}'.format(self.name, self.format_labels(label_values), cumulative_count))
+
+        return samples
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self.metrics:
+            raise ValueError('Metric {0} is already registered'.format(metric.name))
+
+        self.metrics[metric.name] = metric
+
+    def render(self) -> str:
+        return ''.join(
+            '{0}\n'.format(line)
+            for metric in self.metrics.values()
+            for line in metric.render()
+        )
+
+
+metrics_registry: MetricsRegistry = MetricsRegistry()
+
+
+def _format_number(number: float) -> str:
+    return str(int(number)) if float(number).is_integer() else repr(float(number))
+
+def _escape_label_value(label_value: str) -> str:
+    return label_value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
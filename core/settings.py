@@ -1,3 +1,4 @@
+from json import loads as load_from_json
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +10,12 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str
     JWT_ACCESS_SECRET_KEY: str
 
+    # Defaults are the ones of `argon2.PasswordHasher`, so existing hashes stay current
+    PASSWORD_HASHING_CONCURRENCY: int = 2
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+
     POSTGRES_DRIVER: str
     POSTGRES_HOST: str
     POSTGRES_PORT: str
@@ -18,6 +25,22 @@ class Settings(BaseSettings):
 
     POSTGRES_URL: PostgresDsn | None
 
+    # Reads of users, who have written within the window, stay on the primary
+    POSTGRES_REPLICA_URL: PostgresDsn | None = None
+    POSTGRES_READ_YOUR_WRITES_WINDOW: float = 5
+
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_POOL_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 30
+    POSTGRES_POOL_RECYCLE: int = -1
+    POSTGRES_POOL_PRE_PING: bool = False
+
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100
+    POSTGRES_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    POSTGRES_SERVER_SETTINGS: dict[str, str] = {
+        'jit': 'off',
+    }
+
     @validator('POSTGRES_URL', pre=True)
     def assemble_postgres_dsn(cls, value: Any, values: dict[str, Any]) -> str:
         if isinstance(value, str):
@@ -32,6 +55,13 @@ class Settings(BaseSettings):
             path='/{0}'.format(values.get('POSTGRES_DATABASE')),
         )
 
+    @validator('POSTGRES_SERVER_SETTINGS', pre=True)
+    def parse_postgres_server_settings(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return load_from_json(value)
+
+        return value
+
 
 _dotenv_path: Path = Path('configurations') / '.env'
 
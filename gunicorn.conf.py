@@ -0,0 +1,13 @@
+from gunicorn.arbiter import Arbiter
+
+
+# Metrics are kept in the memory of the process, so that every scrape has to reach
+# the only worker there is. Instances are scaled by containers, each scraped on its own.
+workers: int = 1
+
+
+def on_starting(server: Arbiter) -> None:
+    if server.cfg.workers != 1:
+        raise RuntimeError('Metrics of {0} workers would be scraped from a random one of them, run a single worker per instance'.format(
+            server.cfg.workers,
+        ))
@@ -0,0 +1,48 @@
+"""Denormalise owners of the account onto transaction
+
+Revision ID: 4b7e2d91c3a6
+Revises: 9d2f60a4e1b8
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = '4b7e2d91c3a6'
+down_revision: str | tuple[str, ...] | None = '9d2f60a4e1b8'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('transaction', sa.Column('user_id', sa.BigInteger(), nullable=True))
+    op.add_column('transaction', sa.Column('family_id', sa.BigInteger(), nullable=True))
+
+    op.execute(
+        'UPDATE "transaction" '
+        'SET user_id = account.user_id, family_id = "user".family_id '
+        'FROM account JOIN "user" ON "user".id = account.user_id '
+        'WHERE account.id = "transaction".account_id',
+    )
+
+    op.alter_column('transaction', 'user_id', nullable=False)
+    op.create_foreign_key('transaction_user_id_fkey', 'transaction', 'user', ['user_id'], ['id'])
+    op.create_foreign_key('transaction_family_id_fkey', 'transaction', 'family', ['family_id'], ['id'])
+
+    op.create_index('ix_transaction_family_id', 'transaction', ['family_id'])
+    op.create_index('ix_transaction_user_id_type_due_date', 'transaction', ['user_id', 'type', 'due_date'])
+    op.create_index('ix_transaction_user_id_due_date', 'transaction', ['user_id', 'due_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transaction_user_id_due_date', table_name='transaction')
+    op.drop_index('ix_transaction_user_id_type_due_date', table_name='transaction')
+    op.drop_index('ix_transaction_family_id', table_name='transaction')
+
+    op.drop_constraint('transaction_family_id_fkey', 'transaction', type_='foreignkey')
+    op.drop_constraint('transaction_user_id_fkey', 'transaction', type_='foreignkey')
+
+    op.drop_column('transaction', 'family_id')
+    op.drop_column('transaction', 'user_id')
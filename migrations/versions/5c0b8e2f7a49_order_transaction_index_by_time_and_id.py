@@ -0,0 +1,25 @@
+"""Order transaction index by due time & ID
+
+Revision ID: 5c0b8e2f7a49
+Revises: e35a7c0d9f12
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+from alembic import op
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = '5c0b8e2f7a49'
+down_revision: str | tuple[str, ...] | None = 'e35a7c0d9f12'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_transaction_user_id_due_date_due_time_id', 'transaction', ['user_id', 'due_date', 'due_time', 'id'])
+    op.drop_index('ix_transaction_user_id_due_date', table_name='transaction')
+
+
+def downgrade() -> None:
+    op.create_index('ix_transaction_user_id_due_date', 'transaction', ['user_id', 'due_date'])
+    op.drop_index('ix_transaction_user_id_due_date_due_time_id', table_name='transaction')
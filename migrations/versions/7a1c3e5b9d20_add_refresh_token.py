@@ -0,0 +1,35 @@
+"""Add refresh token
+
+Revision ID: 7a1c3e5b9d20
+Revises: 5c0b8e2f7a49
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = '7a1c3e5b9d20'
+down_revision: str | tuple[str, ...] | None = '5c0b8e2f7a49'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'refresh_token',
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('token_digest', sa.LargeBinary(), nullable=False),
+        sa.Column('expiration_time', sa.DateTime(), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('token_digest'),
+    )
+    op.create_index(op.f('ix_refresh_token_user_id'), 'refresh_token', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_refresh_token_user_id'), table_name='refresh_token')
+    op.drop_table('refresh_token')
@@ -0,0 +1,24 @@
+"""Add refresh token rotation time
+
+Revision ID: 893037397420
+Revises: b3e8d41f6c72
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = '893037397420'
+down_revision: str | tuple[str, ...] | None = 'b3e8d41f6c72'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('refresh_token', sa.Column('rotation_time', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('refresh_token', 'rotation_time')
@@ -0,0 +1,34 @@
+"""Add transactions balance to account
+
+Revision ID: 9d2f60a4e1b8
+Revises: 1f0c9a7b2d64
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = '9d2f60a4e1b8'
+down_revision: str | tuple[str, ...] | None = '1f0c9a7b2d64'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('account', sa.Column('transactions_balance', sa.Float(), server_default='0', nullable=False))
+
+    op.execute(
+        'UPDATE account SET transactions_balance = COALESCE(('
+        'SELECT SUM(CASE "transaction".type '
+        "WHEN 'Income' THEN \"transaction\".amount "
+        "WHEN 'Outcome' THEN -\"transaction\".amount "
+        'ELSE 0 END) '
+        'FROM "transaction" WHERE "transaction".account_id = account.id'
+        '), 0)',
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('account', 'transactions_balance')
@@ -0,0 +1,24 @@
+"""Add data version to user
+
+Revision ID: b3e8d41f6c72
+Revises: 7a1c3e5b9d20
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = 'b3e8d41f6c72'
+down_revision: str | tuple[str, ...] | None = '7a1c3e5b9d20'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('user', sa.Column('data_version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('user', 'data_version')
@@ -0,0 +1,43 @@
+"""Add daily transaction rollup
+
+Revision ID: e35a7c0d9f12
+Revises: 4b7e2d91c3a6
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = 'e35a7c0d9f12'
+down_revision: str | tuple[str, ...] | None = '4b7e2d91c3a6'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_transaction_rollup',
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('type', postgresql.ENUM(name='transactiontype', create_type=False), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('count', sa.BigInteger(), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'type', 'due_date'),
+    )
+
+    op.execute(
+        'INSERT INTO daily_transaction_rollup (user_id, type, due_date, amount, count) '
+        'SELECT user_id, type, due_date, SUM(amount), COUNT(id) '
+        'FROM "transaction" '
+        'GROUP BY user_id, type, due_date',
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_transaction_rollup')
@@ -1,23 +1,35 @@
 from calendar import monthrange
 from datetime import date, datetime
-from typing import AsyncIterator
+from typing import AsyncIterator, Iterator
 
 from httpx import AsyncClient
-from pytest import fixture
+from pytest import FixtureRequest, Mark, fail, fixture
 
 from app import api
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.sessions import (
+    define_postgres_replica_session,
+    define_postgres_session,
+)
 from app.dependencies.user import identify_user
 
 from .mock.databases import (
+    RequestStatementBudget,
+    count_statements,
     create_database,
     create_database_tables,
     drop_database,
 )
-from .mock.dependencies import define_test_postgres_session, identify_test_user
+from .mock.dependencies import (
+    define_test_postgres_replica_session,
+    define_test_postgres_session,
+    identify_test_user,
+)
+
 
+STATEMENT_BUDGET_MARKER: str = 'statement_budget'
 
-@fixture(scope='session', autouse=True)
+
+@fixture(scope='module', autouse=True)
 async def manage_database() -> AsyncIterator[None]:
     await drop_database()
     await create_database()
@@ -36,6 +48,7 @@ def anyio_backend() -> str:
 @fixture(scope='session')
 async def test_client() -> AsyncIterator[AsyncClient]:
     api.dependency_overrides[define_postgres_session] = define_test_postgres_session
+    api.dependency_overrides[define_postgres_replica_session] = define_test_postgres_replica_session
     api.dependency_overrides[identify_user] = identify_test_user
 
     async with AsyncClient(app=api, base_url='http://testserver') as api_test_client:
@@ -47,3 +60,31 @@ def current_month_days_number() -> int:
     today_date: date = datetime.today().date()
 
     return monthrange(year=today_date.year, month=today_date.month)[1]
+
+
+# Every test of the API declares its budget, so that N+1 queries fail the suite once introduced
+@fixture(autouse=True)
+def check_statement_budget(request: FixtureRequest) -> Iterator[None]:
+    if 'test_client' not in request.fixturenames:
+        yield
+        return
+
+    budget_marker: Mark | None = request.node.get_closest_marker(STATEMENT_BUDGET_MARKER)
+
+    if budget_marker is None:
+        fail('{0} requests the API without declaring its {1}'.format(request.node.nodeid, STATEMENT_BUDGET_MARKER))
+
+    statements_budget: int = budget_marker.args[0]
+    test_client: AsyncClient = request.getfixturevalue('test_client')
+
+    with count_statements() as statement_counter:
+        request_statement_budget: RequestStatementBudget = RequestStatementBudget(statement_counter, statements_budget)
+
+        test_client.event_hooks['request'].append(request_statement_budget.start_request)
+        test_client.event_hooks['response'].append(request_statement_budget.check_response)
+
+        try:
+            yield
+        finally:
+            test_client.event_hooks['request'].remove(request_statement_budget.start_request)
+            test_client.event_hooks['response'].remove(request_statement_budget.check_response)
@@ -0,0 +1,21 @@
+from typing import Any
+
+from anyio import sleep_forever
+
+
+# Client of a single request, which counts the bytes of the response instead of keeping them
+class CountingAsgiClient:
+    def __init__(self) -> None:
+        self.sent_bytes_number: int = 0
+        self.request_messages: list[dict[str, Any]] = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+
+    async def receive(self) -> dict[str, Any]:
+        if self.request_messages:
+            return self.request_messages.pop()
+
+        await sleep_forever()
+
+        return {'type': 'http.disconnect'}
+
+    async def send(self, message: dict[str, Any]) -> None:
+        self.sent_bytes_number += len(message.get('body', b''))
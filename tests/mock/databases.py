@@ -1,6 +1,10 @@
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator
 
+from httpx import Request, Response
 from pydantic import PostgresDsn
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.event import listen, remove
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -10,7 +14,12 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import insert, text
 
+from core.databases.metrics import instrument_engine
 from core.databases.models.utilities.base import BaseModel
+from core.databases.repositories import (
+    AccountRepository,
+    DailyTransactionRollupRepository,
+)
 
 from .settings import test_settings
 from .utilities.callables import get_records_data_from_json
@@ -27,19 +36,113 @@ _POSTGRES_DEFAULT_DATABASE_URL: str = PostgresDsn.build(
 )
 
 
+# Lagging replica, which never receives the writes of the primary
+TEST_POSTGRES_REPLICA_DATABASE: str = '{0}_replica'.format(test_settings.POSTGRES_DATABASE)
+
+_POSTGRES_REPLICA_DATABASE_URL: str = PostgresDsn.build(
+    scheme=test_settings.POSTGRES_DRIVER,
+    user=test_settings.POSTGRES_USERNAME,
+    password=test_settings.POSTGRES_PASSWORD,
+    host=test_settings.POSTGRES_HOST,
+    port=test_settings.POSTGRES_PORT,
+    path='/{0}'.format(TEST_POSTGRES_REPLICA_DATABASE),
+)
+
+
 test_postgres_engine: AsyncEngine = create_async_engine(
     url=test_settings.POSTGRES_URL,
     poolclass=NullPool,
 )
 
+test_postgres_replica_engine: AsyncEngine = create_async_engine(
+    url=_POSTGRES_REPLICA_DATABASE_URL,
+    poolclass=NullPool,
+)
+
+for engine in (test_postgres_engine, test_postgres_replica_engine):
+    instrument_engine(engine)
+
 
 TestPostgresSession: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=test_postgres_engine,
     expire_on_commit=False,
 )
 
+TestPostgresReplicaSession: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    bind=test_postgres_replica_engine,
+    expire_on_commit=False,
+)
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.statements_number: int = 0
+        self.rows_number: int = 0
+
+    def count_statement(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        statement_parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        self.statements_number += 1
+
+    def count_rows(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        statement_parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        self.rows_number += max(cursor.rowcount, 0)
+
+
+class RequestStatementBudget:
+    def __init__(self, statement_counter: StatementCounter, statements_budget: int) -> None:
+        self.statement_counter: StatementCounter = statement_counter
+        self.statements_budget: int = statements_budget
+        self.request_starts: list[tuple[int, int]] = []
+
+    async def start_request(self, test_request: Request) -> None:
+        self.request_starts.append((self.statement_counter.statements_number, self.statement_counter.rows_number))
+
+    async def check_response(self, test_response: Response) -> None:
+        (started_statements_number, started_rows_number) = self.request_starts.pop()
+        statements_number: int = self.statement_counter.statements_number - started_statements_number
+
+        assert statements_number <= self.statements_budget, (
+            '{0} {1} has emitted {2} statements of {3} rows, while its budget is {4}'.format(
+                test_response.request.method,
+                test_response.request.url.path,
+                statements_number,
+                self.statement_counter.rows_number - started_rows_number,
+                self.statements_budget,
+            )
+        )
+
+
+@contextmanager
+def count_statements() -> Iterator[StatementCounter]:
+    statement_counter: StatementCounter = StatementCounter()
 
-async def create_database() -> None:
+    for engine in (test_postgres_engine, test_postgres_replica_engine):
+        listen(engine.sync_engine, 'before_cursor_execute', statement_counter.count_statement)
+        listen(engine.sync_engine, 'after_cursor_execute', statement_counter.count_rows)
+
+    try:
+        yield statement_counter
+    finally:
+        for engine in (test_postgres_engine, test_postgres_replica_engine):
+            remove(engine.sync_engine, 'before_cursor_execute', statement_counter.count_statement)
+            remove(engine.sync_engine, 'after_cursor_execute', statement_counter.count_rows)
+
+
+async def create_database(database_name: str = test_settings.POSTGRES_DATABASE) -> None:
     engine: AsyncEngine = create_async_engine(
         url=_POSTGRES_DEFAULT_DATABASE_URL,
         isolation_level='AUTOCOMMIT',
@@ -48,14 +151,14 @@ async def create_database() -> None:
     async with engine.connect() as database_connection:
         await database_connection.execute(
             text('CREATE DATABASE "{database_name}"'.format(
-                database_name=test_settings.POSTGRES_DATABASE,
+                database_name=database_name,
             )),
         )
 
     await engine.dispose()
 
 
-async def drop_database() -> None:
+async def drop_database(database_name: str = test_settings.POSTGRES_DATABASE) -> None:
     engine: AsyncEngine = create_async_engine(
         url=_POSTGRES_DEFAULT_DATABASE_URL,
         isolation_level='AUTOCOMMIT',
@@ -64,13 +167,18 @@ async def drop_database() -> None:
     async with engine.connect() as database_connection:
         await database_connection.execute(
             text('DROP DATABASE IF EXISTS "{database_name}" WITH (FORCE)'.format(
-                database_name=test_settings.POSTGRES_DATABASE,
+                database_name=database_name,
             )),
         )
 
     await engine.dispose()
 
 
+async def create_replica_database_tables() -> None:
+    async with test_postgres_replica_engine.begin() as database_connection:
+        await database_connection.run_sync(BaseModel.metadata.create_all)
+
+
 async def create_database_tables() -> None:
     engine: AsyncEngine = create_async_engine(
         url=test_settings.POSTGRES_URL,
@@ -95,3 +203,8 @@ async def create_database_tables() -> None:
             )
 
     await engine.dispose()
+
+    async with TestPostgresSession() as session:
+        await AccountRepository(session=session).rebuild_transactions_balances()
+        await DailyTransactionRollupRepository(session=session).rebuild()
+        await session.commit()
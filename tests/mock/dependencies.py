@@ -1,26 +1,42 @@
 from typing import AsyncIterator
 
-from fastapi import Depends, Header
+from fastapi import Depends, Header, Request
 from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.sessions import (
+    attribute_session_to_user,
+    define_postgres_session,
+)
+from app.schemas.user import UserIdentityData
+from app.utilities.routing import join_unit_of_work
 from core.databases.models import User
 
-from .databases import TestPostgresSession
+from .databases import TestPostgresReplicaSession, TestPostgresSession
 
 
-async def define_test_postgres_session() -> AsyncIterator[AsyncSession]:
+async def define_test_postgres_session(request: Request) -> AsyncIterator[AsyncSession]:
+    async with TestPostgresSession() as test_postgres_session:
+        yield join_unit_of_work(request, test_postgres_session)
+
+async def define_test_postgres_replica_session() -> AsyncIterator[AsyncSession]:
     async with TestPostgresSession() as test_postgres_session:
         yield test_postgres_session
 
+async def define_test_postgres_lagging_replica_session() -> AsyncIterator[AsyncSession]:
+    async with TestPostgresReplicaSession() as test_postgres_replica_session:
+        yield test_postgres_replica_session
+
 
 async def identify_test_user(
     session: AsyncSession = Depends(define_postgres_session),
     test_username: str = Header(default='test-user'),
-) -> User:
+) -> UserIdentityData:
     query_result: Result[tuple[User]] = await session.execute(
         select(User).where(User.username == test_username),
     )
 
-    return query_result.unique().scalars().one()
+    user: User = query_result.unique().scalars().one()
+    attribute_session_to_user(session, user.id)
+
+    return UserIdentityData.from_orm(user)
@@ -5,19 +5,23 @@ from httpx import AsyncClient, Response
 from pytest import mark, param
 
 from core.databases.models.utilities.types import CurrencyType
+from core.databases.repositories import DailyTransactionRollupRepository
 from tests.base.router_endpoint_base_test_class import (
     RouterEndpointBaseTestClass,
 )
+from tests.mock.databases import TestPostgresSession
 
 
+@mark.statement_budget(3)
 @mark.anyio
 async def test_get_balances(test_client: AsyncClient) -> None:
     response: Response = await test_client.get('/account/balances')
 
     assert response.status_code == status.HTTP_200_OK, response.text
     assert isinstance(response.json(), list)
-    assert response.json()
+    assert {'account': 'Account 1', 'balance': 100} in response.json()
 
+@mark.statement_budget(3)
 @mark.anyio
 async def test_get_accounts(test_client: AsyncClient) -> None:
     response: Response = await test_client.get('/account/list')
@@ -27,6 +31,7 @@ async def test_get_accounts(test_client: AsyncClient) -> None:
     assert response.json()
 
 
+@mark.statement_budget(3)
 class TestCreateAccount(RouterEndpointBaseTestClass, http_method='POST', endpoint='/account/create'):
     @mark.parametrize('test_data, expected_data', (
         param(
@@ -91,6 +96,7 @@ class TestCreateAccount(RouterEndpointBaseTestClass, http_method='POST', endpoin
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
 
 
+@mark.statement_budget(4)
 class TestUpdateAccount(RouterEndpointBaseTestClass, http_method='PATCH', endpoint='/account/update'):
     @mark.parametrize('test_id, test_data, expected_data', (
         param(
@@ -201,6 +207,7 @@ class TestUpdateAccount(RouterEndpointBaseTestClass, http_method='PATCH', endpoi
         assert response.status_code == expected_status_code, response.text
 
 
+@mark.statement_budget(8)
 class TestDeleteAccount(RouterEndpointBaseTestClass, http_method='DELETE', endpoint='/account/delete'):
     @mark.parametrize('test_id', (
         1,
@@ -218,6 +225,12 @@ class TestDeleteAccount(RouterEndpointBaseTestClass, http_method='DELETE', endpo
 
         assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
 
+        # Transactions of the deleted account are gone from the daily rollups as well
+        async with TestPostgresSession() as session:
+            rollup_repository: DailyTransactionRollupRepository = DailyTransactionRollupRepository(session=session)
+
+            assert not await rollup_repository.get_drifts()
+
     @mark.parametrize('test_id, expected_status_code', (
         param(
             999999,
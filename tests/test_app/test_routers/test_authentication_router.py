@@ -1,14 +1,30 @@
+from itertools import count
 from typing import Any
 
+from anyio import create_task_group, sleep
 from fastapi import status
 from httpx import AsyncClient, Response
 from pytest import mark, param
 
+from app.utilities.security.jwt import (
+    access_token_cache,
+    create_access_token,
+    decode_access_token,
+)
+from app.utilities.security.passwords import verify_password
+from app.utilities.security.refresh_tokens import (
+    digest_refresh_token,
+    issue_refresh_token,
+    revoked_refresh_tokens,
+    rotate_refresh_token,
+)
 from tests.base.router_endpoint_base_test_class import (
     RouterEndpointBaseTestClass,
 )
+from tests.mock.databases import TestPostgresSession
 
 
+@mark.statement_budget(4)
 class TestSignUp(RouterEndpointBaseTestClass, http_method='POST', endpoint='/sign-up'):
     @mark.parametrize('test_data', (
         param(
@@ -93,6 +109,7 @@ class TestSignUp(RouterEndpointBaseTestClass, http_method='POST', endpoint='/sig
         assert response.status_code == expected_status_code, response.text
 
 
+@mark.statement_budget(3)
 class TestSignIn(RouterEndpointBaseTestClass, http_method='GET', endpoint='/sign-in'):
     @mark.parametrize('test_credentials', (
         param(
@@ -143,3 +160,137 @@ class TestSignIn(RouterEndpointBaseTestClass, http_method='GET', endpoint='/sign
         )
 
         assert response.status_code == expected_status_code, response.text
+
+
+@mark.statement_budget(3)
+@mark.anyio
+async def test_refresh_tokens(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/sign-in', auth=('test-user', 'test-password'))
+    refresh_token: str = response.json()['refresh_token']
+
+    response = await test_client.post('/token/refresh', json={'refresh_token': refresh_token})
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert decode_access_token(response.json()['access_token']) == (1, None)
+    assert response.json()['refresh_token'] != refresh_token
+
+    rotated_refresh_token: str = response.json()['refresh_token']
+
+    response = await test_client.post('/token/refresh', json={'refresh_token': rotated_refresh_token})
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+@mark.statement_budget(3)
+@mark.anyio
+async def test_refresh_tokens_with_reused_token(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/sign-in', auth=('test-user', 'test-password'))
+    refresh_token: str = response.json()['refresh_token']
+
+    response = await test_client.post('/token/refresh', json={'refresh_token': refresh_token})
+    rotated_refresh_token: str = response.json()['refresh_token']
+
+    response = await test_client.post('/token/refresh', json={'refresh_token': refresh_token})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+    response = await test_client.post('/token/refresh', json={'refresh_token': rotated_refresh_token})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+@mark.statement_budget(3)
+@mark.anyio
+async def test_refresh_tokens_reused_on_other_worker(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/sign-in', auth=('test-user', 'test-password'))
+    refresh_token: str = response.json()['refresh_token']
+
+    response = await test_client.post('/token/refresh', json={'refresh_token': refresh_token})
+    rotated_refresh_token: str = response.json()['refresh_token']
+
+    # Workers share nothing but the database
+    revoked_refresh_tokens.clear()
+
+    response = await test_client.post('/token/refresh', json={'refresh_token': refresh_token})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+    assert response.json()['detail']['message'] == 'Refresh token is revoked'
+
+    response = await test_client.post('/token/refresh', json={'refresh_token': rotated_refresh_token})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+@mark.anyio
+async def test_rotated_token_cached_after_commit() -> None:
+    async with TestPostgresSession() as session:
+        refresh_token: str = await issue_refresh_token(user_id=1, session=session)
+        await session.commit()
+
+        await rotate_refresh_token(refresh_token, session=session)
+        await session.rollback()
+
+        assert revoked_refresh_tokens.get(digest_refresh_token(refresh_token)) is None
+
+        await rotate_refresh_token(refresh_token, session=session)
+        await session.commit()
+
+        assert revoked_refresh_tokens.get(digest_refresh_token(refresh_token)) == 1
+
+@mark.statement_budget(3)
+@mark.anyio
+async def test_refresh_tokens_with_revoked_token(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/sign-in', auth=('family-member', 'test-password'))
+    refresh_token: str = response.json()['refresh_token']
+
+    response = await test_client.post('/token/revoke', json={'refresh_token': refresh_token})
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+
+    response = await test_client.post('/token/refresh', json={'refresh_token': refresh_token})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+@mark.statement_budget(1)
+@mark.parametrize('test_refresh_token', (
+    param('', id='empty'),
+    param('non-existing-token', id='non_existing'),
+))
+@mark.anyio
+async def test_refresh_tokens_with_wrong_token(test_client: AsyncClient, test_refresh_token: str) -> None:
+    response: Response = await test_client.post('/token/refresh', json={'refresh_token': test_refresh_token})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+
+@mark.anyio
+async def test_password_verification_leaves_event_loop_free() -> None:
+    ticks: list[int] = []
+
+    async with create_task_group() as task_group:
+        task_group.start_soon(_tick, ticks)
+
+        assert await verify_password(
+            '$argon2id$v=19$m=65536,t=3,p=4$wKYBeAU+vKPMc7+gAuKspQ$DQFIac/MLfJ11GyefnzwOzDKnfSMguBZGqqudjwG304',
+            'wrong-password',
+        ) is False
+
+        task_group.cancel_scope.cancel()
+
+    assert ticks
+
+def test_access_token_decoding_is_cached() -> None:
+    # Tokens of the same user & second are identical, so the ones of previous tests are forgotten
+    access_token_cache.clear()
+
+    access_token: str = create_access_token(user_id=1)
+    (hits, misses) = (access_token_cache.hits, access_token_cache.misses)
+
+    assert decode_access_token(access_token) == (1, None)
+    assert decode_access_token(access_token) == (1, None)
+    assert (access_token_cache.hits - hits, access_token_cache.misses - misses) == (1, 1)
+
+    assert decode_access_token('{0}x'.format(access_token)) == (None, 'Token is invalid')
+
+
+async def _tick(ticks: list[int]) -> None:
+    for tick_number in count(1):
+        await sleep(0.001)
+        ticks.append(tick_number)
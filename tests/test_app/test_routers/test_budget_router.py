@@ -10,6 +10,7 @@ from tests.base.router_endpoint_base_test_class import (
 )
 
 
+@mark.statement_budget(4)
 class TestGetBudgets(RouterEndpointBaseTestClass, http_method='GET', endpoint='/budget/list'):
     @mark.parametrize('test_type, expected_items_number', (
         param(
@@ -57,6 +58,7 @@ class TestGetBudgets(RouterEndpointBaseTestClass, http_method='GET', endpoint='/
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
 
 
+@mark.statement_budget(4)
 class TestGetBudget(RouterEndpointBaseTestClass, http_method='GET', endpoint='/budget/item'):
     @mark.parametrize('test_id, expected_data', (
         param(
@@ -147,6 +149,7 @@ class TestGetBudget(RouterEndpointBaseTestClass, http_method='GET', endpoint='/b
         assert response.status_code == expected_status_code, response.text
 
 
+@mark.statement_budget(7)
 class TestCreateBudget(RouterEndpointBaseTestClass, http_method='POST', endpoint='/budget/create'):
     @mark.parametrize('test_data, expected_data', (
         param(
@@ -287,6 +290,7 @@ class TestCreateBudget(RouterEndpointBaseTestClass, http_method='POST', endpoint
         assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
 
 
+@mark.statement_budget(9)
 class TestUpdateBudget(RouterEndpointBaseTestClass, http_method='PATCH', endpoint='/budget/update'):
     @mark.parametrize('test_id, test_data, expected_data', (
         param(
@@ -443,6 +447,7 @@ class TestUpdateBudget(RouterEndpointBaseTestClass, http_method='PATCH', endpoin
         assert response.status_code == expected_status_code, response.text
 
 
+@mark.statement_budget(6)
 class TestDeleteBudget(RouterEndpointBaseTestClass, http_method='DELETE', endpoint='/budget/delete'):
     @mark.parametrize('test_id', (
         1,
@@ -500,3 +505,32 @@ class TestDeleteBudget(RouterEndpointBaseTestClass, http_method='DELETE', endpoi
         )
 
         assert response.status_code == expected_status_code, response.text
+
+
+@mark.statement_budget(4)
+@mark.parametrize('test_username, expected_status_code', (
+    param('family-member', status.HTTP_200_OK),
+    param('not-family-member', status.HTTP_304_NOT_MODIFIED),
+))
+@mark.anyio
+async def test_get_budgets_follows_family_writes(
+    test_client: AsyncClient,
+    test_username: str,
+    expected_status_code: int,
+) -> None:
+    response: Response = await test_client.get('/budget/list', params={'type': BudgetType.JOINT.value})
+    entity_tag: str = response.headers['ETag']
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = await test_client.post('/category/create', headers={'test-username': test_username}, json={
+        'base_category_id': None,
+        'name': 'Category of {0}'.format(test_username),
+        'type': CategoryType.OUTCOME.value,
+    })
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+
+    response = await test_client.get('/budget/list', params={'type': BudgetType.JOINT.value}, headers={'If-None-Match': entity_tag})
+
+    assert response.status_code == expected_status_code, response.text
@@ -10,6 +10,7 @@ from tests.base.router_endpoint_base_test_class import (
 )
 
 
+@mark.statement_budget(3)
 @mark.anyio
 async def test_get_categories(test_client: AsyncClient) -> None:
     response: Response = await test_client.get('/category/list')
@@ -19,6 +20,7 @@ async def test_get_categories(test_client: AsyncClient) -> None:
     assert response.json()
 
 
+@mark.statement_budget(3)
 class TestGetCategory(RouterEndpointBaseTestClass, http_method='GET', endpoint='/category/item'):
     @mark.parametrize('test_id, expected_data', (
         param(
@@ -90,6 +92,7 @@ class TestGetCategory(RouterEndpointBaseTestClass, http_method='GET', endpoint='
         assert response.status_code == expected_status_code, response.text
 
 
+@mark.statement_budget(3)
 class TestCreateCategory(RouterEndpointBaseTestClass, http_method='POST', endpoint='/category/create'):
     @mark.parametrize('test_data, expected_data', (
         param(
@@ -154,6 +157,7 @@ class TestCreateCategory(RouterEndpointBaseTestClass, http_method='POST', endpoi
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
 
 
+@mark.statement_budget(4)
 class TestUpdateCategory(RouterEndpointBaseTestClass, http_method='PATCH', endpoint='/category/update'):
     @mark.parametrize('test_id, test_data, expected_data', (
         param(
@@ -263,6 +267,7 @@ class TestUpdateCategory(RouterEndpointBaseTestClass, http_method='PATCH', endpo
         assert response.status_code == expected_status_code, response.text
 
 
+@mark.statement_budget(7)
 class TestDeleteCategory(RouterEndpointBaseTestClass, http_method='DELETE', endpoint='/category/delete'):
     @mark.parametrize('test_id', (
         1,
@@ -320,3 +325,33 @@ class TestDeleteCategory(RouterEndpointBaseTestClass, http_method='DELETE', endp
         )
 
         assert response.status_code == expected_status_code, response.text
+
+
+@mark.statement_budget(3)
+@mark.anyio
+async def test_get_categories_is_conditional(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/category/list')
+    entity_tag: str = response.headers['ETag']
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert entity_tag.startswith('W/')
+
+    response = await test_client.get('/category/list', headers={'If-None-Match': entity_tag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED, response.text
+    assert response.headers['ETag'] == entity_tag
+    assert not response.content
+
+    response = await test_client.post('/category/create', json={
+        'base_category_id': None,
+        'name': 'Category 8',
+        'type': CategoryType.OUTCOME.value,
+    })
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+
+    response = await test_client.get('/category/list', headers={'If-None-Match': entity_tag})
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers['ETag'] != entity_tag
+    assert {'id': response.json()[-1]['id'], 'base_category_id': None, 'name': 'Category 8', 'type': CategoryType.OUTCOME.value} in response.json()
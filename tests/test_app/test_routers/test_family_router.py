@@ -3,6 +3,7 @@ from httpx import AsyncClient, Response
 from pytest import mark, param
 
 
+@mark.statement_budget(3)
 @mark.parametrize('test_username, expected_status_code', (
     param(
         'test-user',
@@ -0,0 +1,64 @@
+from typing import Any
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from pytest import mark, param
+
+from app.dependencies.user import user_identity_cache
+from app.utilities.caching import TimedLruCache
+from app.utilities.security.jwt import access_token_cache
+
+
+def get_sample_value(metrics_text: str, sample_name: str) -> float:
+    for line in metrics_text.splitlines():
+        if line.startswith('{0} '.format(sample_name)):
+            return float(line.rsplit(' ', 1)[1])
+
+    raise AssertionError('Sample {0} is missing'.format(sample_name))
+
+
+@mark.statement_budget(3)
+@mark.anyio
+async def test_get_metrics(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/category/list')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = await test_client.get('/metrics')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+
+    route_labels: str = 'method="GET",route="/category/list"'
+
+    assert get_sample_value(response.text, 'http_responses_total{{{0},status="200"}}'.format(route_labels)) >= 1
+    assert get_sample_value(response.text, 'http_request_duration_seconds_count{{{0}}}'.format(route_labels)) >= 1
+    assert get_sample_value(response.text, 'http_request_db_queries_sum{{{0}}}'.format(route_labels)) >= 2
+    assert get_sample_value(response.text, 'http_request_db_query_seconds_sum{{{0}}}'.format(route_labels)) > 0
+    assert get_sample_value(response.text, 'http_requests_in_flight') == 1
+    assert get_sample_value(response.text, 'db_query_duration_seconds_count') > 0
+    assert get_sample_value(response.text, 'db_compiled_cache_hits_total') + get_sample_value(response.text, 'db_compiled_cache_misses_total') > 0
+
+@mark.statement_budget(0)
+@mark.parametrize('test_cache_name, test_cache', (
+    param('user_identity_cache', user_identity_cache, id='user_identity'),
+    param('access_token_cache', access_token_cache, id='access_token'),
+))
+@mark.anyio
+async def test_get_metrics_of_caches(test_client: AsyncClient, test_cache_name: str, test_cache: TimedLruCache[Any, Any]) -> None:
+    response: Response = await test_client.get('/metrics')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert get_sample_value(response.text, '{0}_hits_total'.format(test_cache_name)) == test_cache.hits
+    assert get_sample_value(response.text, '{0}_misses_total'.format(test_cache_name)) == test_cache.misses
+
+@mark.statement_budget(0)
+@mark.anyio
+async def test_get_metrics_of_unmatched_route(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/not-a-route')
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+    response = await test_client.get('/metrics')
+
+    assert get_sample_value(response.text, 'http_responses_total{method="GET",route="unmatched",status="404"}') >= 1
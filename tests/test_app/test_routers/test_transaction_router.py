@@ -1,15 +1,57 @@
-from typing import Any
+from datetime import date
+from functools import partial
+from json import loads as load_from_json
+from tracemalloc import get_traced_memory
+from tracemalloc import start as start_memory_tracing
+from tracemalloc import stop as stop_memory_tracing
+from typing import Any, Callable
 
 from fastapi import status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from httpx import AsyncClient, Response
+from pydantic import parse_obj_as
 from pytest import mark, param
-
+from sqlalchemy import func, select, text
+from sqlalchemy.event import listen as listen_to_event
+from sqlalchemy.event import remove as remove_event_listener
+from sqlalchemy.orm import Session
+
+from app import api
+from app.dependencies.sessions import define_postgres_replica_session
+from app.routers.transaction import TRANSACTION_ORDER_KEYS
+from app.schemas.transaction import TransactionOutputData
+from app.schemas.utilities.types import MAX_PAGE_LIMIT, MIN_PAGE_LIMIT
+from app.utilities.security.recent_writes import RECENT_WRITE_HEADER
+from core.calendar import get_period_boundaries
+from core.databases.models import Account, Transaction, User
 from core.databases.models.utilities.types import TransactionType
+from core.databases.repositories import (
+    AccountRepository,
+    DailyTransactionRollupRepository,
+    TransactionRepository,
+)
+from core.databases.repositories.transaction import (
+    get_due_date_period_conditions,
+)
 from tests.base.router_endpoint_base_test_class import (
     RouterEndpointBaseTestClass,
 )
+from tests.mock.asgi import CountingAsgiClient
+from tests.mock.databases import (
+    TEST_POSTGRES_REPLICA_DATABASE,
+    TestPostgresSession,
+    create_database,
+    create_replica_database_tables,
+    drop_database,
+)
+from tests.mock.dependencies import (
+    define_test_postgres_lagging_replica_session,
+    define_test_postgres_replica_session,
+)
 
 
+@mark.statement_budget(3)
 @mark.anyio
 async def test_get_periods(test_client: AsyncClient) -> None:
     response: Response = await test_client.get('/transaction/periods')
@@ -19,6 +61,7 @@ async def test_get_periods(test_client: AsyncClient) -> None:
     assert response.json()
 
 
+@mark.statement_budget(3)
 class TestGetTransactions(RouterEndpointBaseTestClass, http_method='GET', endpoint='/transaction/list'):
     @mark.parametrize('test_year', (
         2022,
@@ -45,6 +88,7 @@ class TestGetTransactions(RouterEndpointBaseTestClass, http_method='GET', endpoi
 
     @mark.parametrize('test_year', (
         param(1999, id='lower'),
+        param(9999, id='greater'),
         param('string'),
         param(None),
     ))
@@ -70,6 +114,171 @@ class TestGetTransactions(RouterEndpointBaseTestClass, http_method='GET', endpoi
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
 
 
+@mark.statement_budget(3)
+@mark.anyio
+async def test_get_transactions_of_last_month_of_max_year(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/transaction/list', params={'year': 9998, 'month': 12})
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == []
+
+@mark.statement_budget(3)
+@mark.anyio
+async def test_get_transactions_by_pages(test_client: AsyncClient) -> None:
+    transaction_ids: list[int] = []
+    query_parameters: dict[str, Any] = {'year': 2022, 'month': 12, 'limit': 2}
+
+    for _ in range(3):
+        response: Response = await test_client.get('/transaction/list', params=query_parameters)
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        transaction_ids.extend(transaction_data['id'] for transaction_data in response.json())
+
+        if 'X-Next-Cursor' not in response.headers:
+            break
+
+        query_parameters['cursor'] = response.headers['X-Next-Cursor']
+
+    assert transaction_ids == [1, 2, 3]
+
+@mark.statement_budget(2)
+@mark.parametrize('test_limit', (
+    param(MIN_PAGE_LIMIT - 1, id='less'),
+    param(MAX_PAGE_LIMIT + 1, id='greater'),
+))
+@mark.anyio
+async def test_get_transactions_with_wrong_limit(test_client: AsyncClient, test_limit: int) -> None:
+    response: Response = await test_client.get('/transaction/list', params={
+        'year': 2022,
+        'month': 12,
+        'limit': test_limit,
+    })
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+@mark.statement_budget(2)
+@mark.parametrize('test_cursor', (
+    param('not-a-cursor', id='not_base64'),
+    param('WzFd', id='wrong_length'),
+    param('WyJub3QtYS1kYXRlIiwgIjEwOjQwOjAwIiwgMV0=', id='wrong_value'),
+    param('WyIyMDIyLTEyLTEyIiwgIjEwOjQwOjAwIiwgdHJ1ZV0=', id='boolean_id'),
+    param('WyIyMDIyLTEyLTEyIiwgIjEwOjQwOjAwIiwgOTIyMzM3MjAzNjg1NDc3NTgwOF0=', id='out_of_range_id'),
+))
+@mark.anyio
+async def test_get_transactions_with_wrong_cursor(test_client: AsyncClient, test_cursor: str) -> None:
+    response: Response = await test_client.get('/transaction/list', params={
+        'year': 2022,
+        'month': 12,
+        'cursor': test_cursor,
+    })
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+@mark.statement_budget(3)
+@mark.anyio
+async def test_get_transactions_matches_response_model(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/transaction/list', params={'year': 2022, 'month': 12})
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    async with TestPostgresSession() as session:
+        transactions: list[Transaction] = await TransactionRepository(session=session).get_page(
+            Transaction.user_id == 1,
+            *get_due_date_period_conditions(get_period_boundaries(year=2022, month=12)),
+            order_keys=TRANSACTION_ORDER_KEYS,
+        )
+
+    assert response.content == JSONResponse(content=jsonable_encoder(parse_obj_as(list[TransactionOutputData], transactions))).body
+
+    response_schema: dict[str, Any] = api.openapi()['paths']['/transaction/list']['get']['responses']['200']
+
+    assert response_schema['content']['application/json']['schema']['items'] == {'$ref': '#/components/schemas/TransactionOutputData'}
+
+@mark.statement_budget(2)
+@mark.anyio
+async def test_export_transactions(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/transaction/export')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [load_from_json(line)['id'] for line in response.text.splitlines()] == [1, 2, 3]
+    assert load_from_json(response.text.splitlines()[0]) == {
+        'id': 1,
+        'account_id': 1,
+        'category_id': 1,
+        'type': TransactionType.INCOME.value,
+        'due_date': '2022-12-12',
+        'due_time': '10:40:00',
+        'amount': 300,
+        'note': 'Note',
+    }
+
+@mark.statement_budget(2)
+@mark.anyio
+async def test_export_transactions_memory_is_bounded(test_client: AsyncClient) -> None:
+    async with TestPostgresSession() as session:
+        await session.execute(text(
+            'INSERT INTO "transaction" (account_id, category_id, user_id, family_id, type, due_date, due_time, amount, note) '
+            "SELECT 1, 1, 1, 1, 'Outcome', DATE '2001-01-01' + series.number % 365, TIME '10:40', series.number, repeat('x', 64) "
+            'FROM generate_series(1, 100000) AS series(number)',
+        ))
+        await session.commit()
+
+    asgi_client: CountingAsgiClient = CountingAsgiClient()
+
+    start_memory_tracing()
+
+    try:
+        await api({
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': '/transaction/export',
+            'raw_path': b'/transaction/export',
+            'root_path': '',
+            'query_string': b'',
+            'headers': [(b'host', b'testserver')],
+            'client': ('testclient', 50000),
+            'server': ('testserver', 80),
+        }, asgi_client.receive, asgi_client.send)
+
+        (_, peak_memory_size) = get_traced_memory()
+    finally:
+        stop_memory_tracing()
+
+        async with TestPostgresSession() as session:
+            await session.execute(text('DELETE FROM "transaction" WHERE due_date < \'2002-01-01\''))
+            await session.execute(text('SELECT setval(pg_get_serial_sequence(\'transaction\', \'id\'), MAX(id)) FROM "transaction"'))
+            await session.commit()
+
+    assert asgi_client.sent_bytes_number > 4 * peak_memory_size, (asgi_client.sent_bytes_number, peak_memory_size)
+
+@mark.anyio
+async def test_get_transactions_uses_due_date_index() -> None:
+    async with TestPostgresSession() as session:
+        await session.execute(text('SET LOCAL enable_seqscan = off'))
+
+        query_plan: str = '\n'.join(await session.scalars(
+            text('EXPLAIN {0}'.format(
+                select(Transaction).where(
+                    Transaction.user_id == 1,
+                    *get_due_date_period_conditions(get_period_boundaries(year=2022, month=12)),
+                ).compile(
+                    compile_kwargs={
+                        'literal_binds': True,
+                    },
+                ),
+            )),
+        ))
+
+    index_conditions: list[str] = [line for line in query_plan.splitlines() if 'Index Cond' in line]
+
+    assert any('due_date' in line for line in index_conditions), query_plan
+
+
+@mark.statement_budget(3)
 class TestGetTransaction(RouterEndpointBaseTestClass, http_method='GET', endpoint='/transaction/item'):
     @mark.parametrize('test_id, expected_data', (
         param(
@@ -145,6 +354,7 @@ class TestGetTransaction(RouterEndpointBaseTestClass, http_method='GET', endpoin
         assert response.status_code == expected_status_code, response.text
 
 
+@mark.statement_budget(8)
 class TestCreateTransaction(RouterEndpointBaseTestClass, http_method='POST', endpoint='/transaction/create'):
     @mark.parametrize('test_data, expected_data', (
         param(
@@ -312,6 +522,7 @@ class TestCreateTransaction(RouterEndpointBaseTestClass, http_method='POST', end
         assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
 
 
+@mark.statement_budget(9)
 class TestUpdateTransaction(RouterEndpointBaseTestClass, http_method='PATCH', endpoint='/transaction/update'):
     @mark.parametrize('test_id, test_data, expected_data', (
         param(
@@ -457,6 +668,7 @@ class TestUpdateTransaction(RouterEndpointBaseTestClass, http_method='PATCH', en
         assert response.status_code == expected_status_code, response.text
 
 
+@mark.statement_budget(6)
 class TestDeleteTransaction(RouterEndpointBaseTestClass, http_method='DELETE', endpoint='/transaction/delete'):
     @mark.parametrize('test_id', (
         1,
@@ -514,3 +726,222 @@ class TestDeleteTransaction(RouterEndpointBaseTestClass, http_method='DELETE', e
         )
 
         assert response.status_code == expected_status_code, response.text
+
+
+@mark.statement_budget(10)
+@mark.anyio
+async def test_import_transactions_from_json(test_client: AsyncClient) -> None:
+    transaction_row: dict[str, Any] = {
+        'account_id': 1,
+        'category_id': 1,
+        'type': TransactionType.INCOME.value,
+        'due_date': '2023-01-05',
+        'due_time': '10:40',
+        'amount': 50,
+    }
+
+    response: Response = await test_client.post('/transaction/import', json=[
+        transaction_row,
+        transaction_row | {'amount': -50},
+        transaction_row | {'account_id': 4},
+        transaction_row | {'category_id': 5},
+        transaction_row | {'account_id': 2, 'category_id': 3, 'type': TransactionType.OUTCOME.value, 'note': 'Note'},
+    ])
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    assert response.json()['imported_count'] == 2
+    assert [import_error['row'] for import_error in response.json()['errors']] == [2, 3, 4]
+
+    response = await test_client.get('/transaction/list', params={'year': 2023, 'month': 1})
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert [transaction['amount'] for transaction in response.json()] == [50, 50]
+
+@mark.statement_budget(8)
+@mark.anyio
+async def test_import_transactions_from_csv(test_client: AsyncClient) -> None:
+    response: Response = await test_client.post(
+        '/transaction/import',
+        content='\n'.join((
+            'account_id,category_id,type,due_date,due_time,amount,note',
+            '1,3,Outcome,2023-02-01,09:00,25.5,Coffee',
+            '1,3,Outcome,2023-02-31,09:00,25.5,Coffee',
+        )),
+        headers={'Content-Type': 'text/csv; charset=utf-8'},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    assert response.json()['imported_count'] == 1
+    assert [import_error['row'] for import_error in response.json()['errors']] == [2]
+
+@mark.statement_budget(1)
+@mark.parametrize('test_content, test_content_type, expected_status_code', (
+    param(
+        '[]',
+        'text/plain',
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        id='unsupported_content_type',
+    ),
+    param(
+        '{"account_id": 1}',
+        'application/json',
+        status.HTTP_400_BAD_REQUEST,
+        id='not_list',
+    ),
+    param(
+        '[{"account_id": 1}',
+        'application/json',
+        status.HTTP_400_BAD_REQUEST,
+        id='malformed_json',
+    ),
+))
+@mark.anyio
+async def test_import_transactions_with_wrong_file(
+    test_client: AsyncClient,
+    test_content: str,
+    test_content_type: str,
+    expected_status_code: int,
+) -> None:
+    response: Response = await test_client.post(
+        '/transaction/import',
+        content=test_content,
+        headers={'Content-Type': test_content_type},
+    )
+
+    assert response.status_code == expected_status_code, response.text
+
+
+@mark.statement_budget(8)
+@mark.anyio
+async def test_create_transaction_commits_once(test_client: AsyncClient) -> None:
+    committed_sessions: list[Session] = []
+    collect_committed_session: Callable[[Session], None] = partial(_collect_committed_session, committed_sessions)
+
+    listen_to_event(Session, 'after_commit', collect_committed_session)
+
+    try:
+        response: Response = await test_client.post('/transaction/create', json={
+            'account_id': 1,
+            'category_id': 3,
+            'type': TransactionType.OUTCOME.value,
+            'due_date': '2023-03-01',
+            'due_time': '12:00',
+            'amount': 10,
+        })
+    finally:
+        remove_event_listener(Session, 'after_commit', collect_committed_session)
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    assert len(committed_sessions) == 1
+
+
+@mark.statement_budget(8)
+@mark.anyio
+async def test_get_transactions_reads_replica_until_user_writes(test_client: AsyncClient) -> None:
+    await drop_database(TEST_POSTGRES_REPLICA_DATABASE)
+    await create_database(TEST_POSTGRES_REPLICA_DATABASE)
+    await create_replica_database_tables()
+
+    api.dependency_overrides[define_postgres_replica_session] = define_test_postgres_lagging_replica_session
+    try:
+        response: Response = await test_client.get('/transaction/list', params={'year': 2022, 'month': 12})
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == []
+
+        response = await test_client.post('/transaction/create', json={
+            'account_id': 1,
+            'category_id': 3,
+            'type': TransactionType.OUTCOME.value,
+            'due_date': '2024-05-01',
+            'due_time': '12:00',
+            'amount': 10,
+        })
+
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        assert RECENT_WRITE_HEADER in response.headers
+
+        recent_write_headers: dict[str, str] = {RECENT_WRITE_HEADER: response.headers[RECENT_WRITE_HEADER]}
+
+        # Nothing but the echoed header is remembered between the requests, as with bearer token clients
+        assert not test_client.cookies
+
+        response = await test_client.get('/transaction/list', params={'year': 2022, 'month': 12})
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == []
+
+        response = await test_client.get('/transaction/list', params={'year': 2022, 'month': 12}, headers=recent_write_headers)
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json()
+
+        # The marker is signed for the writer, so that the rest of the family keeps reading the replica
+        response = await test_client.get('/transaction/list', params={'year': 2022, 'month': 12}, headers={
+            **recent_write_headers,
+            'test-username': 'family-member',
+        })
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == []
+    finally:
+        api.dependency_overrides[define_postgres_replica_session] = define_test_postgres_replica_session
+
+        await drop_database(TEST_POSTGRES_REPLICA_DATABASE)
+
+
+@mark.anyio
+async def test_account_balances_follow_transactions() -> None:
+    async with TestPostgresSession() as session:
+        account_repository: AccountRepository = AccountRepository(session=session)
+
+        assert not await account_repository.get_transactions_balance_drifts()
+
+@mark.anyio
+async def test_daily_rollups_follow_transactions() -> None:
+    async with TestPostgresSession() as session:
+        rollup_repository: DailyTransactionRollupRepository = DailyTransactionRollupRepository(session=session)
+
+        assert not await rollup_repository.get_drifts()
+
+@mark.anyio
+async def test_daily_rollups_are_rebuilt_for_users() -> None:
+    async with TestPostgresSession() as session:
+        rollup_repository: DailyTransactionRollupRepository = DailyTransactionRollupRepository(session=session)
+
+        for user_id in (1, 2):
+            await rollup_repository.change(
+                user_id=user_id,
+                transaction_type=TransactionType.OUTCOME,
+                due_date=date(year=2022, month=12, day=31),
+                amount=100,
+                count=1,
+            )
+
+        await rollup_repository.rebuild(user_ids=[2])
+
+        # Rollups of the rest of users are left as they are, drifts included
+        assert [drift[0] for drift in await rollup_repository.get_drifts()] == [1]
+
+@mark.anyio
+async def test_transaction_owners_follow_accounts() -> None:
+    async with TestPostgresSession() as session:
+        inconsistent_transactions_number: int = await session.scalar(
+            select(
+                func.COUNT(Transaction.id),
+            ).join(
+                Account,
+                Account.id == Transaction.account_id,
+            ).join(
+                User,
+                User.id == Account.user_id,
+            ).where(
+                (Transaction.user_id != Account.user_id) | Transaction.family_id.is_distinct_from(User.family_id),
+            ),
+        )
+
+        assert inconsistent_transactions_number == 0
+
+
+def _collect_committed_session(committed_sessions: list[Session], session: Session) -> None:
+    committed_sessions.append(session)
@@ -1,15 +1,24 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from statistics import mean
 from typing import Any
 
 from fastapi import status
 from httpx import AsyncClient, Response
-from pytest import mark, param
+from pytest import approx, mark, param
 
+from core.calendar import fill_missing_dates_with_default_value, get_current_month_boundaries
+from core.databases.metrics import compiled_cache_statistics
+from core.databases.models import DailyTransactionRollup
 from core.databases.models.utilities.types import TransactionType
+from core.databases.repositories import DailyTransactionRollupRepository
 from tests.base.router_endpoint_base_test_class import (
     RouterEndpointBaseTestClass,
 )
+from tests.mock.databases import TestPostgresSession
 
 
+@mark.statement_budget(2)
 @mark.anyio
 async def test_get_summary(test_client: AsyncClient) -> None:
     response: Response = await test_client.get('/trend/summary')
@@ -17,7 +26,9 @@ async def test_get_summary(test_client: AsyncClient) -> None:
     assert response.status_code == status.HTTP_200_OK, response.text
     assert isinstance(response.json(), list)
     assert len(response.json()) == 3
+    assert {'period': 'All Time', 'incomes': 300, 'outcomes': 200, 'balance': 100} in response.json()
 
+@mark.statement_budget(2)
 @mark.anyio
 async def test_get_monthly_trend(
     test_client: AsyncClient,
@@ -30,6 +41,7 @@ async def test_get_monthly_trend(
     assert len(response.json()) == current_month_days_number
 
 
+@mark.statement_budget(2)
 class TestGetLastNDaysHighlight(RouterEndpointBaseTestClass, http_method='GET', endpoint='/trend/last-n-days'):
     @mark.parametrize('test_n_days', (
         param(4),
@@ -75,3 +87,107 @@ class TestGetLastNDaysHighlight(RouterEndpointBaseTestClass, http_method='GET',
         )
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+
+@mark.statement_budget(8)
+@mark.anyio
+async def test_trends_follow_created_transaction(test_client: AsyncClient) -> None:
+    today_date: date = datetime.today().date()
+
+    response: Response = await test_client.post('/transaction/create', json={
+        'account_id': 1,
+        'category_id': 1,
+        'type': TransactionType.OUTCOME.value,
+        'due_date': today_date.isoformat(),
+        'due_time': '10:40',
+        'amount': 50,
+    })
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+
+    response = await test_client.get('/trend/last-n-days')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()[-1] == {'date': today_date.isoformat(), 'amount': 50}
+
+    response = await test_client.get('/trend/current-month')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()[-1]['current_amount'] == 50
+
+@mark.statement_budget(2)
+@mark.anyio
+async def test_trend_queries_hit_compiled_cache(test_client: AsyncClient) -> None:
+    trend_endpoints: tuple[str, ...] = ('/trend/summary', '/trend/last-n-days', '/trend/current-month')
+
+    for trend_endpoint in trend_endpoints:
+        response: Response = await test_client.get(trend_endpoint)
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+    (previous_hits, previous_misses) = (compiled_cache_statistics.hits, compiled_cache_statistics.misses)
+
+    for trend_endpoint in trend_endpoints:
+        response = await test_client.get(trend_endpoint)
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+    assert compiled_cache_statistics.misses == previous_misses
+    assert compiled_cache_statistics.hits >= previous_hits + len(trend_endpoints)
+
+@mark.statement_budget(8)
+@mark.anyio
+async def test_current_month_trend_matches_daily_statistics(test_client: AsyncClient) -> None:
+    (first_date, last_date) = get_current_month_boundaries()
+    previous_month_first_date: date = (first_date - timedelta(days=1)).replace(day=1)
+    today_date: date = datetime.today().date()
+
+    for (due_date, amount) in ((previous_month_first_date, 30.75), (first_date, 10.25), (today_date, 5.5), (today_date, 1.25)):
+        response: Response = await test_client.post('/transaction/create', json={
+            'account_id': 1,
+            'category_id': 1,
+            'type': TransactionType.OUTCOME.value,
+            'due_date': due_date.isoformat(),
+            'due_time': '10:40',
+            'amount': amount,
+        })
+
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+
+    response = await test_client.get('/trend/current-month')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    async with TestPostgresSession() as session:
+        rollups: list[DailyTransactionRollup] = await DailyTransactionRollupRepository(session=session).get_list(
+            DailyTransactionRollup.user_id == 1,
+            DailyTransactionRollup.type == TransactionType.OUTCOME,
+            DailyTransactionRollup.count != 0,
+        )
+
+    # Running totals of the daily statistics, as they were summed up by the route itself
+    day_amounts: defaultdict[int, list[float]] = defaultdict(list)
+
+    for rollup in rollups:
+        day_amounts[rollup.due_date.day].append(rollup.amount)
+
+    daily_statistics: list[tuple[date, float, float]] = sorted(
+        (rollup.due_date, rollup.amount, mean(day_amounts[rollup.due_date.day]))
+        for rollup in rollups
+        if first_date <= rollup.due_date <= last_date
+    )
+    expected_trend: list[dict[str, Any]] = []
+    (cumulative_current_amount, cumulative_average_amount) = (0.0, 0.0)
+
+    for (current_date, current_amount, average_amount) in fill_missing_dates_with_default_value(daily_statistics, (0.0, 0.0), first_date, last_date):
+        cumulative_current_amount += current_amount
+        cumulative_average_amount += average_amount
+
+        expected_trend.append({
+            'date': current_date.isoformat(),
+            'current_amount': approx(cumulative_current_amount),
+            'average_amount': approx(cumulative_average_amount),
+        })
+
+    assert response.json() == expected_trend
+    assert response.json()[-1]['current_amount'] >= 10.25 + 5.5 + 1.25
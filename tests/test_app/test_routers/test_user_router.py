@@ -1,14 +1,22 @@
 from typing import Any
 
 from fastapi import status
+from fastapi.security import HTTPAuthorizationCredentials
 from httpx import AsyncClient, Response
 from pytest import mark, param
 
+from app.dependencies.user import identify_user, user_identity_cache
+from app.schemas.user import UserIdentityData
+from app.utilities.security.jwt import create_access_token
+from core.databases.models import User
+from core.databases.repositories import UserRepository
 from tests.base.router_endpoint_base_test_class import (
     RouterEndpointBaseTestClass,
 )
+from tests.mock.databases import TestPostgresSession
 
 
+@mark.statement_budget(1)
 @mark.anyio
 async def test_get_current_user(test_client: AsyncClient) -> None:
     response: Response = await test_client.get('/user/current')
@@ -21,6 +29,7 @@ async def test_get_current_user(test_client: AsyncClient) -> None:
     }
 
 
+@mark.statement_budget(2)
 class TestGetRelative(RouterEndpointBaseTestClass, http_method='GET', endpoint='/user/relative'):
     @mark.parametrize('test_data', (
         param(
@@ -106,3 +115,34 @@ class TestGetRelative(RouterEndpointBaseTestClass, http_method='GET', endpoint='
         )
 
         assert response.status_code == expected_status_code, response.text
+
+
+@mark.anyio
+async def test_identify_user_caches_identities() -> None:
+    credentials: HTTPAuthorizationCredentials = HTTPAuthorizationCredentials(
+        scheme='Bearer',
+        credentials=create_access_token(user_id=3),
+    )
+
+    user_identity_cache.clear()
+
+    async with TestPostgresSession() as session:
+        (hits, misses) = (user_identity_cache.hits, user_identity_cache.misses)
+
+        user_identity: UserIdentityData = await identify_user(credentials=credentials, session=session)
+
+        assert await identify_user(credentials=credentials, session=session) is user_identity
+        assert (user_identity_cache.hits - hits, user_identity_cache.misses - misses) == (1, 1)
+
+        user_repository: UserRepository = UserRepository(session=session)
+        user: User | None = await user_repository.get_by_id(3)
+
+        assert user is not None
+
+        await user_repository.update(record=user, record_data={'username': 'renamed-member'})
+        await session.commit()
+
+        assert (await identify_user(credentials=credentials, session=session)).username == 'renamed-member'
+
+        await user_repository.update(record=user, record_data={'username': user_identity.username})
+        await session.commit()